@@ -12,7 +12,7 @@ from app.agents.dispatcher import Dispatcher
 from app.constants import DEBUG_CONFIG, model
 from app.event_agents.memory.factory import create_memory_store
 from app.event_agents.memory.protocols import MemoryStore
-from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.orchestrator.thinker import Thinker, get_thinker
 from app.event_agents.schemas.mongo_schemas import Interviewer
 from app.types.interview_concept_types import (
     QuestionAndAnswer,
@@ -35,7 +35,7 @@ class Agent:
         self, channel: Channel, interviewer: Interviewer
     ) -> None:
         self.agent_id = str(uuid4())
-        self.thinker = Thinker()
+        self.thinker = get_thinker()
         self.interviewer = interviewer
         self.memory = create_memory_store(
             agent_id=self.interviewer.id,
@@ -19,6 +19,41 @@ logger = logging.getLogger(__name__)
 class Dispatcher:
     debug = DEBUG_CONFIG["dispatcher"]
 
+    @staticmethod
+    def package_delta_to_webframe(
+        delta: str,
+        content: str,
+        address: AddressType,
+        frame_id: str,
+        correlation_id: str | None = None,
+    ) -> WebsocketFrame:
+        """
+        Package one streamed piece of a completion as a ``streaming`` frame.
+
+        ``delta`` is the new text and ``content`` everything streamed so
+        far, so a client that missed a frame still renders the full
+        text. The completion frame that ends the stream reuses
+        ``frame_id`` and replaces the streamed content.
+        """
+        completion_frame = CompletionFrameChunk(
+            id=frame_id,
+            object="chat.completion.chunk",
+            model=model,
+            role="assistant",
+            content=content,
+            delta=delta,
+            index=0,
+            finish_reason=None,
+        )
+
+        return WebsocketFrame(
+            frame_id=frame_id,
+            correlation_id=correlation_id or str(uuid4()),
+            type="streaming",
+            address=address,
+            frame=completion_frame,
+        )
+
     @singledispatch  # type: ignore
     def package_and_transform_to_webframe(
         response,
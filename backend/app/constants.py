@@ -1,3 +1,5 @@
+from typing import TypedDict
+
 model = "gpt-4o-mini-2024-07-18"
 
 DEBUG_CONFIG = {
@@ -7,3 +9,65 @@ DEBUG_CONFIG = {
     "agent": True,
     "memory": True,
 }
+
+# seconds a broker handler may spend on one event before it is cancelled
+# and the event dead-lettered
+HANDLER_TIMEOUTS = {
+    "frame": 30,
+    "turn": 180,
+    "background": 600,
+}
+
+# process-wide budgets for upstream llm calls, see LLMGovernor
+LLM_RATE_LIMITS = {
+    "requests_per_minute": 500,
+    "tokens_per_minute": 200_000,
+    "max_concurrency": 32,
+    # assumed completion size when a call sets no max_tokens
+    "default_completion_tokens": 512,
+}
+
+
+class MemoryWriteBehind(TypedDict):
+    flush_interval: float
+    max_batch: int
+
+
+# write-behind buffering of MongoStore frames: a batch is written once
+# it reaches max_batch frames or flush_interval seconds after its first
+MEMORY_WRITE_BEHIND: MemoryWriteBehind = {
+    "flush_interval": 0.5,
+    "max_batch": 32,
+}
+
+# frames of an interview's memory kept in process by FrameStore, older
+# frames are read back from the frames collection on demand
+MEMORY_TAIL_FRAMES = 200
+
+# characters the candidate's partial answer must grow by before the
+# speculative follow-up is generated again from it
+SPECULATION_ANSWER_GROWTH = 200
+
+
+class MemoryJournal(TypedDict):
+    path: str
+    fsync_interval: float
+
+
+# append-only NDJSON journal of InMemoryStore, written behind like
+# MEMORY_WRITE_BEHIND and fsynced at most once per fsync_interval seconds
+MEMORY_JOURNAL: MemoryJournal = {
+    "path": "config/memory.ndjson",
+    "fsync_interval": 1.0,
+}
+
+# token budget of the messages an interview sends per LLM call: the
+# system prompt, a rolling summary of at most summary_tokens of the
+# older turns, and the most recent turns verbatim. Older turns are
+# folded into the summary once summary_chunk_tokens of them are left
+# out of the recent turns
+MEMORY_CONTEXT_WINDOW = {
+    "token_budget": 6000,
+    "summary_tokens": 500,
+    "summary_chunk_tokens": 1000,
+}
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from app.agents.dispatcher import Dispatcher
 from app.event_agents.memory.protocols import MemoryStore
+from app.event_agents.orchestrator.governor import LLMPriority
 from app.event_agents.orchestrator.thinker import Thinker
 from app.event_agents.types import InterviewContext
 from app.types.interview_concept_types import (
@@ -79,9 +80,12 @@ class EvaluatorBase(ABC, Generic[T]):
         memory_store = interview_context.memory_store
         thinker = interview_context.thinker
         debug and print(f"\033[91m{self.__class__.__name__}\033[0m")
-        # Get the correlation id from the last message in the memory store
-        # this is the user input
-        correlation_id = memory_store.memory[-1].correlation_id
+        # Get the correlation id from the latest user input, frames of
+        # other evaluations may have been added after it
+        human_frame = memory_store.latest_frame("human")
+        if human_frame is None:
+            raise ValueError("No human frame in memory")
+        correlation_id = human_frame.correlation_id
         # Create input log context
         input_context = EvaluationLogContext(
             schema=self.evaluation_schema,
@@ -170,7 +174,8 @@ class EvaluatorBase(ABC, Generic[T]):
         """
         Retreive context from memory store.
         """
-        messages = memory_store.extract_memory_for_generation(
+        # evaluations judge the whole interview, not the recent turns
+        messages = await memory_store.extract_transcript_for_generation(
             address_filter=address_filter,
             custom_user_instruction=custom_user_instruction,
         )
@@ -221,7 +226,9 @@ class EvaluatorSimple(EvaluatorBase[str]):
         thinker: "Thinker",
         debug: bool,
     ) -> str:
-        response = await thinker.generate(messages=messages)
+        response = await thinker.generate(
+            messages=messages, priority=LLMPriority.EVALUATION
+        )
         content = response.choices[0].message.content or "No content"
         if debug:
             logger.info(
@@ -246,6 +253,7 @@ class EvaluatorStructured(EvaluatorBase[type[BaseModel]]):
             await thinker.extract_structured_response(
                 messages=messages,
                 pydantic_structure_to_extract=self.evaluation_schema,
+                priority=LLMPriority.EVALUATION,
             )
         )
         if debug:
@@ -38,9 +38,11 @@ class EvaluationManager:
     ) -> None:
         """Handle the evaluation command."""
         evaluations = await self.generate_evaluations(event.questions)
-        evaluations_generated_event = EvaluationsGeneratedEvent(
-            evaluations=evaluations,
-            interview_id=self.interview_context.interview_id,
+        evaluations_generated_event = (
+            EvaluationsGeneratedEvent.internal(
+                evaluations=evaluations,
+                interview_id=self.interview_context.interview_id,
+            )
         )
         await self.interview_context.broker.publish(
             evaluations_generated_event
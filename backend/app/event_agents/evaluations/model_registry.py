@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Hash of a JSON schema, independent of key order."""
+    canonical = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class ModelRegistryStats:
+    hits: int = 0
+    misses: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class EvaluationModelRegistry:
+    """
+    Dynamically built evaluation models, shared by schema.
+
+    Every ``create_model`` call builds a new class, with its own core
+    schema and compiled validator. Models are kept here by the hash of
+    the JSON schema they are built from, so interviews with the same
+    rubric reuse one class instead of each building a duplicate. The
+    least recently used models are dropped past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._models: OrderedDict[str, type[BaseModel]] = OrderedDict()
+        self._stats = ModelRegistryStats()
+
+    def __repr__(self) -> str:
+        return f"EvaluationModelRegistry(models={len(self._models)}, hits={self._stats.hits}, misses={self._stats.misses})"
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get_or_create(
+        self,
+        schema: dict[str, Any],
+        create: Callable[[], type[BaseModel]],
+    ) -> type[BaseModel]:
+        """The model built for ``schema``, ``create`` builds it once."""
+        key = schema_hash(schema)
+        model = self._models.get(key)
+        if model is not None:
+            self._stats.hits += 1
+            self._models.move_to_end(key)
+            return model
+
+        model = create()
+        self._stats.misses += 1
+        self._models[key] = model
+        while len(self._models) > self.maxsize:
+            self._models.popitem(last=False)
+        logger.debug(
+            "Evaluation model created",
+            extra={"context": {"model": model.__name__, "schema": key}},
+        )
+        return model
+
+    def stats(self) -> ModelRegistryStats:
+        return self._stats
+
+    def clear(self) -> None:
+        self._models.clear()
+
+
+_default_registry: EvaluationModelRegistry | None = None
+
+
+def get_evaluation_model_registry() -> EvaluationModelRegistry:
+    """Process-wide registry shared by the decoder and rubric builder."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = EvaluationModelRegistry()
+    return _default_registry
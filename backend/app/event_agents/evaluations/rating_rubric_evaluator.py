@@ -2,7 +2,10 @@ import logging
 
 from pydantic import BaseModel, Field, create_model
 
-from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.evaluations.model_registry import (
+    get_evaluation_model_registry,
+)
+from app.event_agents.orchestrator.thinker import Thinker, get_thinker
 from app.event_agents.schemas.mongo_schemas import Interviewer
 
 logger = logging.getLogger(__name__)
@@ -27,8 +30,10 @@ class CandidateEvaluationRubric(BaseModel):
 
 
 class RatingRubricEvaluationBuilder:
-    def __init__(self, interviewer: Interviewer) -> None:
-        self.thinker = Thinker()
+    def __init__(
+        self, interviewer: Interviewer, thinker: Thinker | None = None
+    ) -> None:
+        self.thinker = thinker or get_thinker()
         self.yaml_path = "config/artifacts_v2.yaml"
         self.interviewer = interviewer
 
@@ -50,6 +55,7 @@ class RatingRubricEvaluationBuilder:
                     {"role": "user", "content": rubric_string},
                 ],
                 pydantic_structure_to_extract=CandidateEvaluationRubric,
+                use_cache=True,
             )
             logger.debug(
                 "Successfully extracted rubric",
@@ -99,16 +105,35 @@ class RatingRubricEvaluationBuilder:
             },
         )
 
+        # the JSON schema the model is built from, identical rubrics
+        # share one model class across interviews
+        schema = {
+            "title": "DynamicEvaluationModel",
+            "type": "object",
+            "properties": {
+                name: {
+                    "type": "string",
+                    "description": field.description,
+                }
+                for name, (_, field) in fields.items()
+            },
+            "required": list(fields),
+        }
         try:
-            evaluation_pydantic_schema = create_model(
-                "DynamicEvaluationModel",
-                **fields,  # type: ignore
+            evaluation_pydantic_schema = (
+                get_evaluation_model_registry().get_or_create(
+                    schema,
+                    lambda: create_model(
+                        "DynamicEvaluationModel",
+                        **fields,  # type: ignore
+                    ),
+                )
             )
             logger.info(
                 "Successfully created evaluation model",
                 extra={"context": {"field_count": len(fields)}},
             )
-            return evaluation_pydantic_schema  # type: ignore
+            return evaluation_pydantic_schema
         except Exception as e:
             logger.error(
                 "Failed to create evaluation model",
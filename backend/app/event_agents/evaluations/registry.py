@@ -13,50 +13,45 @@ from app.event_agents.evaluations.evaluators import (
 from app.event_agents.evaluations.rating_rubric_evaluator import (
     RatingRubricEvaluationBuilder,
 )
-from app.event_agents.memory.config_builder import (
-    ConfigBuilder,
+from app.event_agents.evaluations.store import (
+    EvaluatorStore,
+    get_evaluator_store,
 )
+from app.event_agents.interview.precompute import InterviewerArtifacts
 from app.event_agents.types import InterviewContext
 
 logger = logging.getLogger(__name__)
 
 
 class EvaluatorRegistry:
-    def __init__(self, interview_context: "InterviewContext") -> None:
+    def __init__(
+        self,
+        interview_context: "InterviewContext",
+        store: EvaluatorStore | None = None,
+    ) -> None:
         self.interview_context = interview_context
+        self.store = store or get_evaluator_store()
         self._evaluators: dict[str, EvaluatorBase[Any]] = {}
 
     async def initialize(self) -> None:
-        if self.are_evaluations_gathered_in_memory():
-            evaluations_loaded_successfully = (
-                self.load_evaluations_from_memory()
-            )
+        if self.load_evaluations_from_memory():
+            return
 
-            if evaluations_loaded_successfully:
-                return
-        else:
-            logger.info("Initializing evaluator registry")
-            await self.add_default_async_evaluators()
-            self.add_default_sync_evaluators()
-            logger.info(
-                "Initialized evaluator registry",
-            )
-            self.save_state()
-
-    def are_evaluations_gathered_in_memory(self) -> bool:
-        try:
-            return "evaluators" in ConfigBuilder.load_state(
-                self.interview_context.agent_id
-            )
-        except FileNotFoundError:
-            return False
+        logger.info("Initializing evaluator registry")
+        await self.add_default_async_evaluators()
+        self.add_default_sync_evaluators()
+        logger.info(
+            "Initialized evaluator registry",
+        )
+        await self.save_state()
 
     def load_evaluations_from_memory(self) -> bool:
-        loaded_state = ConfigBuilder.load_state(
-            self.interview_context.agent_id
+        evaluators = self.store.load(
+            self.interview_context.interviewer,
+            self.interview_context.agent_profile,
         )
-        if "evaluators" in loaded_state:
-            self._evaluators = loaded_state["evaluators"]
+        if evaluators is not None:
+            self._evaluators = evaluators
             return True
         else:
             logger.info("No evaluators found in memory")
@@ -79,10 +74,16 @@ class EvaluatorRegistry:
 
     async def add_default_async_evaluators(self) -> None:
         schema_builder = RatingRubricEvaluationBuilder(
-            interviewer=self.interview_context.interviewer
+            interviewer=self.interview_context.interviewer,
+            thinker=self.interview_context.thinker,
         )
+        rubric = await InterviewerArtifacts(
+            self.interview_context.interviewer,
+            self.interview_context.agent_profile,
+            self.interview_context.thinker,
+        ).rubric()
         structured_evaluation_schema = (
-            await schema_builder.get_rating_evaluation_schema()
+            await schema_builder.build_evaluation_pydantic_model(rubric)
         )
         evaluator = EvaluatorStructured(structured_evaluation_schema)
         self._evaluators.update({"Rubric Evaluator": evaluator})
@@ -96,8 +97,9 @@ class EvaluatorRegistry:
     def get_evaluators(self) -> dict[str, EvaluatorBase[Any]]:
         return self._evaluators
 
-    def save_state(self) -> None:
-        ConfigBuilder.save_state(
-            self.interview_context.agent_id,
-            {"evaluators": self._evaluators},
+    async def save_state(self) -> None:
+        await self.store.save(
+            self.interview_context.interviewer,
+            self.interview_context.agent_profile,
+            self._evaluators,
         )
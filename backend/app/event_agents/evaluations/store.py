@@ -0,0 +1,117 @@
+import json
+import logging
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from app.event_agents.evaluations.evaluator_base import EvaluatorBase
+from app.event_agents.memory.json_decoders import AgentConfigJSONDecoder
+from app.event_agents.memory.json_encoders import AgentConfigJSONEncoder
+from app.event_agents.schemas.mongo_schemas import (
+    AgentProfile,
+    Interviewer,
+)
+
+logger = logging.getLogger(__name__)
+
+Evaluators = dict[str, EvaluatorBase[Any]]
+
+
+class EvaluatorStore:
+    """
+    Evaluator definitions of an agent, stored on its ``AgentProfile``.
+
+    The evaluators are built from the interviewer's rating rubric, so
+    the stored definitions are versioned by the rubric's artifact hash
+    and ignored once it changes. Decoded evaluators are kept in process
+    by agent id and version, every interview of the same agent in a
+    worker then shares them without decoding the JSON schemas again.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._decoded: OrderedDict[tuple[UUID, str], Evaluators] = (
+            OrderedDict()
+        )
+
+    def __repr__(self) -> str:
+        return f"EvaluatorStore(decoded={len(self._decoded)})"
+
+    @staticmethod
+    def version(interviewer: Interviewer) -> str:
+        return interviewer.artifact_hashes()["rubric"]
+
+    def load(
+        self, interviewer: Interviewer, agent_profile: AgentProfile
+    ) -> Evaluators | None:
+        """The stored evaluators, if built from the current rubric."""
+        version = self.version(interviewer)
+        if (
+            not agent_profile.evaluators
+            or agent_profile.artifact_hashes.get("evaluators")
+            != version
+        ):
+            return None
+
+        key = (interviewer.id, version)
+        evaluators = self._decoded.get(key)
+        if evaluators is None:
+            evaluators = json.loads(
+                agent_profile.evaluators, cls=AgentConfigJSONDecoder
+            )["evaluators"]
+            self._remember(key, evaluators)
+            logger.info(
+                "Evaluators decoded",
+                extra={
+                    "context": {
+                        "agent_id": str(interviewer.id),
+                        "evaluators": len(evaluators),
+                    }
+                },
+            )
+        else:
+            self._decoded.move_to_end(key)
+        # registries may add to theirs, the cached one stays intact
+        return dict(evaluators)
+
+    async def save(
+        self,
+        interviewer: Interviewer,
+        agent_profile: AgentProfile,
+        evaluators: Evaluators,
+    ) -> None:
+        version = self.version(interviewer)
+        # a partial update, the other precomputed artifacts may be
+        # stored concurrently
+        await agent_profile.set(
+            {
+                "evaluators": json.dumps(
+                    {"evaluators": evaluators},
+                    cls=AgentConfigJSONEncoder,
+                ),
+                "artifact_hashes.evaluators": version,
+            }
+        )
+        self._remember((interviewer.id, version), dict(evaluators))
+
+    def _remember(
+        self, key: tuple[UUID, str], evaluators: Evaluators
+    ) -> None:
+        self._decoded[key] = evaluators
+        self._decoded.move_to_end(key)
+        while len(self._decoded) > self.maxsize:
+            self._decoded.popitem(last=False)
+
+    def clear(self) -> None:
+        self._decoded.clear()
+
+
+_default_store: EvaluatorStore | None = None
+
+
+def get_evaluator_store() -> EvaluatorStore:
+    """Process-wide store shared by every ``EvaluatorRegistry``."""
+    global _default_store
+    if _default_store is None:
+        _default_store = EvaluatorStore()
+    return _default_store
@@ -2,7 +2,7 @@ import logging
 import traceback
 
 from app.event_agents.conversations.turn import Turn
-from app.event_agents.conversations.utils import choose_probe_direction
+from app.event_agents.conversations.types import ProbeDirection
 from app.event_agents.orchestrator.commands import (
     GenerateEvaluationsCommand,
     GeneratePerspectivesCommand,
@@ -30,8 +30,10 @@ class AnswerProcessor:
         try:
             await self._add_answer_to_memory(event)
             await self._issue_appropriate_command()
-            self._add_answer_to_conversation_tree(event)
-            await self.question_manager.ask_next_question()
+            direction = self._add_answer_to_conversation_tree(event)
+            await self.question_manager.ask_next_question(
+                direction=direction, answer=event.frame.frame.content
+            )
         except Exception as e:
             logger.error(
                 f"Error in handle_add_to_memory_event: {str(e)}"
@@ -41,19 +43,18 @@ class AnswerProcessor:
     def _add_answer_to_conversation_tree(
         self,
         event: AddToMemoryEvent,
-    ) -> None:
+    ) -> ProbeDirection:
         conv_turn = Turn(
             question=self.question_manager.current_question,
             answer=event.frame,
             parent=self.interview_context.conversation_tree.current_position,
         )
-        direction = choose_probe_direction(
-            depth_probability=0.5, breadth_probability=0.5
-        )
+        direction = self.question_manager.next_direction
         self.interview_context.conversation_tree.add_turn(
             new_turn=conv_turn,
             direction=direction,
         )
+        return direction
 
     async def _add_answer_to_memory(
         self, event: AddToMemoryEvent
@@ -68,7 +69,7 @@ class AnswerProcessor:
             # check if evaluations are enabled
             if self.interview_context.interview_abilities.evaluations_enabled:
                 generate_evaluations_command = (
-                    GenerateEvaluationsCommand(
+                    GenerateEvaluationsCommand.internal(
                         questions=[
                             self.question_manager.current_question
                         ]
@@ -81,7 +82,7 @@ class AnswerProcessor:
             # check if perspectives are enabled
             if self.interview_context.interview_abilities.perspectives_enabled:
                 generate_perspectives_command = (
-                    GeneratePerspectivesCommand(
+                    GeneratePerspectivesCommand.internal(
                         questions=[
                             self.question_manager.current_question
                         ]
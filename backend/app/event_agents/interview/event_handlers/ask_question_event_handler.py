@@ -15,8 +15,13 @@ class AskQuestionEventHandler:
         self.interview_context = interview_context
 
     async def handler(self, event: AskQuestionEvent) -> None:
-        """Send the question to the user."""
-        frame_id = str(uuid4())
+        """
+        Send the question to the user.
+
+        A question that was streamed keeps its frame id, so the complete
+        frame replaces the streamed text on the client.
+        """
+        frame_id = event.frame_id or str(uuid4())
         question_thought_frame = (
             Dispatcher.package_and_transform_to_webframe(
                 event.question,  # type: ignore
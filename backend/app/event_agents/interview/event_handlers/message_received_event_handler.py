@@ -3,6 +3,7 @@ import logging
 
 from app.event_agents.orchestrator.events import (
     AddToMemoryEvent,
+    AnswerProgressEvent,
     MessageReceivedEvent,
 )
 from app.event_agents.types import InterviewContext
@@ -23,10 +24,20 @@ class MessageEventHandler:
             parsed_message = WebsocketFrame.model_validate_json(
                 message, strict=False
             )
+            if parsed_message.frame.finish_reason is None:
+                # the candidate is still typing their answer
+                await self.interview_context.broker.publish(
+                    AnswerProgressEvent.internal(
+                        partial_answer=parsed_message.frame.content
+                        or "",
+                        interview_id=self.interview_context.interview_id,
+                    )
+                )
+                return
             logger.info(
                 f"Received message, parsed into websocket frame: {parsed_message}"
             )
-            new_memory = AddToMemoryEvent(
+            new_memory = AddToMemoryEvent.internal(
                 frame=parsed_message,
                 interview_id=self.interview_context.interview_id,
             )
@@ -5,7 +5,10 @@ from app.event_agents.orchestrator.events import (
     ErrorEvent,
 )
 from app.event_agents.types import InterviewContext
-from app.types.websocket_types import WebsocketFrame
+from app.types.websocket_types import (
+    WebsocketFrame,
+    WebsocketFrameBatch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +18,21 @@ class WebsocketMessageEventHandler:
         self.interview_context = interview_context
 
     async def handler(self, event: WebsocketFrame) -> None:
+        await self._send(event)
+
+    async def batch_handler(self, event: WebsocketFrameBatch) -> None:
+        await self._send(event)
+
+    async def _send(
+        self, event: WebsocketFrame | WebsocketFrameBatch
+    ) -> None:
         try:
-            await self.interview_context.channel.send_message(
-                event.model_dump_json(by_alias=True)
-            )
+            if isinstance(event, WebsocketFrameBatch):
+                await self.interview_context.channel.send_batch(event)
+            else:
+                await self.interview_context.channel.send_message(
+                    event.model_dump_json(by_alias=True)
+                )
         except Exception as e:
             logger.error(
                 f"Error in handle_websocket_frame: {str(e)}",
@@ -35,7 +49,7 @@ class WebsocketMessageEventHandler:
                     }
                 },
             )
-            error_event = ErrorEvent(
+            error_event = ErrorEvent.internal(
                 error=str(e),
                 interview_id=self.interview_context.interview_id,
             )
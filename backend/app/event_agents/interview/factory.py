@@ -3,10 +3,14 @@ from uuid import UUID
 
 from fastapi import HTTPException, WebSocket
 
+from app.constants import MEMORY_CONTEXT_WINDOW
 from app.event_agents.conversations.tree import Tree
 from app.event_agents.interview.manager import InterviewManager
 from app.event_agents.memory.factory import create_memory_store
+from app.event_agents.memory.summary import RollingSummarizer
 from app.event_agents.orchestrator import Broker, Thinker
+from app.event_agents.orchestrator.journal import get_event_journal
+from app.event_agents.orchestrator.runtime import get_broker_runtime
 from app.event_agents.schemas.mongo_schemas import (
     AgentProfile,
     Interviewer,
@@ -43,7 +47,11 @@ async def create_interview(
             status_code=404, detail="Agent profile not found"
         )
 
-    broker = Broker()
+    broker = Broker(
+        runtime=get_broker_runtime(),
+        session_id=interview_session_id,
+        journal=get_event_journal(),
+    )
 
     max_time_allowed = interview_session.max_time_allowed or 10 * 60
 
@@ -53,11 +61,14 @@ async def create_interview(
         broker=broker,
     )
 
-    thinker = Thinker()
+    thinker = Thinker(session_id=interview_session_id)
     memory_store = create_memory_store(
         agent_id=interview_session.interviewer_id,
         entity=interview_session,
+        token_budget=MEMORY_CONTEXT_WINDOW["token_budget"],
+        summarizer=RollingSummarizer(thinker),
     )
+    await memory_store.load()
 
     conversation_tree = Tree(
         max_depth=4,
@@ -67,6 +78,7 @@ async def create_interview(
     interview_abilities = InterviewAbilities(
         evaluations_enabled=True,
         perspectives_enabled=False,
+        speculative_questions_enabled=False,
     )
 
     interview_context = InterviewContext(
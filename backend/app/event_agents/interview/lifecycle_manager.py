@@ -5,10 +5,18 @@ from typing import Awaitable, Callable
 
 from app.event_agents.evaluations.manager import EvaluationManager
 from app.event_agents.interview.notifications import NotificationManager
+from app.event_agents.interview.pipeline import (
+    Pipeline,
+    Stage,
+    StageTiming,
+)
+from app.event_agents.interview.precompute import InterviewerArtifacts
+from app.event_agents.interview.replay import restore_interview
 from app.event_agents.interview.time_manager import TimeManager
+from app.event_agents.orchestrator.events import AskQuestionEvent
 from app.event_agents.perspectives.manager import PerspectiveManager
 from app.event_agents.questions.manager import QuestionManager
-from app.event_agents.roles.manager import RoleBuilder, RoleContext
+from app.event_agents.roles.types import RoleContext
 from app.event_agents.types import InterviewContext
 from app.types.interview_concept_types import QuestionAndAnswer
 
@@ -37,7 +45,19 @@ class InterviewLifecyceManager:
     async def stop(self) -> None:
         """Stop the interview manager and clean up all resources."""
         try:
-            await self.interview_context.broker.stop()
+            broker = self.interview_context.broker
+            await broker.stop()
+            # after the broker, its handlers may still have added frames
+            await self.interview_context.memory_store.close()
+            if broker.journal is not None:
+                # a resumed interview only replays what compaction keeps
+                await broker.journal.compact(
+                    self.interview_context.interview_id
+                )
+            if self.question_manager.question_asking_strategy:
+                self.question_manager.question_asking_strategy.close()
+            thinker = self.interview_context.thinker
+            thinker.governor.forget(thinker.session_id)
             logger.info("Interview manager stopped and cleaned up")
         except Exception as e:
             logger.error(
@@ -54,21 +74,58 @@ class InterviewLifecyceManager:
         await self.setup_command_subscribers()
         await self.interview_context.broker.start()
 
-        await self.question_manager.initialize()
+        # the question bank, role analysis and rubric extraction do not
+        # depend on each other, so the first question waits for the
+        # slowest of them instead of their sum
+        pipeline = Pipeline(
+            [
+                Stage("timer", self.notify_interview_timer),
+                Stage(
+                    "question_bank", self.question_manager.initialize
+                ),
+                Stage("role_context", self.build_role_context),
+                Stage(
+                    "evaluation_systems",
+                    self.initialize_evaluation_systems,
+                ),
+                Stage(
+                    "first_question",
+                    self.start_questioning,
+                    after=(
+                        "question_bank",
+                        "role_context",
+                        "evaluation_systems",
+                    ),
+                ),
+            ],
+            on_stage_done=self.notify_stage_done,
+        )
+        await pipeline.run()
 
-        timer_notification_string = await self.start_interview_timer()
+        return self.question_manager.questions
 
+    async def notify_stage_done(self, timing: StageTiming) -> None:
         await NotificationManager.send_notification(
             self.interview_context.broker,
-            timer_notification_string,
+            f"{timing.name.replace('_', ' ').capitalize()} ready in {timing.seconds:.1f}s",
         )
 
-        _ = await self.build_role_context()
-
-        await self.initialize_evaluation_systems()
-        await self.begin_questioning()
+    async def notify_interview_timer(self) -> None:
+        timer_notification_string = await self.start_interview_timer()
+        await NotificationManager.send_notification(
+            self.interview_context.broker,
+            timer_notification_string,
+        )
 
-        return self.question_manager.questions
+    async def start_questioning(self) -> None:
+        """Resume a journaled interview, or ask the first question."""
+        replayed = await restore_interview(
+            self.interview_context, self.question_manager
+        )
+        if replayed and replayed.awaiting_answer:
+            await self.resume_questioning()
+        else:
+            await self.begin_questioning()
 
     async def build_role_context(self) -> RoleContext:
         await NotificationManager.send_notification(
@@ -76,13 +133,12 @@ class InterviewLifecyceManager:
             "Building role context",
         )
         logger.info("Building role context")
-        interviewer = self.interview_context.interviewer
-        thinker = self.interview_context.thinker
-
-        role_context = await RoleBuilder(
-            interviewer,
-            thinker,
-        ).build()
+        # stored when the interviewer was saved, built only if stale
+        role_context = await InterviewerArtifacts(
+            self.interview_context.interviewer,
+            self.interview_context.agent_profile,
+            self.interview_context.thinker,
+        ).role()
 
         await NotificationManager.send_notification(
             self.interview_context.broker,
@@ -136,6 +192,20 @@ class InterviewLifecyceManager:
                 "Perspective registry initialized.",
             )
 
+    async def resume_questioning(self) -> None:
+        """Ask the question that was pending when the session stopped."""
+        question = self.question_manager.current_question
+        if question is None:
+            return
+        logger.info("Resuming interview from journal: %s", self)
+        await self.interview_context.broker.publish(
+            AskQuestionEvent.internal(
+                question=question,
+                interview_id=self.interview_context.interview_id,
+                direction=self.question_manager.next_direction,
+            )
+        )
+
     async def begin_questioning(self) -> None:
         """Start the question-asking process."""
         try:
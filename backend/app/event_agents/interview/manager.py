@@ -1,6 +1,7 @@
 import json
 import logging
 
+from app.constants import HANDLER_TIMEOUTS
 from app.event_agents.evaluations.manager import EvaluationManager
 from app.event_agents.evaluations.registry import EvaluatorRegistry
 from app.event_agents.interview.answer_processor import AnswerProcessor
@@ -21,6 +22,7 @@ from app.event_agents.orchestrator.commands import (
 )
 from app.event_agents.orchestrator.events import (
     AddToMemoryEvent,
+    AnswerProgressEvent,
     AskQuestionEvent,
     ErrorEvent,
     EvaluationsGeneratedEvent,
@@ -31,13 +33,17 @@ from app.event_agents.perspectives.manager import PerspectiveManager
 from app.event_agents.perspectives.registry import PerspectiveRegistry
 from app.event_agents.questions.asker import (
     DynamicQuestionAskingStrategy,
+    SpeculativeQuestionAskingStrategy,
 )
 from app.event_agents.questions.generation_strategies.service import (
     ServiceQuestionGenerationStrategy,
 )
 from app.event_agents.questions.manager import QuestionManager
 from app.event_agents.types import InterviewContext
-from app.types.websocket_types import WebsocketFrame
+from app.types.websocket_types import (
+    WebsocketFrame,
+    WebsocketFrameBatch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +72,11 @@ class InterviewManager:
         self.question_manager = QuestionManager(
             interview_context=self.interview_context,
             interviewer=self.interviewer,
-            question_asking_strategy=DynamicQuestionAskingStrategy,
+            question_asking_strategy=(
+                SpeculativeQuestionAskingStrategy
+                if interview_context.interview_abilities.speculative_questions_enabled
+                else DynamicQuestionAskingStrategy
+            ),
             question_generation_strategy=ServiceQuestionGenerationStrategy,
         )
         self.eval_manager = EvaluationManager(
@@ -120,13 +130,22 @@ class InterviewManager:
             MessageEventHandler(
                 interview_context=self.interview_context
             ).handler,
+            timeout=HANDLER_TIMEOUTS["turn"],
         )
 
+        websocket_message_handler = WebsocketMessageEventHandler(
+            interview_context=self.interview_context
+        )
         await self.broker.subscribe(
             WebsocketFrame,
-            WebsocketMessageEventHandler(
-                interview_context=self.interview_context
-            ).handler,
+            websocket_message_handler.handler,
+            timeout=HANDLER_TIMEOUTS["frame"],
+        )
+        await self.broker.subscribe(
+            WebsocketFrameBatch,
+            websocket_message_handler.batch_handler,
+            timeout=HANDLER_TIMEOUTS["frame"],
+            replaces=websocket_message_handler.handler,
         )
 
         await self.broker.subscribe(
@@ -135,6 +154,13 @@ class InterviewManager:
                 interview_context=self.interview_context,
                 question_manager=self.question_manager,
             ).handler,
+            timeout=HANDLER_TIMEOUTS["turn"],
+        )
+
+        await self.broker.subscribe(
+            AnswerProgressEvent,
+            self.handle_answer_progress_event,
+            timeout=HANDLER_TIMEOUTS["frame"],
         )
 
         await self.broker.subscribe(
@@ -142,6 +168,7 @@ class InterviewManager:
             AskQuestionEventHandler(
                 interview_context=self.interview_context
             ).handler,
+            timeout=HANDLER_TIMEOUTS["turn"],
         )
 
         await self.broker.subscribe(
@@ -149,6 +176,7 @@ class InterviewManager:
             EvaluationsGeneratedEventHandler(
                 interview_context=self.interview_context
             ).handler,
+            timeout=HANDLER_TIMEOUTS["background"],
         )
 
         await self.broker.subscribe(
@@ -156,21 +184,30 @@ class InterviewManager:
             PerspectiveGeneratedEventHandler(
                 interview_context=self.interview_context
             ).handler,
+            timeout=HANDLER_TIMEOUTS["background"],
         )
 
     async def setup_command_subscribers(self) -> None:
         await self.broker.subscribe(
             GenerateEvaluationsCommand,
             self.eval_manager.handle_evaluation_command,
+            timeout=HANDLER_TIMEOUTS["background"],
         )
 
         await self.broker.subscribe(
             GeneratePerspectivesCommand,
             self.perspective_manager.handle_perspective_command,
+            timeout=HANDLER_TIMEOUTS["background"],
         )
 
     ######### ######## ######## ######## ######## ######## #######
 
+    async def handle_answer_progress_event(
+        self, event: AnswerProgressEvent
+    ) -> None:
+        """Let the asking strategy prepare for the answer being typed."""
+        self.question_manager.answer_progress(event.partial_answer)
+
     async def handle_error_event(self, event: ErrorEvent) -> None:
         """Handle an error event."""
         logger.info(
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a pipeline.
+
+    Attributes:
+        name: Unique name, used by other stages to depend on this one.
+        run: Coroutine function doing the work, its result is kept.
+        after: Names of the stages that must finish first.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """When a stage started, relative to the pipeline, and how long it ran."""
+
+    name: str
+    started_at: float
+    seconds: float
+
+    @property
+    def finished_at(self) -> float:
+        return self.started_at + self.seconds
+
+
+class Pipeline:
+    """
+    Runs stages concurrently as far as their dependencies allow.
+
+    Every stage starts as soon as the stages it runs ``after`` have
+    finished, so the pipeline takes as long as its slowest dependency
+    chain rather than the sum of its stages. If a stage fails, the
+    stages still running are cancelled and the error is raised.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        on_stage_done: Callable[[StageTiming], Awaitable[None]]
+        | None = None,
+    ) -> None:
+        self.stages = self._in_dependency_order(stages)
+        self.on_stage_done = on_stage_done
+        self.timings: dict[str, StageTiming] = {}
+
+    @staticmethod
+    def _in_dependency_order(stages: Sequence[Stage]) -> list[Stage]:
+        by_name = {stage.name: stage for stage in stages}
+        if len(by_name) != len(stages):
+            raise ValueError("Stage names must be unique")
+        for stage in stages:
+            unknown = set(stage.after) - set(by_name)
+            if unknown:
+                raise ValueError(
+                    f"Stage {stage.name} depends on unknown stages {sorted(unknown)}"
+                )
+
+        ordered: list[Stage] = []
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(stage: Stage) -> None:
+            if stage.name in done:
+                return
+            if stage.name in visiting:
+                raise ValueError(
+                    f"Dependency cycle through stage {stage.name}"
+                )
+            visiting.add(stage.name)
+            for name in stage.after:
+                visit(by_name[name])
+            visiting.discard(stage.name)
+            done.add(stage.name)
+            ordered.append(stage)
+
+        for stage in stages:
+            visit(stage)
+        return ordered
+
+    async def run(self) -> dict[str, Any]:
+        """Run every stage, return their results by name."""
+        started = time.perf_counter()
+        tasks: dict[str, asyncio.Task[Any]] = {}
+
+        async def run_stage(stage: Stage) -> Any:
+            if stage.after:
+                await asyncio.gather(
+                    *(tasks[name] for name in stage.after)
+                )
+            stage_started = time.perf_counter()
+            result = await stage.run()
+            timing = StageTiming(
+                name=stage.name,
+                started_at=stage_started - started,
+                seconds=time.perf_counter() - stage_started,
+            )
+            self.timings[stage.name] = timing
+            logger.info(
+                "Stage finished",
+                extra={
+                    "context": {
+                        "stage": stage.name,
+                        "started_at": round(timing.started_at, 3),
+                        "seconds": round(timing.seconds, 3),
+                    }
+                },
+            )
+            if self.on_stage_done is not None:
+                await self.on_stage_done(timing)
+            return result
+
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(
+                *tasks.values(), return_exceptions=True
+            )
+            raise
+
+        logger.info(
+            "Pipeline finished",
+            extra={
+                "context": {
+                    "seconds": round(time.perf_counter() - started, 3),
+                    "stage_seconds": round(
+                        sum(t.seconds for t in self.timings.values()), 3
+                    ),
+                }
+            },
+        )
+        return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,237 @@
+import asyncio
+import json
+import logging
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from app.event_agents.evaluations.rating_rubric_evaluator import (
+    CandidateEvaluationRubric,
+    RatingRubricEvaluationBuilder,
+)
+from app.event_agents.interview.pipeline import Pipeline, Stage
+from app.event_agents.memory.json_encoders import AgentConfigJSONEncoder
+from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.questions.generation_strategies.service import (
+    ServiceQuestionGenerationStrategy,
+)
+from app.event_agents.questions.types import Questions
+from app.event_agents.roles.manager import RoleBuilder
+from app.event_agents.roles.types import RoleContext
+from app.event_agents.schemas.mongo_schemas import (
+    AgentProfile,
+    Interviewer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InterviewerArtifacts:
+    """
+    What an interview needs that depends only on its interviewer.
+
+    The role system prompt, the structured rating rubric and the
+    question bank are built from the job description and rubric alone,
+    so they are stored on the ``AgentProfile`` together with a hash of
+    those inputs. The accessors return the stored artifact while its
+    hash matches, and otherwise build it and store it for the next
+    interview.
+    """
+
+    def __init__(
+        self,
+        interviewer: Interviewer,
+        agent_profile: AgentProfile,
+        thinker: Thinker | None = None,
+    ) -> None:
+        self.interviewer = interviewer
+        self.agent_profile = agent_profile
+        # building the role sets the thinker's role context, only an
+        # interview's own thinker should get it
+        self.thinker = thinker or Thinker()
+
+    def __repr__(self) -> str:
+        return f"InterviewerArtifacts(interviewer_id={self.interviewer.id}, stale={self.stale()})"
+
+    def stale(self) -> list[str]:
+        """Names of the artifacts built from outdated inputs."""
+        return [
+            name
+            for name in self.interviewer.artifact_hashes()
+            if not self.agent_profile.has_fresh_artifact(
+                name, self.interviewer
+            )
+        ]
+
+    async def refresh(self) -> dict[str, Any]:
+        """Rebuild every stale artifact, concurrently."""
+        builders = {
+            "role": self.role,
+            "rubric": self.rubric,
+            "question_bank": self.question_bank,
+        }
+        return await Pipeline(
+            [Stage(name, builders[name]) for name in self.stale()]
+        ).run()
+
+    async def role(self) -> RoleContext:
+        builder = RoleBuilder(self.interviewer, self.thinker)
+        role_context = builder.load(self.agent_profile)
+        if role_context is not None:
+            return role_context
+
+        role_context = await builder.build()
+        await builder.persist(self.agent_profile)
+        return role_context
+
+    async def rubric(self) -> CandidateEvaluationRubric:
+        if self.agent_profile.has_fresh_artifact(
+            "rubric", self.interviewer
+        ):
+            return CandidateEvaluationRubric.model_validate_json(
+                self.agent_profile.rating_rubric_structured
+            )
+
+        builder = RatingRubricEvaluationBuilder(
+            self.interviewer, self.thinker
+        )
+        rubric = await builder.extract_structured_rating_rubric(
+            builder.get_rating_rubric_string()
+        )
+        await self._store(
+            "rubric",
+            {"rating_rubric_structured": rubric.model_dump_json()},
+        )
+        return rubric
+
+    async def question_bank(self) -> Questions:
+        """The service question bank, as used by ``InterviewManager``."""
+        if self.agent_profile.has_fresh_artifact(
+            "question_bank", self.interviewer
+        ):
+            return Questions.model_validate(
+                {
+                    "questions": json.loads(
+                        self.agent_profile.question_bank_structured
+                    )
+                }
+            )
+
+        question_bank = await ServiceQuestionGenerationStrategy.generate_question_bank(
+            self.interviewer, self.thinker
+        )
+        questions = await self.thinker.extract_structured_response(
+            Questions,
+            messages=[{"role": "user", "content": question_bank}],
+            debug=True,
+            use_cache=True,
+        )
+        await self._store(
+            "question_bank",
+            {
+                "question_bank": question_bank,
+                "question_bank_structured": json.dumps(
+                    questions.questions, cls=AgentConfigJSONEncoder
+                ),
+            },
+        )
+        return questions
+
+    async def _store(self, name: str, values: dict[str, Any]) -> None:
+        # a partial update, a concurrent save of the profile must not
+        # lose the other artifacts
+        await self.agent_profile.set(
+            {
+                **values,
+                f"artifact_hashes.{name}": self.interviewer.artifact_hashes()[
+                    name
+                ],
+            }
+        )
+        logger.info(
+            "Interviewer artifact stored",
+            extra={
+                "context": {
+                    "interviewer_id": str(self.interviewer.id),
+                    "artifact": name,
+                }
+            },
+        )
+
+
+class _Refresh(NamedTuple):
+    # artifact hashes of the inputs the refresh started from
+    hashes: dict[str, str]
+    task: asyncio.Task[None]
+
+
+_running: dict[UUID, _Refresh] = {}
+
+
+def schedule_precompute(
+    interviewer: Interviewer, agent_profile: AgentProfile
+) -> asyncio.Task[None] | None:
+    """
+    Refresh the interviewer's stale artifacts in the background.
+
+    Does nothing when every artifact is fresh. A refresh already running
+    for the interviewer is returned when it started from the same
+    inputs, and cancelled and replaced when they have changed since.
+    Returns the refresh task, if any.
+    """
+    artifacts = InterviewerArtifacts(interviewer, agent_profile)
+    if not artifacts.stale():
+        return None
+    hashes = interviewer.artifact_hashes()
+    running = _running.get(interviewer.id)
+    if running is not None and not running.task.done():
+        if running.hashes == hashes:
+            return running.task
+        # what it builds is already outdated
+        running.task.cancel()
+        logger.info(
+            "Restarting interviewer precompute, its inputs changed",
+            extra={"context": {"interviewer_id": str(interviewer.id)}},
+        )
+    try:
+        task = asyncio.get_running_loop().create_task(
+            _precompute(artifacts)
+        )
+    except RuntimeError:
+        # saved outside an event loop, eg by a script, connect time
+        # builds the artifacts instead
+        return None
+    _running[interviewer.id] = _Refresh(hashes, task)
+    task.add_done_callback(lambda _: _release(interviewer.id, task))
+    return task
+
+
+def _release(interviewer_id: UUID, task: asyncio.Task[None]) -> None:
+    running = _running.get(interviewer_id)
+    if running is not None and running.task is task:
+        del _running[interviewer_id]
+
+
+async def _precompute(artifacts: InterviewerArtifacts) -> None:
+    try:
+        stale = artifacts.stale()
+        await artifacts.refresh()
+        logger.info(
+            "Interviewer artifacts precomputed",
+            extra={
+                "context": {
+                    "interviewer_id": str(artifacts.interviewer.id),
+                    "artifacts": stale,
+                }
+            },
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to precompute interviewer artifacts",
+            extra={
+                "context": {
+                    "interviewer_id": str(artifacts.interviewer.id),
+                    "error": str(e),
+                }
+            },
+            exc_info=True,
+        )
@@ -0,0 +1,161 @@
+import logging
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.conversations.tree import Tree
+from app.event_agents.conversations.turn import Turn
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    AskQuestionEvent,
+    EvaluationsGeneratedEvent,
+    PerspectivesGeneratedEvent,
+)
+from app.event_agents.orchestrator.journal import EventJournal
+from app.event_agents.questions.manager import QuestionManager
+from app.event_agents.types import InterviewContext
+from app.types.interview_concept_types import QuestionAndAnswer
+from app.types.websocket_types import WebsocketFrame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayedInterview:
+    """Interview state rebuilt from a session's event journal."""
+
+    interview_id: UUID
+    memory: list[WebsocketFrame] = field(default_factory=list)
+    asked_questions: list[QuestionAndAnswer] = field(
+        default_factory=list
+    )
+    current_question: QuestionAndAnswer | None = None
+    current_direction: ProbeDirection | None = None
+    turns: list[
+        tuple[
+            QuestionAndAnswer | None,
+            WebsocketFrame,
+            ProbeDirection | None,
+        ]
+    ] = field(default_factory=list)
+    evaluations: list[WebsocketFrame] = field(default_factory=list)
+    perspectives: list[WebsocketFrame] = field(default_factory=list)
+    events: int = 0
+    awaiting_answer: bool = False
+
+    def __bool__(self) -> bool:
+        return self.events > 0
+
+    def restore_tree(self, tree: Tree) -> None:
+        """Grow ``tree`` with the answered turns, as AnswerProcessor did."""
+        for question, answer, direction in self.turns:
+            if question is None:
+                continue
+            tree.add_turn(
+                new_turn=Turn(
+                    question=question,
+                    answer=answer,
+                    parent=tree.current_position,
+                ),
+                # journals written before directions were recorded
+                direction=direction or ProbeDirection.DEEPER,
+            )
+
+    def apply(self, event: object) -> None:
+        """Fold one journaled event into the state, as its handler did."""
+        self.events += 1
+        if isinstance(event, AddToMemoryEvent):
+            # AnswerProcessor stores the answer against the question
+            # being asked at the time
+            self.memory.append(event.frame)
+            self.turns.append(
+                (
+                    self.current_question,
+                    event.frame,
+                    self.current_direction,
+                )
+            )
+            self.awaiting_answer = False
+        elif isinstance(event, AskQuestionEvent):
+            if (
+                self.awaiting_answer
+                and event.question == self.current_question
+            ):
+                # re-asked after a resume, already in memory
+                return
+            # QuestionManager adds the question to memory right before
+            # publishing it, the frame id is derived so replays agree
+            self.memory.append(
+                Dispatcher.package_and_transform_to_webframe(
+                    event.question.question,  # type: ignore
+                    "content",
+                    frame_id=event.frame_id or str(event.event_id),
+                    correlation_id=str(event.correlation_id),
+                )
+            )
+            self.asked_questions.append(event.question)
+            self.current_question = event.question
+            self.current_direction = event.direction
+            self.awaiting_answer = True
+        elif isinstance(event, EvaluationsGeneratedEvent):
+            self.evaluations.extend(event.evaluations)
+        elif isinstance(event, PerspectivesGeneratedEvent):
+            self.perspectives.extend(event.perspectives)
+
+
+async def replay_interview(
+    journal: EventJournal, interview_id: UUID
+) -> ReplayedInterview:
+    """Rebuild an interview's state from its journal, no LLM calls."""
+    replayed = ReplayedInterview(interview_id=interview_id)
+    async for record in journal.read(interview_id):
+        replayed.apply(record.event)
+    logger.info(
+        "Interview replayed from journal",
+        extra={
+            "context": {
+                "interview_id": str(interview_id),
+                "events": replayed.events,
+                "memory_frames": len(replayed.memory),
+                "questions_asked": len(replayed.asked_questions),
+            }
+        },
+    )
+    return replayed
+
+
+async def restore_interview(
+    interview_context: InterviewContext,
+    question_manager: QuestionManager,
+) -> ReplayedInterview | None:
+    """
+    Restore memory, the conversation tree and question progress from
+    the broker's journal.
+
+    Returns the replayed state, or None when the broker has no journal or
+    the session has no journaled events.
+    """
+    journal = interview_context.broker.journal
+    if journal is None:
+        return None
+
+    replayed = await replay_interview(
+        journal, interview_context.interview_id
+    )
+    if not replayed:
+        return None
+
+    interview_context.memory_store.memory = list(replayed.memory)
+    replayed.restore_tree(interview_context.conversation_tree)
+    question_manager.current_question = replayed.current_question
+    if replayed.current_direction is not None:
+        question_manager.next_direction = replayed.current_direction
+    asked = {question.question for question in replayed.asked_questions}
+    # the asking strategy shares this list, update it in place
+    question_manager.questions[:] = [
+        question
+        for question in question_manager.questions
+        if question.question not in asked
+    ]
+    return replayed
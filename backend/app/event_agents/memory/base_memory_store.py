@@ -1,9 +1,13 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from app.event_agents.memory.protocols import ConfigProvider
+from app.constants import MEMORY_CONTEXT_WINDOW
+from app.event_agents.memory.protocols import ConfigProvider, Summarizer
 from app.event_agents.memory.stores.types import EntityType
 from app.types.websocket_types import (
     AddressType,
@@ -14,8 +18,53 @@ from app.types.websocket_types import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _MessageView:
+    """Generation messages of the frames passing one address filter."""
+
+    # the memory list the view reads, replacing it invalidates the view
+    frames: List[WebsocketFrame]
+    # frames read so far and the last of them, counted from the first
+    # frame ever added so dropping old frames keeps them valid
+    consumed: int = 0
+    last: Optional[WebsocketFrame] = None
+    messages: List[Dict[str, str]] = field(default_factory=list)
+    positions: List[int] = field(default_factory=list)
+    # estimated prompt tokens of each message
+    tokens: List[int] = field(default_factory=list)
+    # rolling summary of the frames before position ``summarized``
+    summary: str = ""
+    summarized: int = 0
+    summarizing: Optional[asyncio.Task[None]] = None
+
+
+def _message_tokens(message: Dict[str, str]) -> int:
+    # about four characters per token, as the LLM governor estimates
+    return len(message.get("content") or "") // 4
+
+
 class BaseMemoryStore(ABC):
-    """Base class for memory stores."""
+    """
+    Base class for memory stores.
+
+    ``extract_memory_for_generation`` keeps one message view per address
+    filter. A view only converts the frames added since it was last
+    read, so the per-call cost no longer grows with the transcript.
+    Appending to ``memory`` keeps the views valid. Assigning a new list
+    resets them, and stores dropping old frames use ``_drop_oldest``.
+
+    Frames added through ``_append`` are also indexed by completion
+    frame id, by correlation id and by address, so ``find_parent_frame``,
+    ``frames_for_correlation`` and ``latest_frame`` are lookups instead
+    of scans of the transcript.
+
+    With a ``token_budget`` the messages are windowed: the system
+    prompt, a rolling summary of the older turns and the most recent
+    turns verbatim. The summary is folded by ``summarizer`` in the
+    background, a chunk of older turns at a time, and cached on the
+    view. Turns it does not cover yet are sent verbatim meanwhile.
+    Without a summarizer the older turns are left out.
+    """
 
     def __init__(
         self,
@@ -28,7 +77,61 @@ class BaseMemoryStore(ABC):
         self.debug = debug
         self.agent_id = agent_id
         self.entity = entity
-        self.memory: List[WebsocketFrame] = []
+        self._memory: List[WebsocketFrame] = []
+        # frames dropped from the front of memory so far
+        self._dropped = 0
+        self._views: Dict[frozenset[AddressType], _MessageView] = {}
+        self._system_prompt: Optional[List[Dict[str, str]]] = None
+        self._by_frame_id: Dict[str, WebsocketFrame] = {}
+        self._by_correlation_id: Dict[str, List[WebsocketFrame]] = {}
+        self._latest_by_address: Dict[AddressType, WebsocketFrame] = {}
+        self.token_budget: Optional[int] = None
+        self.summarizer: Optional[Summarizer] = None
+        # summaries folding in the background, views may be dropped
+        # before theirs finishes
+        self._summaries: set[asyncio.Task[None]] = set()
+
+    @property
+    def memory(self) -> List[WebsocketFrame]:
+        return self._memory
+
+    @memory.setter
+    def memory(self, frames: List[WebsocketFrame]) -> None:
+        self._memory = frames
+        self._dropped = 0
+        self._views.clear()
+        self._by_frame_id.clear()
+        self._by_correlation_id.clear()
+        self._latest_by_address.clear()
+        for frame in frames:
+            self._index(frame)
+
+    def _append(self, frame: WebsocketFrame) -> None:
+        """Append a frame to memory and index it."""
+        self._memory.append(frame)
+        self._index(frame)
+
+    def _index(self, frame: WebsocketFrame) -> None:
+        self._by_frame_id[frame.frame.id] = frame
+        self._by_correlation_id.setdefault(
+            frame.correlation_id, []
+        ).append(frame)
+        self._latest_by_address[frame.address] = frame
+
+    def _drop_oldest(self, count: int) -> None:
+        """Drop the ``count`` oldest frames from memory."""
+        for frame in self._memory[:count]:
+            if self._by_frame_id.get(frame.frame.id) is frame:
+                del self._by_frame_id[frame.frame.id]
+            frames = self._by_correlation_id.get(frame.correlation_id)
+            if frames and frames[0] is frame:
+                frames.pop(0)
+                if not frames:
+                    del self._by_correlation_id[frame.correlation_id]
+            if self._latest_by_address.get(frame.address) is frame:
+                del self._latest_by_address[frame.address]
+        del self._memory[:count]
+        self._dropped += count
 
     def __repr__(self) -> str:
         base_repr = {
@@ -58,26 +161,34 @@ class BaseMemoryStore(ABC):
     def get(self) -> List[WebsocketFrame]:
         raise NotImplementedError
 
+    async def load(self) -> None:
+        """Read the persisted frames, if the store loads them lazily."""
+
+    async def flush(self) -> None:
+        """Persist frames that ``add`` buffered, if the store buffers."""
+
+    async def close(self) -> None:
+        """Cancel background summaries and persist what is buffered."""
+        summaries = list(self._summaries)
+        for task in summaries:
+            task.cancel()
+        await asyncio.gather(*summaries, return_exceptions=True)
+        await self.flush()
+
     def find_parent_frame(
         self,
         completion_frame: CompletionFrameChunk,
         debug: bool = False,
     ) -> Optional[WebsocketFrame]:
         """Find parent frame for a completion chunk."""
-        try:
-            parent_frame = next(
-                (
-                    frame
-                    for frame in reversed(self.memory)
-                    if frame.frame.id == completion_frame.id
-                )
-            )
+        parent_frame = self._by_frame_id.get(completion_frame.id)
+        if parent_frame is not None:
             if self.debug and debug:
                 logger.debug(
                     f"Found parent frame: {parent_frame.model_dump_json(indent=4)}"
                 )
             return parent_frame
-        except StopIteration:
+        else:
             if self.debug and debug:
                 logger.debug(
                     f"No parent frame found for completion frame: {completion_frame.id}"
@@ -96,12 +207,34 @@ class BaseMemoryStore(ABC):
                 )
             return None
 
+    def frames_for_correlation(
+        self, correlation_id: str
+    ) -> List[WebsocketFrame]:
+        """Frames sharing ``correlation_id``, oldest first."""
+        return list(self._by_correlation_id.get(correlation_id, ()))
+
+    def latest_frame(
+        self, address: AddressType
+    ) -> Optional[WebsocketFrame]:
+        """The most recently added frame sent to ``address``."""
+        return self._latest_by_address.get(address)
+
     def extract_memory_for_generation(
         self,
         custom_user_instruction: Optional[str] = None,
         address_filter: List[AddressType] = [],
+        token_budget: Optional[int] = None,
+        window: bool = True,
     ) -> List[Dict[str, str]]:
-        """Extract memory in format needed for generation."""
+        """
+        Extract memory in format needed for generation.
+
+        ``token_budget`` overrides the store's, None uses the store's.
+        ``window=False`` returns every frame kept in process whatever
+        the budget. Stores that trim their memory keep only the recent
+        frames, ``extract_transcript_for_generation`` also reads back
+        the older ones.
+        """
         logger.debug(
             "Extracting memory for generation",
             extra={
@@ -112,23 +245,220 @@ class BaseMemoryStore(ABC):
                 }
             },
         )
-        system = self.config_provider.get_system_prompt()
+        if self._system_prompt is None:
+            self._system_prompt = (
+                self.config_provider.get_system_prompt()
+            )
 
-        memory_content = [
-            {
-                "role": message.frame.role,
-                "content": message.frame.content or "",
-            }
-            for message in self.memory
-            if not address_filter or message.address in address_filter
-        ]
+        view = self._view(frozenset(address_filter))
+        if token_budget is None:
+            token_budget = self.token_budget
+        if not window or token_budget is None:
+            memory_content = view.messages
+        else:
+            memory_content = self._window(
+                view, token_budget, address_filter
+            )
 
         if custom_user_instruction:
-            memory_content.append(
+            return [
+                *self._system_prompt,
+                *memory_content,
                 {
                     "role": "user",
                     "content": custom_user_instruction,
+                },
+            ]
+        return [*self._system_prompt, *memory_content]
+
+    async def extract_transcript_for_generation(
+        self,
+        custom_user_instruction: Optional[str] = None,
+        address_filter: List[AddressType] = [],
+    ) -> List[Dict[str, str]]:
+        """
+        The whole transcript in the format needed for generation.
+
+        Like ``extract_memory_for_generation`` with ``window=False``,
+        plus the frames the store no longer keeps in process.
+        """
+        dropped = await self.load_dropped()
+        messages = self.extract_memory_for_generation(
+            custom_user_instruction, address_filter, window=False
+        )
+        if not dropped:
+            return messages
+
+        assert self._system_prompt is not None
+        addresses = set(address_filter)
+        earlier = [
+            {
+                "role": frame.frame.role,
+                "content": frame.frame.content or "",
+            }
+            for frame in dropped
+            if not addresses or frame.address in addresses
+        ]
+        system = len(self._system_prompt)
+        return [*messages[:system], *earlier, *messages[system:]]
+
+    async def load_dropped(self) -> List[WebsocketFrame]:
+        """Frames older than those kept in process, oldest first."""
+        return []
+
+    def _view(self, addresses: frozenset[AddressType]) -> _MessageView:
+        view = self._views.get(addresses)
+        if view is None or not self._is_current(view):
+            view = _MessageView(
+                frames=self._memory, consumed=self._dropped
+            )
+            self._views[addresses] = view
+
+        # forget the messages of frames dropped since the last read
+        stale = bisect_left(view.positions, self._dropped)
+        if stale:
+            del view.messages[:stale]
+            del view.positions[:stale]
+            del view.tokens[:stale]
+
+        # frames dropped before the view read them are skipped
+        start = max(view.consumed - self._dropped, 0)
+        for offset, message in enumerate(self._memory[start:]):
+            if not addresses or message.address in addresses:
+                view.messages.append(
+                    {
+                        "role": message.frame.role,
+                        "content": message.frame.content or "",
+                    }
+                )
+                view.positions.append(self._dropped + start + offset)
+                view.tokens.append(_message_tokens(view.messages[-1]))
+        if len(self._memory) > start:
+            view.consumed = self._dropped + len(self._memory)
+            view.last = self._memory[-1]
+        return view
+
+    def _window(
+        self,
+        view: _MessageView,
+        token_budget: int,
+        address_filter: List[AddressType],
+    ) -> List[Dict[str, str]]:
+        """The view's messages that fit in ``token_budget``."""
+        assert self._system_prompt is not None
+        system_tokens = sum(map(_message_tokens, self._system_prompt))
+        full_tokens = system_tokens + sum(view.tokens)
+        if full_tokens <= token_budget:
+            messages = view.messages
+        else:
+            # the most recent turns that fit next to the summary, the
+            # latest one even if it does not
+            recent_budget = (
+                token_budget
+                - system_tokens
+                - MEMORY_CONTEXT_WINDOW["summary_tokens"]
+            )
+            split, recent_tokens = len(view.messages), 0
+            while (
+                split
+                and recent_tokens + view.tokens[split - 1]
+                <= recent_budget
+            ):
+                split -= 1
+                recent_tokens += view.tokens[split]
+            if split and split == len(view.messages):
+                split -= 1
+
+            if self.summarizer is None:
+                messages = view.messages[split:]
+            else:
+                # turns the summary does not cover yet stay verbatim
+                start = bisect_left(view.positions, view.summarized)
+                if (
+                    view.summarizing is None
+                    and sum(view.tokens[start:split])
+                    >= MEMORY_CONTEXT_WINDOW["summary_chunk_tokens"]
+                ):
+                    self._summarize(view, start, split)
+                messages = view.messages[start:]
+                if view.summary:
+                    messages = [
+                        {
+                            "role": "system",
+                            "content": "Summary of the earlier "
+                            f"conversation:\n{view.summary}",
+                        },
+                        *messages,
+                    ]
+
+        logger.info(
+            "Memory windowed for generation",
+            extra={
+                "context": {
+                    "address_filter": address_filter,
+                    "token_budget": token_budget,
+                    "tokens_before": full_tokens,
+                    "tokens_after": system_tokens
+                    + sum(map(_message_tokens, messages)),
+                    "messages_before": len(view.messages),
+                    "messages_after": len(messages),
                 }
+            },
+        )
+        return messages
+
+    def _summarize(
+        self, view: _MessageView, start: int, stop: int
+    ) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to summarize in, the turns stay verbatim
+            return
+        view.summarizing = loop.create_task(
+            self._fold(
+                view,
+                view.messages[start:stop],
+                view.positions[stop - 1] + 1,
+            )
+        )
+        self._summaries.add(view.summarizing)
+        view.summarizing.add_done_callback(self._summaries.discard)
+
+    async def _fold(
+        self,
+        view: _MessageView,
+        messages: List[Dict[str, str]],
+        summarized: int,
+    ) -> None:
+        assert self.summarizer is not None
+        try:
+            view.summary = await self.summarizer(view.summary, messages)
+            view.summarized = summarized
+            logger.info(
+                "Memory summary updated",
+                extra={
+                    "context": {
+                        "summarized_messages": len(messages),
+                        "summarized_frames": summarized,
+                    }
+                },
+            )
+        except Exception as e:
+            # the turns stay verbatim and are retried on a later call
+            logger.error(
+                "Failed to summarize memory",
+                extra={"context": {"error": str(e)}},
+                exc_info=True,
             )
+        finally:
+            view.summarizing = None
 
-        return system + memory_content
+    def _is_current(self, view: _MessageView) -> bool:
+        if view.frames is not self._memory:
+            return False
+        read = view.consumed - self._dropped
+        if read > len(self._memory):
+            return False
+        # the list was edited in place rather than appended to
+        return read <= 0 or self._memory[read - 1] is view.last
@@ -1,8 +1,9 @@
 from uuid import UUID
 
-from app.event_agents.memory.protocols import MemoryStore
-from app.event_agents.memory.stores import MongoStore
-from app.event_agents.memory.stores.mongo import EntityType
+from app.event_agents.memory.protocols import MemoryStore, Summarizer
+from app.event_agents.memory.stores import FrameStore, MongoStore
+from app.event_agents.memory.stores.types import EntityType
+from app.event_agents.schemas.mongo_schemas import InterviewSession
 
 from .providers import YAMLConfigProvider
 
@@ -12,11 +13,31 @@ def create_memory_store(
     entity: EntityType,
     config_path: str | None = None,
     debug: bool = False,
+    token_budget: int | None = None,
+    summarizer: Summarizer | None = None,
 ) -> MemoryStore:
-    """Create a new memory store instance with all required dependencies."""
-    return MongoStore(
-        agent_id=agent_id,
-        config_provider=YAMLConfigProvider(config_path),
-        entity=entity,
-        debug=debug,
-    )
+    """
+    Create a new memory store instance with all required dependencies.
+
+    ``token_budget`` and ``summarizer`` window the messages extracted
+    for generation, see ``BaseMemoryStore``.
+    """
+    store: FrameStore | MongoStore
+    if isinstance(entity, InterviewSession):
+        # interview transcripts grow, keep them out of the session
+        store = FrameStore(
+            agent_id=agent_id,
+            config_provider=YAMLConfigProvider(config_path),
+            entity=entity,
+            debug=debug,
+        )
+    else:
+        store = MongoStore(
+            agent_id=agent_id,
+            config_provider=YAMLConfigProvider(config_path),
+            entity=entity,
+            debug=debug,
+        )
+    store.token_budget = token_budget
+    store.summarizer = summarizer
+    return store
@@ -1,14 +1,18 @@
 import json
 import logging
+from functools import partial
 from pprint import PrettyPrinter
-from typing import Any, Type
+from typing import Any, Type, cast
 
-from pydantic import Field, create_model
+from pydantic import BaseModel, Field, create_model
 
 from app.event_agents.evaluations.evaluator_base import (
     EvaluatorSimple,
     EvaluatorStructured,
 )
+from app.event_agents.evaluations.model_registry import (
+    get_evaluation_model_registry,
+)
 from app.types.interview_concept_types import QuestionAndAnswer
 
 logger = logging.getLogger(__name__)
@@ -90,30 +94,14 @@ class AgentConfigJSONDecoder(json.JSONDecoder):
 
         for evaluator_name, evaluator_schema in dct.items():
             if isinstance(evaluator_schema, dict):
-                # Handle structured evaluator
-                fields = {}
-                required_fields = evaluator_schema.get("required", [])
-
-                for field_name, field_schema in evaluator_schema[
-                    "properties"
-                ].items():
-                    field_type, field = self._get_field_type(
-                        field_schema
+                # Handle structured evaluator, identical schemas share
+                # one model class across interviews
+                DynamicModel = (
+                    get_evaluation_model_registry().get_or_create(
+                        evaluator_schema,
+                        partial(self._build_model, evaluator_schema),
                     )
-
-                    # Update field to mark as required if in required list
-                    if field_name in required_fields:
-                        field.default = ...
-
-                    fields[field_name] = (field_type, field)
-
-                model_name = evaluator_schema.get(
-                    "title", "DynamicModel"
                 )
-                DynamicModel = create_model(
-                    model_name,
-                    **fields,
-                )  # type: ignore
 
                 evaluators[evaluator_name] = EvaluatorStructured(
                     DynamicModel
@@ -127,3 +115,26 @@ class AgentConfigJSONDecoder(json.JSONDecoder):
 
         logger.info(f"Built {len(evaluators)} evaluators")
         return evaluators
+
+    def _build_model(
+        self, evaluator_schema: dict[str, Any]
+    ) -> type[BaseModel]:
+        fields = {}
+        required_fields = evaluator_schema.get("required", [])
+
+        for field_name, field_schema in evaluator_schema[
+            "properties"
+        ].items():
+            field_type, field = self._get_field_type(field_schema)
+
+            # Update field to mark as required if in required list
+            if field_name in required_fields:
+                field.default = ...
+
+            fields[field_name] = (field_type, field)
+
+        model_name = evaluator_schema.get("title", "DynamicModel")
+        return cast(
+            type[BaseModel],
+            create_model(model_name, **fields),  # type: ignore[call-overload]
+        )
@@ -29,6 +29,14 @@ class MessagePublisher(Protocol):
     def publish(self, topic: str, frame: WebsocketFrame) -> None: ...
 
 
+class Summarizer(Protocol):
+    """Protocol for folding older messages into a running summary."""
+
+    async def __call__(
+        self, summary: str, messages: List[Dict[str, str]]
+    ) -> str: ...
+
+
 @runtime_checkable
 class MemoryStore(Protocol):
     """Base protocol for storing and retrieving WebsocketFrames."""
@@ -40,17 +48,36 @@ class MemoryStore(Protocol):
     # Optional identifiers that implementations may use
     agent_id: Optional[UUID] = None
     entity: Optional[Any] = None
+    # context windowing of extract_memory_for_generation, off when None
+    token_budget: Optional[int] = None
+    summarizer: Optional[Summarizer] = None
 
     async def add(self, frame: WebsocketFrame) -> None: ...
     async def clear(self) -> None: ...
+    async def load(self) -> None: ...
+    async def flush(self) -> None: ...
+    async def close(self) -> None: ...
     def get(self) -> List[WebsocketFrame]: ...
     def find_parent_frame(
         self,
         completion_frame: CompletionFrameChunk,
         debug: bool = False,
     ) -> Optional[WebsocketFrame]: ...
+    def frames_for_correlation(
+        self, correlation_id: str
+    ) -> List[WebsocketFrame]: ...
+    def latest_frame(
+        self, address: AddressType
+    ) -> Optional[WebsocketFrame]: ...
     def extract_memory_for_generation(
         self,
         custom_user_instruction: Optional[str] = None,
         address_filter: List[AddressType] = [],
+        token_budget: Optional[int] = None,
+        window: bool = True,
+    ) -> List[Dict[str, str]]: ...
+    async def extract_transcript_for_generation(
+        self,
+        custom_user_instruction: Optional[str] = None,
+        address_filter: List[AddressType] = [],
     ) -> List[Dict[str, str]]: ...
@@ -1,4 +1,5 @@
+from .frames import FrameStore
 from .in_memory import InMemoryStore
 from .mongo import MongoStore
 
-__all__ = ["InMemoryStore", "MongoStore"]
+__all__ = ["FrameStore", "InMemoryStore", "MongoStore"]
@@ -0,0 +1,204 @@
+import logging
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from beanie.odm.queries.find import FindOne
+from pydantic import BaseModel, Field
+from pymongo.errors import BulkWriteError
+
+from app.constants import MEMORY_TAIL_FRAMES, MEMORY_WRITE_BEHIND
+from app.event_agents.schemas.mongo_schemas import (
+    InterviewSession,
+    MemoryFrame,
+)
+from app.types.websocket_types import (
+    WebsocketFrame,
+)
+
+from ..protocols import ConfigProvider
+from .write_behind import WriteBehindStore
+
+logger = logging.getLogger(__name__)
+
+
+class _LegacyMemory(BaseModel):
+    """The memory array sessions embedded before FrameStore."""
+
+    memory: list[WebsocketFrame] = Field(default_factory=list)
+
+
+class FrameStore(WriteBehindStore):
+    """
+    Memory store keeping an interview's frames in their own collection.
+
+    Every frame is a ``MemoryFrame`` document numbered by ``seq`` within
+    the session, so appending never rewrites the session document and
+    the session stays small however long the interview runs. Only the
+    last ``tail_size`` frames are kept in process. ``load`` fetches that
+    tail when an interview starts and ``load_range`` reads older frames
+    back on demand, ``extract_transcript_for_generation`` reads the
+    whole transcript for callers that judge every turn. A session still
+    holding its frames in the legacy embedded ``memory`` array has them
+    moved to the collection the first time it is loaded.
+
+    Implements:
+        MemoryStore (Protocol): Interface for memory storage operations
+    """
+
+    def __init__(
+        self,
+        agent_id: UUID,
+        config_provider: ConfigProvider,
+        entity: InterviewSession,
+        debug: bool = False,
+        tail_size: int = MEMORY_TAIL_FRAMES,
+        flush_interval: float = MEMORY_WRITE_BEHIND["flush_interval"],
+        max_batch: int = MEMORY_WRITE_BEHIND["max_batch"],
+    ) -> None:
+        super().__init__(
+            config_provider=config_provider,
+            debug=debug,
+            agent_id=agent_id,
+            entity=entity,
+            flush_interval=flush_interval,
+            max_batch=max_batch,
+        )
+        self.session_id: UUID = entity.id
+        self.tail_size = tail_size
+        # seq of the next frame written, known once the tail is loaded
+        self._next_seq: int | None = None
+
+    async def load(self) -> None:
+        """Read the last ``tail_size`` frames of the session."""
+        documents = await self._read_tail()
+        if not documents and await self._import_legacy_memory():
+            documents = await self._read_tail()
+        documents.reverse()
+        self._next_seq = documents[-1].seq + 1 if documents else 0
+        # frames added before the tail was read come after it
+        self.memory = [
+            document.frame for document in documents
+        ] + self.memory
+        self._trim()
+
+    async def _read_tail(self) -> list[MemoryFrame]:
+        return (
+            await MemoryFrame.find(
+                MemoryFrame.session_id == self.session_id
+            )
+            .sort(-MemoryFrame.seq)
+            .limit(self.tail_size)
+            .to_list()
+        )
+
+    async def _import_legacy_memory(self) -> bool:
+        """Move a legacy embedded memory array into the collection."""
+        session = self._session()
+        legacy = await session.project(_LegacyMemory)
+        if legacy is None or not legacy.memory:
+            return False
+
+        self._next_seq = 0
+        try:
+            await self._write_batch(legacy.memory)
+        except BulkWriteError:
+            # another store of the session imported them first
+            self._next_seq = None
+        await session.update({"$unset": {"memory": ""}})
+        logger.info(
+            "Imported legacy interview memory",
+            extra={
+                "context": {
+                    "session_id": str(self.session_id),
+                    "frames": len(legacy.memory),
+                }
+            },
+        )
+        return True
+
+    async def load_range(
+        self, start: int, stop: int | None = None
+    ) -> List[WebsocketFrame]:
+        """Frames ``start`` up to ``stop`` (exclusive) of the session."""
+        await self.flush()
+        query = MemoryFrame.find(
+            MemoryFrame.session_id == self.session_id,
+            MemoryFrame.seq >= start,
+        )
+        if stop is not None:
+            query = query.find(MemoryFrame.seq < stop)
+        documents = await query.sort(+MemoryFrame.seq).to_list()
+        return [document.frame for document in documents]
+
+    async def load_dropped(self) -> List[WebsocketFrame]:
+        """The session's frames older than the tail kept in process."""
+        await self.flush()
+        if self._next_seq is None:
+            await self._load_next_seq()
+        assert self._next_seq is not None
+        # every frame in process is either written or pending
+        first_kept = (
+            self._next_seq + len(self._pending) - len(self.memory)
+        )
+        if first_kept <= 0:
+            return []
+        return await self.load_range(0, first_kept)
+
+    async def add(self, frame: WebsocketFrame) -> None:
+        await super().add(frame)
+        self._trim()
+
+    def _trim(self) -> None:
+        if len(self.memory) > self.tail_size:
+            self._drop_oldest(len(self.memory) - self.tail_size)
+
+    async def _write_batch(self, batch: list[WebsocketFrame]) -> None:
+        if self._next_seq is None:
+            await self._load_next_seq()
+        assert self._next_seq is not None
+        await MemoryFrame.insert_many(
+            [
+                MemoryFrame(
+                    session_id=self.session_id,
+                    seq=self._next_seq + offset,
+                    frame=frame,
+                )
+                for offset, frame in enumerate(batch)
+            ]
+        )
+        self._next_seq += len(batch)
+        try:
+            await self._session().update(
+                {"$set": {"updated_at": datetime.now()}}
+            )
+        except Exception as e:
+            # the frames are written, they must not be queued again
+            logger.warning(
+                "Failed to touch the interview session",
+                extra={"context": {"error": str(e)}},
+            )
+
+    def _session(self) -> FindOne[InterviewSession]:
+        return InterviewSession.find_one(
+            InterviewSession.id == self.session_id
+        )
+
+    async def _load_next_seq(self) -> None:
+        last = (
+            await MemoryFrame.find(
+                MemoryFrame.session_id == self.session_id
+            )
+            .sort(-MemoryFrame.seq)
+            .first_or_none()
+        )
+        self._next_seq = last.seq + 1 if last else 0
+
+    async def clear(self) -> None:
+        self._cancel_timer()
+        self._pending.clear()
+        await MemoryFrame.find(
+            MemoryFrame.session_id == self.session_id
+        ).delete()
+        self._next_seq = 0
+        self.memory = []
@@ -1,59 +1,141 @@
+import asyncio
 import logging
+import os
+import time
+from pathlib import Path
 from typing import List
 
-from app.event_agents.memory.base_memory_store import BaseMemoryStore
+from pydantic import ValidationError
+
+from app.constants import MEMORY_JOURNAL, MEMORY_WRITE_BEHIND
 from app.types.websocket_types import (
     WebsocketFrame,
 )
 
 from ..protocols import ConfigProvider
+from .write_behind import WriteBehindStore
 
 logger = logging.getLogger(__name__)
 
 
-class InMemoryStore(BaseMemoryStore):
+class InMemoryStore(WriteBehindStore):
     """
-    In-memory implementation of MemoryStore protocol with publishing capabilities.
+    In-memory implementation of MemoryStore protocol, journaled to disk.
 
-    This implementation stores WebsocketFrames in memory, provides search capabilities,
-    and publishes updates to subscribers.
+    Frames are kept in process and appended, one JSON line each, to the
+    NDJSON journal at ``path``. Appends are written behind in batches
+    from a worker thread, so adding a frame neither re-serializes the
+    earlier ones nor blocks the event loop. The journal is fsynced at
+    most once per ``fsync_interval`` seconds, and on ``flush``. ``load``
+    rebuilds memory from the journal.
 
     Implements:
         MemoryStore (Protocol): Interface for memory storage operations
     """
 
+    requires_entity = False
+
     def __init__(
         self,
         config_provider: ConfigProvider,
         debug: bool = False,
+        path: str | Path = MEMORY_JOURNAL["path"],
+        flush_interval: float = MEMORY_WRITE_BEHIND["flush_interval"],
+        max_batch: int = MEMORY_WRITE_BEHIND["max_batch"],
+        fsync_interval: float = MEMORY_JOURNAL["fsync_interval"],
     ) -> None:
         super().__init__(
             config_provider=config_provider,
             debug=debug,
+            flush_interval=flush_interval,
+            max_batch=max_batch,
         )
+        self.path = Path(path)
+        self.fsync_interval = fsync_interval
+        self._synced_at = time.monotonic()
+        self._unsynced = False
 
     async def add(self, frame: WebsocketFrame) -> None:
         if not isinstance(frame, WebsocketFrame):
             raise TypeError(
                 f"Expected WebsocketFrame but got {type(frame).__name__}"
             )
+        await super().add(frame)
 
-        self.memory.append(frame)
-        self.save_state()
-
-    def save_state(self) -> None:
-        """Save all frames to a file."""
-        with open("config/memory.json", "w") as file:
-            file.write(
-                "\n".join(
-                    frame.model_dump_json(indent=4)
-                    for frame in self.memory
+    async def load(self) -> None:
+        """Rebuild memory from the journal."""
+        lines = await asyncio.to_thread(self._read_sync)
+        frames: list[WebsocketFrame] = []
+        for number, line in enumerate(lines, start=1):
+            try:
+                frames.append(WebsocketFrame.model_validate_json(line))
+            except ValidationError:
+                logger.warning(
+                    "Skipping unreadable memory journal line",
+                    extra={
+                        "context": {
+                            "path": str(self.path),
+                            "line": number,
+                        }
+                    },
                 )
-            )
+        # frames added before the journal was read come after it
+        self.memory = frames + self.memory
+
+    def _read_sync(self) -> list[bytes]:
+        if not self.path.exists():
+            return []
+        with open(self.path, "rb+") as file:
+            lines = file.readlines()
+            if lines and not lines[-1].endswith(b"\n"):
+                # cut short by a crash mid-append, the next append
+                # would otherwise run on from it
+                file.truncate(file.tell() - len(lines.pop()))
+        return [line for line in lines if line.strip()]
+
+    async def _write_batch(self, batch: list[WebsocketFrame]) -> None:
+        data = "".join(
+            frame.model_dump_json() + "\n" for frame in batch
+        ).encode()
+        sync = time.monotonic() - self._synced_at >= self.fsync_interval
+        await asyncio.to_thread(self._append_sync, data, sync)
+
+    def _append_sync(self, data: bytes, sync: bool) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as file:
+            file.write(data)
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        if sync:
+            self._synced_at = time.monotonic()
+        self._unsynced = not sync
+
+    def _fsync_sync(self) -> None:
+        with open(self.path, "ab") as file:
+            os.fsync(file.fileno())
+        self._synced_at = time.monotonic()
+        self._unsynced = False
+
+    async def flush(self) -> None:
+        """Write the pending frames and fsync the journal."""
+        await super().flush()
+        if self._unsynced:
+            await asyncio.to_thread(self._fsync_sync)
 
     async def clear(self) -> None:
-        """Clear all frames from memory."""
-        self.memory = []
+        """Clear all frames from memory and the journal."""
+        self._cancel_timer()
+        async with self._flush_lock:
+            self._pending.clear()
+            self.memory = []
+            await asyncio.to_thread(self._truncate_sync)
+
+    def _truncate_sync(self) -> None:
+        if self.path.exists():
+            with open(self.path, "wb"):
+                pass
+        self._unsynced = False
 
     def get(self) -> List[WebsocketFrame]:
         """Get all frames from memory."""
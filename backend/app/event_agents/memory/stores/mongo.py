@@ -1,28 +1,29 @@
 import logging
 from datetime import datetime
-from typing import List
 from uuid import UUID
 
 from dotenv import load_dotenv
 
-from app.event_agents.memory.stores.types import EntityType
+from app.constants import MEMORY_WRITE_BEHIND
+from app.event_agents.memory.stores.types import EmbeddedMemoryEntity
 from app.types.websocket_types import (
     WebsocketFrame,
 )
 
-from ..base_memory_store import BaseMemoryStore
 from ..protocols import ConfigProvider
+from .write_behind import WriteBehindStore
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
-class MongoStore(BaseMemoryStore):
+class MongoStore(WriteBehindStore):
     """
     MongoDB implementation of MemoryStore protocol.
 
-    Stores WebsocketFrames in MongoDB for persistence and scalability.
+    Stores WebsocketFrames in the entity's embedded ``memory`` array.
+    Each batch of frames is one ``$push``/``$each`` update.
 
     Implements:
         MemoryStore (Protocol): Interface for memory storage operations
@@ -32,37 +33,42 @@ class MongoStore(BaseMemoryStore):
         self,
         agent_id: UUID,
         config_provider: ConfigProvider,
-        entity: EntityType,
+        entity: EmbeddedMemoryEntity,
         debug: bool = False,
+        flush_interval: float = MEMORY_WRITE_BEHIND["flush_interval"],
+        max_batch: int = MEMORY_WRITE_BEHIND["max_batch"],
     ) -> None:
         super().__init__(
             config_provider=config_provider,
             debug=debug,
             agent_id=agent_id,
             entity=entity,
+            flush_interval=flush_interval,
+            max_batch=max_batch,
         )
+        self.memory = list(entity.memory) if entity else []
 
-    async def _sync_memory(self) -> None:
-        if not self.entity:
-            raise ValueError("Entity is not set")
-        self.memory = self.entity.memory
-
-    async def add(self, frame: WebsocketFrame) -> None:
+    async def _write_batch(self, batch: list[WebsocketFrame]) -> None:
         if not self.entity:
             raise ValueError("Entity is not set")
         await self.entity.update(
             {
-                "$push": {"memory": frame.model_dump()},
+                "$push": {
+                    "memory": {
+                        "$each": [frame.model_dump() for frame in batch]
+                    }
+                },
                 "$set": {"updated_at": datetime.now()},
             },
+            # the in-memory list is already up to date, do not read the
+            # whole document back
+            skip_sync=True,
         )
-        await self._sync_memory()
 
     async def clear(self) -> None:
         if not self.entity:
             raise ValueError("Entity is not set")
+        self._cancel_timer()
+        self._pending.clear()
         await self.entity.delete()
-        self.memory.clear()
-
-    def get(self) -> List[WebsocketFrame]:
-        return self.memory
+        self.memory = []
@@ -1,8 +1,9 @@
 from app.event_agents.schemas.mongo_schemas import (
-    AgentProfile,
-    Candidate,
     Interviewer,
     InterviewSession,
 )
 
-EntityType = Interviewer | Candidate | InterviewSession | AgentProfile
+# entities keeping their memory in an embedded array, see MongoStore
+EmbeddedMemoryEntity = Interviewer
+
+EntityType = EmbeddedMemoryEntity | InterviewSession
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from abc import abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from app.constants import MEMORY_WRITE_BEHIND
+from app.event_agents.memory.stores.types import EntityType
+from app.types.websocket_types import (
+    WebsocketFrame,
+)
+
+from ..base_memory_store import BaseMemoryStore
+from ..protocols import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindStore(BaseMemoryStore):
+    """
+    Memory store that persists frames in batches, behind the reads.
+
+    Frames are appended to the in-memory list right away and queued.
+    The queue is handed to ``_write_batch`` once ``max_batch`` frames
+    are pending, or ``flush_interval`` seconds after the first one.
+    ``flush`` writes whatever is pending and is awaited when the
+    interview stops. Batches are written one at a time, in order, and a
+    failed batch stays queued for the next write.
+    """
+
+    # stores writing to their entity refuse frames without one
+    requires_entity = True
+
+    def __init__(
+        self,
+        config_provider: ConfigProvider,
+        debug: bool = False,
+        agent_id: Optional[UUID] = None,
+        entity: Optional[EntityType] = None,
+        flush_interval: float = MEMORY_WRITE_BEHIND["flush_interval"],
+        max_batch: int = MEMORY_WRITE_BEHIND["max_batch"],
+    ) -> None:
+        super().__init__(
+            config_provider=config_provider,
+            debug=debug,
+            agent_id=agent_id,
+            entity=entity,
+        )
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: list[WebsocketFrame] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: asyncio.Task[None] | None = None
+
+    @abstractmethod
+    async def _write_batch(self, batch: list[WebsocketFrame]) -> None:
+        """Persist ``batch``, the frames added since the last write."""
+        raise NotImplementedError
+
+    async def add(self, frame: WebsocketFrame) -> None:
+        if self.requires_entity and not self.entity:
+            raise ValueError("Entity is not set")
+        self._append(frame)
+        self._pending.append(frame)
+        if len(self._pending) >= self.max_batch:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        # writing from here on, flush must no longer cancel it
+        self._flush_timer = None
+        try:
+            await self._write_pending()
+        except Exception as e:
+            # the frames stay pending for the next flush
+            logger.error(
+                "Failed to write memory frames",
+                extra={
+                    "context": {
+                        "pending": len(self._pending),
+                        "error": str(e),
+                    }
+                },
+                exc_info=True,
+            )
+
+    async def flush(self) -> None:
+        """Write the pending frames now, raise if that fails."""
+        self._cancel_timer()
+        await self._write_pending()
+
+    def _cancel_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    async def _write_pending(self) -> None:
+        # one batch at a time, frames are persisted in the order added
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                await self._write_batch(batch)
+            except BaseException:
+                self._pending = batch + self._pending
+                raise
+        logger.debug(
+            "Memory frames written",
+            extra={"context": {"frames": len(batch)}},
+        )
+
+    def get(self) -> List[WebsocketFrame]:
+        return self.memory
@@ -0,0 +1,60 @@
+import logging
+from typing import Dict, List
+
+from app.constants import MEMORY_CONTEXT_WINDOW
+from app.event_agents.orchestrator.governor import LLMPriority
+from app.event_agents.orchestrator.thinker import Thinker
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = """You keep a running summary of an interview transcript.
+
+Current summary:
+{summary}
+
+Newer transcript turns:
+{transcript}
+
+Rewrite the summary so it also covers the newer turns. Keep the
+questions asked, the candidate's answers and claims, and anything the
+interviewer said it would come back to. Be factual and concise, and
+reply with the summary only."""
+
+
+class RollingSummarizer:
+    """Folds older transcript turns into a memory store's summary."""
+
+    def __init__(
+        self,
+        thinker: Thinker,
+        max_tokens: int = MEMORY_CONTEXT_WINDOW["summary_tokens"],
+    ) -> None:
+        self.thinker = thinker
+        self.max_tokens = max_tokens
+
+    def __repr__(self) -> str:
+        return f"RollingSummarizer(max_tokens={self.max_tokens})"
+
+    async def __call__(
+        self, summary: str, messages: List[Dict[str, str]]
+    ) -> str:
+        transcript = "\n".join(
+            f"{message['role']}: {message['content']}"
+            for message in messages
+        )
+        response = await self.thinker.generate(
+            messages=[
+                {
+                    "role": "user",
+                    "content": SUMMARY_PROMPT.format(
+                        summary=summary or "(empty)",
+                        transcript=transcript,
+                    ),
+                }
+            ],
+            use_role_context=False,
+            max_tokens=self.max_tokens,
+            use_cache=True,
+            priority=LLMPriority.SUMMARY,
+        )
+        return response.choices[0].message.content or summary
@@ -1,4 +1,14 @@
-from .broker import Broker
+from .broker import Broker, DeadLetter
+from .policies import DispatchPolicy
+from .queues import Lane, LaneConfig, OverflowPolicy
 from .thinker import Thinker
 
-__all__ = ["Broker", "Thinker"]
+__all__ = [
+    "Broker",
+    "DeadLetter",
+    "DispatchPolicy",
+    "Lane",
+    "LaneConfig",
+    "OverflowPolicy",
+    "Thinker",
+]
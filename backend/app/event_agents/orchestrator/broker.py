@@ -1,47 +1,225 @@
 import asyncio
 import logging
-from collections import defaultdict
-from typing import Awaitable, Callable, Type, TypeVar
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Type,
+    TypeVar,
+)
+from uuid import UUID
 
 from app.event_agents.orchestrator.commands import CommandBase
 from app.event_agents.orchestrator.events import BaseEvent
-from app.types.websocket_types import WebsocketFrame
+from app.event_agents.orchestrator.metrics import (
+    LaneMetrics,
+    LatencyHistogram,
+)
+from app.event_agents.orchestrator.policies import (
+    DEFAULT_DISPATCH_POLICIES,
+    DEFAULT_DISPATCH_POLICY,
+    DispatchPolicy,
+)
+from app.event_agents.orchestrator.queues import (
+    EventQueue,
+    Lane,
+    LaneConfig,
+)
+from app.types.websocket_types import (
+    WebsocketFrame,
+    WebsocketFrameBatch,
+)
+
+if TYPE_CHECKING:
+    from app.event_agents.orchestrator.journal import EventJournal
+    from app.event_agents.orchestrator.runtime import BrokerRuntime
 
 logger = logging.getLogger(__name__)
 
-Event = TypeVar("Event", bound=BaseEvent | WebsocketFrame)
+Event = TypeVar(
+    "Event", bound=BaseEvent | WebsocketFrame | WebsocketFrameBatch
+)
+
+Handler = Callable[..., Awaitable[None]]
+BrokerEvent = BaseEvent | WebsocketFrame | CommandBase
+
+WILDCARD: Literal["*"] = "*"
+SubscriptionKey = type | Literal["*"]
+
+# set inside handler tasks, publishes made from a handler never block
+# on a full lane since the consumer they would wait on may be waiting
+# on that very handler
+_inside_handler: ContextVar[bool] = ContextVar(
+    "broker_inside_handler", default=False
+)
+
+
+class Subscription(NamedTuple):
+    """
+    A handler and the time it is allowed to run per event.
+
+    A subscription to a batch type may name the per-event handler it
+    ``replaces``, that handler then gets the batch instead of each of
+    its events.
+    """
+
+    handler: Handler
+    timeout: float | None = None
+    replaces: Handler | None = None
+
+
+class Route(NamedTuple):
+    """Precomputed delivery plan for one concrete event class."""
+
+    subscriptions: tuple[Subscription, ...]
+    policy: DispatchPolicy
+    # leading subscriptions made to the class or its bases, the rest
+    # are wildcard subscriptions
+    explicit: int = 0
+
+    @property
+    def handlers(self) -> tuple[Handler, ...]:
+        return tuple(
+            subscription.handler for subscription in self.subscriptions
+        )
+
+
+@dataclass
+class DeadLetter:
+    """An event a handler failed on, kept for inspection and replay."""
+
+    event: "BrokerEvent"
+    subscription: Subscription
+    error: str
+    error_type: str
+    timed_out: bool = False
+    failed_at: float = field(default_factory=time.time)
+
+    @property
+    def handler_name(self) -> str:
+        return _handler_name(self.subscription.handler)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "event_type": self.event.__class__.__name__,
+            "handler": self.handler_name,
+            "error": self.error,
+            "error_type": self.error_type,
+            "timed_out": self.timed_out,
+            "failed_at": self.failed_at,
+        }
+
+
+def _handler_name(handler: Handler) -> str:
+    return getattr(handler, "__qualname__", repr(handler))
 
 
 class Broker:
-    def __init__(self) -> None:
-        self._subscribers: dict[
-            str, list[Callable[..., Awaitable[None]]]
-        ] = defaultdict(list)
-        self._event_queue: asyncio.Queue[
-            BaseEvent | WebsocketFrame | CommandBase
-        ] = asyncio.Queue()
+    """
+    Per-session event bus.
+
+    Runs its own consumer task by default. When given a ``runtime`` the
+    broker instead registers with that shared ``BrokerRuntime`` on start
+    and its events are consumed by the runtime's worker pool, keyed by
+    ``session_id``.
+
+    With a ``journal`` every dispatched event is also appended to that
+    session's journal, so the interview can be replayed after a restart.
+    """
+
+    def __init__(
+        self,
+        dispatch_policies: Mapping[type, DispatchPolicy] | None = None,
+        lane_configs: Mapping[Lane, LaneConfig] | None = None,
+        runtime: "BrokerRuntime | None" = None,
+        session_id: UUID | None = None,
+        default_timeout: float | None = None,
+        dead_letter_capacity: int = 100,
+        journal: "EventJournal | None" = None,
+    ) -> None:
+        if journal is not None and session_id is None:
+            raise ValueError("A journaled broker needs a session_id")
+        self.session_id = session_id
+        self.journal = journal
+        self.default_timeout = default_timeout
+        self._runtime = runtime
+        self._held_event: BrokerEvent | None = None
+        self._subscribers: dict[SubscriptionKey, list[Subscription]] = (
+            defaultdict(list)
+        )
+        self._routes: dict[type, Route] = {}
+        self._event_queue: EventQueue[BrokerEvent] = EventQueue(
+            lane_configs
+        )
         self._is_running: bool = False
         self._process_events_task: asyncio.Task[None] | None = None
 
+        policies = (
+            DEFAULT_DISPATCH_POLICIES
+            if dispatch_policies is None
+            else dispatch_policies
+        )
+        self._dispatch_policies: dict[type, DispatchPolicy] = dict(
+            policies
+        )
+        self._semaphores: dict[type, asyncio.Semaphore] = {}
+        self._ordered_lanes: dict[type, deque[BrokerEvent]] = {}
+        self._ordered_workers: dict[type, asyncio.Task[None]] = {}
+        self._mailbox_drained = asyncio.Event()
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._dead_letters: deque[DeadLetter] = deque(
+            maxlen=dead_letter_capacity
+        )
+        self._latencies: dict[str, LatencyHistogram] = {}
+
     async def subscribe(
         self,
-        event_type: Type[Event] | Type[CommandBase],
+        event_type: Type[Event] | Type[CommandBase] | Literal["*"],
         handler: Callable[..., Awaitable[None]],
+        timeout: float | None = None,
+        replaces: Callable[..., Awaitable[None]] | None = None,
     ) -> None:
         """
         Subscribe to an event type with a handler function.
 
         Args:
-            event_type (BaseModel): The Pydantic model class representing the event type
+            event_type (BaseModel): The Pydantic model class representing the event type,
+                or "*" to receive every event
             handler (callable): The async function to be called when the event occurs
+            timeout (float): Seconds the handler may spend on one event before it is
+                cancelled and the event dead-lettered. Defaults to the broker's
+                ``default_timeout``, None means no limit.
+            replaces (callable): For a batch type, the per-event handler this
+                one stands in for. Bursts of the batched type then reach that
+                handler as one batch through this one, every other subscriber
+                of the type still gets each event.
 
-        The handler will be invoked whenever an event of the specified type is published.
+        The handler will be invoked whenever an event of the specified type,
+        or of any subclass of it, is published.
         """
-        self._subscribers[event_type.__name__].append(handler)
+        self._subscribers[event_type].append(
+            Subscription(
+                handler=handler,
+                timeout=(
+                    timeout
+                    if timeout is not None
+                    else self.default_timeout
+                ),
+                replaces=replaces,
+            )
+        )
+        self._rebuild_routes()
 
     async def unsubscribe(
         self,
-        event_type: Type[Event] | Type[CommandBase],
+        event_type: Type[Event] | Type[CommandBase] | Literal["*"],
         handler: Callable[..., Awaitable[None]],
     ) -> None:
         """
@@ -53,20 +231,170 @@ class Broker:
 
         Removes the specified handler from the list of subscribers for the given event type.
         """
-        self._subscribers[event_type.__name__].remove(handler)
+        subscriptions = self._subscribers[event_type]
+        for index, subscription in enumerate(subscriptions):
+            if subscription.handler == handler:
+                del subscriptions[index]
+                break
+        else:
+            raise ValueError(
+                f"{_handler_name(handler)} is not subscribed"
+            )
+        self._rebuild_routes()
 
-    async def publish(
-        self, event: BaseEvent | WebsocketFrame | CommandBase
+    def set_dispatch_policy(
+        self,
+        event_type: Type[Event] | Type[CommandBase],
+        policy: DispatchPolicy,
     ) -> None:
+        """
+        Override how events of a type are handed to their handlers.
+
+        Args:
+            event_type (BaseModel): The event class the policy applies to
+            policy (DispatchPolicy): Ordering and concurrency settings
+
+        Takes effect for events dispatched after the call.
+        """
+        self._dispatch_policies[event_type] = policy
+        self._semaphores.clear()
+        self._rebuild_routes()
+
+    def _rebuild_routes(self) -> None:
+        """Recompute the route of every event class seen so far."""
+        self._routes = {
+            event_class: self._build_route(event_class)
+            for event_class in self._routes
+        }
+
+    def _build_route(self, event_class: type) -> Route:
+        """
+        Resolve handlers and policy for an event class.
+
+        Walks the class MRO so subscribers of a base event also receive
+        its subclasses, appends wildcard subscribers last, and drops
+        duplicate handlers while keeping subscription order.
+        """
+        subscriptions: dict[Handler, Subscription] = {}
+        policy: DispatchPolicy | None = None
+        for klass in event_class.__mro__:
+            for subscription in self._subscribers.get(klass, []):
+                subscriptions.setdefault(
+                    subscription.handler, subscription
+                )
+            if policy is None:
+                policy = self._dispatch_policies.get(klass)
+        explicit = len(subscriptions)
+        for subscription in self._subscribers.get(WILDCARD, []):
+            subscriptions.setdefault(subscription.handler, subscription)
+
+        return Route(
+            subscriptions=tuple(subscriptions.values()),
+            policy=policy or DEFAULT_DISPATCH_POLICY,
+            explicit=explicit,
+        )
+
+    def _route_for(self, event_class: type) -> Route:
+        route = self._routes.get(event_class)
+        if route is None:
+            route = self._routes[event_class] = self._build_route(
+                event_class
+            )
+        return route
+
+    async def publish(self, event: BrokerEvent) -> None:
         """
         Publish an event to the message queue.
 
         Args:
             event (dict): The event object to be published
 
-        Adds the event to the asyncio Queue for processing by subscribed handlers.
+        Adds the event to its priority lane for processing by subscribed handlers.
+        When the lane is full the call waits for space. Events of a lossy
+        type instead follow the lane's overflow policy, which may drop the
+        oldest queued lossy event or coalesce with a queued one that shares
+        the same coalesce key.
         """
-        await self._event_queue.put(event)
+        policy = self._route_for(event.__class__).policy
+        await self._event_queue.put(
+            event,
+            lane=policy.lane,
+            coalesce_key=(
+                policy.coalesce_key(event)
+                if policy.coalesce_key
+                else None
+            ),
+            block=not _inside_handler.get(),
+            lossy=policy.lossy,
+        )
+        if self._runtime is not None:
+            self._runtime.notify(self)
+
+    def queue_metrics(self) -> dict[str, LaneMetrics]:
+        """
+        Snapshot of queue depth and overflow counters per priority lane.
+
+        Depth counts events waiting in the broker queue. Events already
+        handed to an ordered lane's backlog are reported separately by
+        ``ordered_backlog``.
+        """
+        return self._event_queue.metrics()
+
+    def ordered_backlog(self) -> dict[str, int]:
+        """Events waiting on each ordered type's delivery lane."""
+        return {
+            event_type.__name__: len(backlog)
+            for event_type, backlog in self._ordered_lanes.items()
+        }
+
+    def handler_latencies(self) -> dict[str, dict[str, object]]:
+        """
+        Per-handler latency histograms, keyed by handler name.
+
+        Covers successful, failed and timed out runs. Time spent waiting
+        on a ``max_concurrency`` slot is not included.
+        """
+        return {
+            name: histogram.to_dict()
+            for name, histogram in self._latencies.items()
+        }
+
+    def dead_letters(self) -> list[DeadLetter]:
+        """Events a handler failed on or timed out on, oldest first."""
+        return list(self._dead_letters)
+
+    async def replay_dead_letters(
+        self, predicate: Callable[[DeadLetter], bool] | None = None
+    ) -> int:
+        """
+        Run failed events through the handler that failed on them again.
+
+        Args:
+            predicate (callable): Selects the dead letters to replay, all of
+                them when omitted
+
+        Replayed entries are removed from the buffer; one that fails again
+        is captured anew. Returns the number of events replayed, once they
+        have all been handled.
+        """
+        selected = [
+            letter
+            for letter in self._dead_letters
+            if predicate is None or predicate(letter)
+        ]
+        for letter in selected:
+            self._dead_letters.remove(letter)
+        await asyncio.gather(
+            *(
+                self._track(
+                    self._run_handler(
+                        letter.subscription, letter.event, None
+                    )
+                )
+                for letter in selected
+            )
+        )
+        return len(selected)
 
     async def _process_events(self) -> None:
         """
@@ -75,20 +403,247 @@ class Broker:
         Continuously monitors the event queue while the broker is running.
         For each event:
         1. Retrieves the event type
-        2. Finds all handlers subscribed to that event type
-        3. Executes each handler with the event
-        4. Also executes any handlers subscribed to all events ("*")
+        2. Finds all handlers subscribed to that event type, and any
+           handlers subscribed to all events ("*")
+        3. Hands the event to the handlers as tracked tasks, without
+           waiting for them to finish
+
+        Ordered types have a backlog bounded by their lane's size. When it
+        is full the loop waits for it to drain, which backs up the queue
+        and, through the lane's overflow policy, the publishers.
         """
         while self._is_running:
             event = await self._event_queue.get()
-            event_type = event.__class__.__name__
+            try:
+                while self._backlog_full(event):
+                    self._mailbox_drained.clear()
+                    await self._mailbox_drained.wait()
+                self._dispatch(event)
+            finally:
+                self._event_queue.task_done()
+
+    def _step(self) -> bool:
+        """
+        Dispatch at most one queued event, for use by ``BrokerRuntime``.
+
+        Returns True when more events are ready. An event whose ordered
+        backlog is full is held back and the runtime is notified again
+        once that backlog drains.
+        """
+        if not self._is_running:
+            return False
+        if self._held_event is not None:
+            event = self._held_event
+        else:
+            try:
+                event = self._event_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+
+        if self._backlog_full(event):
+            self._held_event = event
+            return False
+
+        self._held_event = None
+        try:
+            self._dispatch(event)
+        finally:
+            self._event_queue.task_done()
+        return not self._event_queue.empty()
+
+    def _backlog_full(self, event: BrokerEvent) -> bool:
+        policy = self._route_for(event.__class__).policy
+        if not policy.ordered:
+            return False
+        maxsize = self._event_queue.lane_config(policy.lane).maxsize
+        backlog = self._ordered_lanes.get(event.__class__)
+        return bool(maxsize and backlog and len(backlog) >= maxsize)
 
-            handlers = self._subscribers.get(event_type, [])
-            handlers.extend(self._subscribers.get("*", []))
+    def _dispatch(self, event: BrokerEvent) -> None:
+        if self.journal is not None:
+            self.journal.append(self.session_id, event)  # type: ignore
 
-            # await asyncio.gather(*[handler(event) for handler in handlers])
-            for handler in handlers:
-                await handler(event)
+        event_type = event.__class__
+        subscriptions, policy, _ = self._route_for(event_type)
+        if not subscriptions:
+            return
+
+        if policy.ordered:
+            self._ordered_lanes.setdefault(event_type, deque()).append(
+                event
+            )
+            worker = self._ordered_workers.get(event_type)
+            if worker is None or worker.done():
+                self._ordered_workers[event_type] = self._track(
+                    self._drain_ordered_lane(event_type)
+                )
+            return
+
+        semaphore = self._semaphore_for(event_type, policy)
+        for subscription in subscriptions:
+            self._track(
+                self._run_handler(subscription, event, semaphore)
+            )
+
+    def _semaphore_for(
+        self, event_type: type, policy: DispatchPolicy
+    ) -> asyncio.Semaphore | None:
+        if policy.max_concurrency is None:
+            return None
+        if event_type not in self._semaphores:
+            self._semaphores[event_type] = asyncio.Semaphore(
+                policy.max_concurrency
+            )
+        return self._semaphores[event_type]
+
+    async def _drain_ordered_lane(self, event_type: type) -> None:
+        lane = self._ordered_lanes[event_type]
+        while lane:
+            route = self._route_for(event_type)
+            batch_subscriptions = self._batch_subscriptions(
+                route.policy
+            )
+            if not batch_subscriptions:
+                events = [lane.popleft()]
+            else:
+                if 1 < len(lane) < route.policy.batch_max:
+                    # a burst is under way, let the rest of it catch up.
+                    # A lone event goes out without waiting
+                    await asyncio.sleep(route.policy.batch_window)
+                events = [
+                    lane.popleft()
+                    for _ in range(
+                        min(len(lane), route.policy.batch_max)
+                    )
+                ]
+            self._mailbox_drained.set()
+            if self._held_event is not None and self._runtime:
+                self._runtime.notify(self)
+
+            subscriptions = route.subscriptions
+            if len(events) > 1:
+                batch = route.policy.batch_type.from_events(events)  # type: ignore
+                for subscription in batch_subscriptions:
+                    await self._run_handler(subscription, batch, None)
+                replaced = {
+                    subscription.replaces
+                    for subscription in batch_subscriptions
+                }
+                subscriptions = tuple(
+                    subscription
+                    for subscription in subscriptions
+                    if subscription.handler not in replaced
+                )
+
+            for event in events:
+                for subscription in subscriptions:
+                    await self._run_handler(subscription, event, None)
+
+    def _batch_subscriptions(
+        self, policy: DispatchPolicy
+    ) -> tuple[Subscription, ...]:
+        """
+        Subscriptions made to the policy's batch type.
+
+        Batching only applies while there are some. Wildcard subscribers
+        do not count, they get each event like any per-event subscriber.
+        """
+        if policy.batch_type is None or policy.batch_max < 2:
+            return ()
+        batch_route = self._route_for(policy.batch_type)
+        return batch_route.subscriptions[: batch_route.explicit]
+
+    async def _run_handler(
+        self,
+        subscription: Subscription,
+        event: BrokerEvent,
+        semaphore: asyncio.Semaphore | None,
+    ) -> None:
+        _inside_handler.set(True)
+        if semaphore is None:
+            await self._invoke(subscription, event)
+        else:
+            async with semaphore:
+                await self._invoke(subscription, event)
+
+    async def _invoke(
+        self, subscription: Subscription, event: BrokerEvent
+    ) -> None:
+        """
+        Run one handler on one event, isolating its failures.
+
+        Exceptions and timeouts are logged and the event is dead-lettered,
+        they never reach the consumer loop or the other handlers.
+        """
+        name = _handler_name(subscription.handler)
+        histogram = self._latencies.get(name)
+        if histogram is None:
+            histogram = self._latencies[name] = LatencyHistogram()
+
+        started = time.perf_counter()
+        try:
+            if subscription.timeout is None:
+                await subscription.handler(event)
+            else:
+                await asyncio.wait_for(
+                    subscription.handler(event), subscription.timeout
+                )
+        except asyncio.TimeoutError as e:
+            histogram.timeouts += 1
+            self._dead_letter(subscription, event, e, timed_out=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            histogram.failures += 1
+            self._dead_letter(subscription, event, e)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    def _dead_letter(
+        self,
+        subscription: Subscription,
+        event: BrokerEvent,
+        error: Exception,
+        timed_out: bool = False,
+    ) -> None:
+        letter = DeadLetter(
+            event=event,
+            subscription=subscription,
+            error=(
+                f"timed out after {subscription.timeout}s"
+                if timed_out
+                else str(error)
+            ),
+            error_type=error.__class__.__name__,
+            timed_out=timed_out,
+        )
+        self._dead_letters.append(letter)
+        logger.error(
+            "Event handler timed out"
+            if timed_out
+            else "Event handler failed",
+            extra={"context": letter.to_dict()},
+            exc_info=not timed_out,
+        )
+
+    def _track(self, coro: Awaitable[None]) -> asyncio.Task[None]:
+        task = asyncio.ensure_future(coro)
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        return task
+
+    async def join(self) -> None:
+        """
+        Wait until every published event has been fully handled.
+
+        Returns once the queue is empty and no handler task is running,
+        including events published by handlers along the way.
+        """
+        while True:
+            await self._event_queue.join()
+            if not self._in_flight:
+                return
+            await asyncio.wait(set(self._in_flight))
 
     async def stop(self) -> None:
         """
@@ -97,10 +652,28 @@ class Broker:
         Terminates the event processing by:
         1. Setting the running flag to False
         2. Canceling the process events task if it exists
+        3. Canceling any handler tasks that are still running, except
+           the one calling ``stop``, so a handler can stop the broker
+           and still finish its own cleanup
+        4. Detaching from the shared runtime, if any
+        5. Flushing the session's journal, if any
         """
         self._is_running = False
+        if self._runtime is not None:
+            self._runtime.detach(self)
         if self._process_events_task:
             self._process_events_task.cancel()
+        current = asyncio.current_task()
+        for task in list(self._in_flight):
+            if task is not current:
+                task.cancel()
+        # an ordered worker calling stop ends after its handler
+        for lane in self._ordered_lanes.values():
+            lane.clear()
+        self._ordered_lanes.clear()
+        self._ordered_workers.clear()
+        if self.journal is not None:
+            await self.journal.flush(self.session_id)
 
     async def start(self) -> None:
         """
@@ -108,11 +681,15 @@ class Broker:
 
         Initializes the event processing by:
         1. Setting the running flag to True
-        2. Creating an asyncio task for the event processor
+        2. Attaching to the shared runtime, or creating an asyncio task
+           for the event processor when there is none
         Only starts if the broker is not already running.
         """
         if not self._is_running:
             self._is_running = True
+            if self._runtime is not None:
+                self._runtime.attach(self)
+                return
             self._process_events_task = asyncio.create_task(
                 self._process_events()
             )
@@ -0,0 +1,270 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+CacheEntry = dict[str, Any]
+
+
+@lru_cache(maxsize=512)
+def schema_fingerprint(response_model: type[BaseModel]) -> str:
+    """Hash of a response model's JSON schema, computed once per class."""
+    schema = json.dumps(
+        response_model.model_json_schema(), sort_keys=True
+    )
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def cache_key(
+    kind: str,
+    model: str,
+    messages: list[dict[str, str]],
+    response_model: type[BaseModel] | None = None,
+    max_tokens: int | None = None,
+) -> str:
+    """
+    Content address of an LLM request.
+
+    Two requests share a key when they would send the same model,
+    messages, response schema and token limit upstream.
+    """
+    payload = json.dumps(
+        {
+            "kind": kind,
+            "model": model,
+            "messages": messages,
+            "schema": (
+                schema_fingerprint(response_model)
+                if response_model is not None
+                else None
+            ),
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    prompt_tokens_saved: int = 0
+    completion_tokens_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries, JSON-serializable dicts keyed by hash."""
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Least recently used entries in process memory, with a TTL."""
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: float | None = 60 * 60
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, CacheEntry]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        stored_at, entry = item
+        if (
+            self.ttl is not None
+            and time.monotonic() - stored_at > self.ttl
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = (time.monotonic(), entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    One JSON file per entry under ``directory``, survives restarts.
+
+    Files are fanned out by the first two characters of the key and
+    written atomically. Expiry uses the file's modification time.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: float | None = 7 * 24 * 60 * 60,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _get_sync(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            if (
+                self.ttl is not None
+                and time.time() - path.stat().st_mtime > self.ttl
+            ):
+                path.unlink(missing_ok=True)
+                return None
+            entry: CacheEntry = json.loads(path.read_text())
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(
+                "Unreadable response cache entry",
+                extra={"context": {"path": str(path), "error": str(e)}},
+            )
+            return None
+
+    def _set_sync(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, path)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await asyncio.to_thread(self._set_sync, key, entry)
+
+    async def clear(self) -> None:
+        def _clear() -> None:
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+        await asyncio.to_thread(_clear)
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of LLM responses used by ``Thinker``.
+
+    Entries hold the serialized response plus the token usage of the
+    call that produced it, so every hit adds the tokens it saved to the
+    stats.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None) -> None:
+        self.backend = backend or MemoryCacheBackend()
+        self._stats = CacheStats()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(backend={self.backend.__class__.__name__}, hits={self._stats.hits}, misses={self._stats.misses})"
+
+    async def get(self, key: str) -> CacheEntry | None:
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            # a broken cache must never fail the llm call
+            logger.error(
+                "Response cache lookup failed",
+                extra={"context": {"error": str(e)}},
+            )
+            entry = None
+
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        self._stats.hits += 1
+        usage = entry.get("usage") or {}
+        self._stats.prompt_tokens_saved += usage.get("prompt_tokens", 0)
+        self._stats.completion_tokens_saved += usage.get(
+            "completion_tokens", 0
+        )
+        return entry
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        usage: dict[str, int] | None = None,
+    ) -> None:
+        try:
+            await self.backend.set(
+                key, {"value": value, "usage": usage}
+            )
+            self._stats.stores += 1
+        except Exception as e:
+            logger.error(
+                "Response cache store failed",
+                extra={"context": {"error": str(e)}},
+            )
+
+    def stats(self) -> CacheStats:
+        return CacheStats(**asdict(self._stats))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+
+_default_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Process-wide response cache shared by every ``Thinker``.
+
+    In memory by default, set ``LLM_CACHE_DIR`` to persist entries on disk.
+    """
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.getenv("LLM_CACHE_DIR")
+        _default_cache = ResponseCache(
+            DiskCacheBackend(cache_dir) if cache_dir else None
+        )
+    return _default_cache
@@ -1,12 +1,16 @@
-from typing import List
+from typing import Any, List, Self
 
 from pydantic import BaseModel
 
+from app.event_agents.orchestrator.events import construct_trusted
 from app.types.interview_concept_types import QuestionAndAnswer
 
 
 class CommandBase(BaseModel):
-    pass
+    @classmethod
+    def internal(cls, **data: Any) -> Self:
+        """Build a command from already typed values, without validation."""
+        return construct_trusted(cls, data)
 
 
 class GenerateEvaluationsCommand(CommandBase):
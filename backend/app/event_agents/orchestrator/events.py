@@ -1,21 +1,96 @@
-from datetime import datetime
-from uuid import UUID, uuid4
+import itertools
+import secrets
+import time
+from typing import Any, Self, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, Field
+from pydantic.fields import FieldInfo
 
+from app.event_agents.conversations.types import ProbeDirection
 from app.types.interview_concept_types import QuestionAndAnswer
 from app.types.websocket_types import WebsocketFrame
 
+Model = TypeVar("Model", bound=BaseModel)
+
+# random per-process high bits with the uuid4 version and variant set,
+# a counter fills the low 62 bits. Unique like uuid4 without reading
+# os.urandom for every event.
+_ID_PREFIX = (
+    (secrets.randbits(128) & ~((0xF << 76) | (0x3 << 62) | (2**62 - 1)))
+    | (0x4 << 76)
+    | (0x2 << 62)
+)
+_id_counter = itertools.count()
+
+_optional_fields: dict[
+    type[BaseModel], tuple[tuple[str, FieldInfo], ...]
+] = {}
+
+
+def new_event_id() -> UUID:
+    return UUID(int=_ID_PREFIX | next(_id_counter))
+
+
+def now_timestamp() -> int:
+    return int(time.time())
+
+
+def construct_trusted(
+    model: type[Model], data: dict[str, Any]
+) -> Model:
+    """
+    Instantiate a model from values that are already the right types.
+
+    Same result as ``model_construct`` minus its per-call walk over every
+    field and alias: only fields with a default that were not passed are
+    looked at, and that list is computed once per class.
+    """
+    optional = _optional_fields.get(model)
+    if optional is None:
+        optional = _optional_fields[model] = tuple(
+            (name, field)
+            for name, field in model.model_fields.items()
+            if not field.is_required()
+        )
+    fields_set = set(data)
+    for name, field in optional:
+        if name not in data:
+            data[name] = field.get_default(call_default_factory=True)
+
+    instance = model.__new__(model)
+    # the attributes model_construct sets, see pydantic.BaseModel
+    object.__setattr__(instance, "__dict__", data)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
 
 class BaseEvent(BaseModel):
-    event_id: UUID = Field(default_factory=uuid4)
-    timestamp: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp())
-    )
+    event_id: UUID = Field(default_factory=new_event_id)
+    timestamp: int = Field(default_factory=now_timestamp)
     correlation_id: UUID = Field(
-        default_factory=uuid4
+        default_factory=new_event_id
     )  # to track related events
 
+    @classmethod
+    def internal(cls, **data: Any) -> Self:
+        """
+        Build an event from values that are already the right types.
+
+        Skips pydantic validation, for events created and consumed inside
+        the process. Anything coming from a client or another process
+        goes through the regular constructor.
+        """
+        if "event_id" not in data:
+            data["event_id"] = new_event_id()
+        if "timestamp" not in data:
+            data["timestamp"] = now_timestamp()
+        if "correlation_id" not in data:
+            data["correlation_id"] = new_event_id()
+        return construct_trusted(cls, data)
+
 
 class WebsocketMessageEvent(BaseEvent):
     frame: WebsocketFrame
@@ -33,6 +108,13 @@ class AddToMemoryEvent(BaseEvent):
     frame: WebsocketFrame
 
 
+class AnswerProgressEvent(BaseEvent):
+    """The candidate's answer so far, while they are still typing."""
+
+    partial_answer: str
+    interview_id: UUID
+
+
 class MessageReceivedEvent(BaseEvent):
     message: str
     interview_id: UUID
@@ -41,6 +123,10 @@ class MessageReceivedEvent(BaseEvent):
 class AskQuestionEvent(BaseEvent):
     question: QuestionAndAnswer
     interview_id: UUID
+    # frame the question was already streamed under, if it was
+    frame_id: str | None = None
+    # how the turn answering it grows the conversation tree
+    direction: ProbeDirection | None = None
 
 
 class AnswerReceivedEvent(MessageReceivedEvent):
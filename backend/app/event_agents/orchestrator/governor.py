@@ -0,0 +1,301 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Hashable
+
+from app.constants import LLM_RATE_LIMITS
+from app.event_agents.orchestrator.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class LLMPriority(IntEnum):
+    """Priority classes for upstream LLM calls, lower values go first."""
+
+    QUESTION = 0  # the next question the candidate is waiting for
+    SETUP = 1  # role analysis, question bank and rubric generation
+    EVALUATION = 2  # evaluator fan-out
+    PERSPECTIVE = 3  # perspectives
+    SUMMARY = 4  # rolling transcript summaries, never waited on
+
+
+class TokenBucket:
+    """
+    Per-minute budget refilled continuously.
+
+    ``capacity`` is the most that can be spent in one burst, which is
+    the whole per-minute budget. The level may go negative when a call
+    turns out to cost more than its estimate, later calls then wait for
+    the debt to refill.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(
+            self.capacity,
+            self.level + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken, 0 if it can be now."""
+        self._refill()
+        # a single call larger than the whole budget waits for a full
+        # bucket instead of forever
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass(order=True)
+class _Waiter:
+    finish_tag: float
+    seq: int
+    priority: LLMPriority = field(compare=False)
+    session_id: Hashable = field(compare=False)
+    tokens: int = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class LLMPermit:
+    """A granted slot, settle it with the actual usage once known."""
+
+    def __init__(self, governor: "LLMGovernor", tokens: int) -> None:
+        self._governor = governor
+        self.estimated_tokens = tokens
+
+    def settle(self, used_tokens: int) -> None:
+        """Correct the token budget by the difference to the estimate."""
+        difference = used_tokens - self.estimated_tokens
+        if difference > 0:
+            self._governor._tokens.take(difference)
+        elif difference < 0:
+            self._governor._tokens.give(-difference)
+        self.estimated_tokens = used_tokens
+
+
+class LLMGovernor:
+    """
+    Process-wide scheduler in front of every upstream LLM call.
+
+    Calls wait for a concurrency slot and for room in the request and
+    token per-minute budgets. Waiting calls are served strictly by
+    ``LLMPriority``. Within one priority, interviews share capacity by
+    weighted fair queuing: every call gets a virtual finish tag of
+    ``max(virtual time, the interview's last tag) + tokens / weight``
+    and the lowest tag is served first, so one interview firing many
+    evaluators at once cannot starve the others.
+
+    Token costs are estimated up front and settled against the real
+    usage afterwards. Time spent queued is recorded per priority.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = LLM_RATE_LIMITS[
+            "requests_per_minute"
+        ],
+        tokens_per_minute: int = LLM_RATE_LIMITS["tokens_per_minute"],
+        max_concurrency: int = LLM_RATE_LIMITS["max_concurrency"],
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._queues: dict[LLMPriority, list[_Waiter]] = {
+            priority: [] for priority in LLMPriority
+        }
+        self._virtual_time: dict[LLMPriority, float] = {
+            priority: 0.0 for priority in LLMPriority
+        }
+        self._last_tags: dict[tuple[LLMPriority, Hashable], float] = {}
+        self._weights: dict[Hashable, float] = {}
+        self._active = 0
+        self._seq = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._waits = {
+            priority: LatencyHistogram() for priority in LLMPriority
+        }
+
+    def __repr__(self) -> str:
+        return f"LLMGovernor(active={self._active}, queued={self.queued()})"
+
+    def set_weight(self, session_id: Hashable, weight: float) -> None:
+        """Give an interview a larger (or smaller) share, default 1."""
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._weights[session_id] = weight
+
+    def forget(self, session_id: Hashable) -> None:
+        """Drop the fair-queuing state kept for a finished interview."""
+        self._weights.pop(session_id, None)
+        for key in [
+            key for key in self._last_tags if key[1] == session_id
+        ]:
+            del self._last_tags[key]
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: LLMPriority,
+        session_id: Hashable = None,
+        tokens: int = 0,
+    ) -> AsyncIterator[LLMPermit]:
+        """Wait for capacity, yield a permit, release it on exit."""
+        await self._acquire(priority, session_id, tokens)
+        try:
+            yield LLMPermit(self, tokens)
+        finally:
+            self._active -= 1
+            self._pump()
+
+    async def _acquire(
+        self, priority: LLMPriority, session_id: Hashable, tokens: int
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        key = (priority, session_id)
+        start = max(
+            self._virtual_time[priority], self._last_tags.get(key, 0.0)
+        )
+        finish_tag = start + max(tokens, 1) / self._weights.get(
+            session_id, 1.0
+        )
+        self._last_tags[key] = finish_tag
+        waiter = _Waiter(
+            finish_tag=finish_tag,
+            seq=next(self._seq),
+            priority=priority,
+            session_id=session_id,
+            tokens=tokens,
+            enqueued_at=time.monotonic(),
+            future=loop.create_future(),
+        )
+        heapq.heappush(self._queues[priority], waiter)
+        self._pump()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # granted in the same tick the caller was cancelled
+                self._active -= 1
+                self._pump()
+            else:
+                # left in the heap, skipped when it reaches the top
+                waiter.future.cancel()
+            raise
+
+    def _next_waiter(self) -> _Waiter | None:
+        for priority in LLMPriority:
+            queue = self._queues[priority]
+            while queue and queue[0].future.done():
+                heapq.heappop(queue)
+            if queue:
+                return queue[0]
+        return None
+
+    def _pump(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._active < self.max_concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            delay = max(
+                self._requests.delay_for(1),
+                self._tokens.delay_for(waiter.tokens),
+            )
+            if delay > 0:
+                # the head keeps its place, lower priorities must not
+                # overtake it into the budget it is waiting for
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    delay, self._pump
+                )
+                return
+
+            heapq.heappop(self._queues[waiter.priority])
+            self._requests.take(1)
+            self._tokens.take(waiter.tokens)
+            self._virtual_time[waiter.priority] = waiter.finish_tag
+            self._active += 1
+            self._waits[waiter.priority].observe(
+                time.monotonic() - waiter.enqueued_at
+            )
+            waiter.future.set_result(None)
+
+    def queued(self) -> int:
+        return sum(
+            1
+            for queue in self._queues.values()
+            for waiter in queue
+            if not waiter.future.done()
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Active calls plus queue depth and wait times per priority."""
+        return {
+            "active": self._active,
+            "priorities": {
+                priority.name.lower(): {
+                    "queued": sum(
+                        1
+                        for waiter in self._queues[priority]
+                        if not waiter.future.done()
+                    ),
+                    "wait": self._waits[priority].to_dict(),
+                }
+                for priority in LLMPriority
+            },
+        }
+
+
+def estimate_tokens(
+    messages: list[dict[str, str]], max_tokens: int | None = None
+) -> int:
+    """
+    Rough cost of a call before it is made.
+
+    About four characters per prompt token, plus the completion limit
+    or ``LLM_RATE_LIMITS["default_completion_tokens"]`` when unset.
+    """
+    prompt = (
+        sum(len(str(m.get("content") or "")) for m in messages) // 4
+    )
+    completion = (
+        max_tokens
+        if max_tokens is not None
+        else LLM_RATE_LIMITS["default_completion_tokens"]
+    )
+    return prompt + completion
+
+
+_default_governor: LLMGovernor | None = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Process-wide governor shared by every ``Thinker``."""
+    global _default_governor
+    if _default_governor is None:
+        _default_governor = LLMGovernor()
+    return _default_governor
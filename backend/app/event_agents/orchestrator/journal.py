@@ -0,0 +1,540 @@
+import asyncio
+import itertools
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+)
+from uuid import UUID
+
+import msgpack
+from pydantic import BaseModel
+
+from app.event_agents.orchestrator.commands import (
+    GenerateEvaluationsCommand,
+    GeneratePerspectivesCommand,
+)
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    AnswerReceivedEvent,
+    AskQuestionEvent,
+    ErrorEvent,
+    EvaluationsGeneratedEvent,
+    MessageReceivedEvent,
+    PerspectivesGeneratedEvent,
+    WebsocketMessageEvent,
+)
+from app.event_agents.schemas.mongo_schemas import JournalEntry
+from app.types.websocket_types import WebsocketFrame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNALED_TYPES: tuple[type[BaseModel], ...] = (
+    AddToMemoryEvent,
+    AnswerReceivedEvent,
+    AskQuestionEvent,
+    ErrorEvent,
+    EvaluationsGeneratedEvent,
+    MessageReceivedEvent,
+    PerspectivesGeneratedEvent,
+    WebsocketMessageEvent,
+    GenerateEvaluationsCommand,
+    GeneratePerspectivesCommand,
+    WebsocketFrame,
+)
+
+# the events replay needs to rebuild interview state, compaction keeps
+# only these by default
+REPLAY_EVENT_TYPES: frozenset[str] = frozenset(
+    {
+        AddToMemoryEvent.__name__,
+        AskQuestionEvent.__name__,
+        EvaluationsGeneratedEvent.__name__,
+        PerspectivesGeneratedEvent.__name__,
+    }
+)
+
+
+# a record as unpacked: [type name, recorded_at, payload]
+RawRecord = list[Any]
+
+# records unpacked per worker thread hop when reading a segment
+READ_BATCH = 256
+
+
+class UnknownEventTypeError(ValueError):
+    """A record's event type is not registered with the codec."""
+
+
+class JournalRecord(NamedTuple):
+    """One journaled event, in the order the broker dispatched it."""
+
+    seq: int
+    event_type: str
+    recorded_at: float
+    event: BaseModel
+
+
+class EventCodec:
+    """
+    Compact msgpack encoding of broker events.
+
+    A record is ``[type name, recorded_at, payload]`` where the payload is
+    the event's JSON-mode dump, so decoding only needs the type registry.
+    Records can be concatenated and read back with a streaming unpacker.
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[
+            type[BaseModel]
+        ] = DEFAULT_JOURNALED_TYPES,
+    ) -> None:
+        self._types: dict[str, type[BaseModel]] = {}
+        for event_type in event_types:
+            self.register(event_type)
+
+    def register(self, event_type: type[BaseModel]) -> None:
+        self._types[event_type.__name__] = event_type
+
+    def is_registered(self, event: BaseModel) -> bool:
+        return self._types.get(event.__class__.__name__) is (
+            event.__class__
+        )
+
+    def encode(self, event: BaseModel) -> bytes:
+        """Encode a registered event, raise for any other."""
+        if not self.is_registered(event):
+            raise UnknownEventTypeError(
+                f"Unregistered event type: {event.__class__.__name__}"
+            )
+        return msgpack.packb(
+            [
+                event.__class__.__name__,
+                time.time(),
+                event.model_dump(mode="json", by_alias=True),
+            ]
+        )
+
+    def decode(self, seq: int, record: RawRecord) -> JournalRecord:
+        event_type, recorded_at, payload = record
+        model = self._types.get(event_type)
+        if model is None:
+            raise UnknownEventTypeError(
+                f"Unknown journaled event type: {event_type}"
+            )
+        return JournalRecord(
+            seq=seq,
+            event_type=event_type,
+            recorded_at=recorded_at,
+            event=model.model_validate(payload),
+        )
+
+    @staticmethod
+    def event_type_of(data: bytes) -> str:
+        """Type name of an encoded record."""
+        event_type: str = msgpack.unpackb(data)[0]
+        return event_type
+
+
+class EventJournal(ABC):
+    """
+    Append-only, per-session log of the events a broker dispatches.
+
+    ``append`` only encodes into an in-memory buffer, so it is safe to call
+    from the broker's dispatch path. Buffers are written out in batches,
+    once ``flush_bytes`` accumulate or ``flush_interval`` seconds after the
+    first buffered record, and on ``flush``.
+    """
+
+    def __init__(
+        self,
+        codec: EventCodec | None = None,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self.codec = codec or EventCodec()
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._buffers: dict[str, list[bytes]] = defaultdict(list)
+        self._buffered_bytes: dict[str, int] = defaultdict(int)
+        self._flushers: dict[str, asyncio.Task[None]] = {}
+        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def append(self, session_id: UUID, event: BaseModel) -> None:
+        """Buffer an event, events of unregistered types are skipped."""
+        if not self.codec.is_registered(event):
+            # could not be decoded on replay, journaling it would make
+            # the whole session unreadable
+            logger.debug(
+                "Event type not journaled",
+                extra={
+                    "context": {
+                        "session_id": str(session_id),
+                        "event_type": event.__class__.__name__,
+                    }
+                },
+            )
+            return
+        key = str(session_id)
+        data = self.codec.encode(event)
+        self._buffers[key].append(data)
+        self._buffered_bytes[key] += len(data)
+
+        flusher = self._flushers.get(key)
+        if flusher is None or flusher.done():
+            delay = (
+                0
+                if self._buffered_bytes[key] >= self.flush_bytes
+                else self.flush_interval
+            )
+            self._flushers[key] = asyncio.ensure_future(
+                self._flush_later(key, delay)
+            )
+
+    async def _flush_later(self, key: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._flush_key(key)
+        except Exception as e:
+            logger.error(
+                "Journal flush failed",
+                extra={"context": {"session_id": key, "error": str(e)}},
+                exc_info=True,
+            )
+
+    async def _flush_key(self, key: str) -> None:
+        async with self._locks[key]:
+            records = self._buffers.pop(key, None)
+            self._buffered_bytes.pop(key, None)
+            if records:
+                await self._write(key, records)
+
+    async def flush(self, session_id: UUID | None = None) -> None:
+        """Write out buffered records, for one session or all of them."""
+        keys = (
+            [str(session_id)]
+            if session_id is not None
+            else list(self._buffers)
+        )
+        for key in keys:
+            await self._flush_key(key)
+
+    async def close(self) -> None:
+        for flusher in self._flushers.values():
+            flusher.cancel()
+        await asyncio.gather(
+            *self._flushers.values(), return_exceptions=True
+        )
+        self._flushers.clear()
+        await self.flush()
+
+    async def read(
+        self, session_id: UUID
+    ) -> AsyncIterator[JournalRecord]:
+        """
+        Yield a session's records in dispatch order.
+
+        Records of types the codec does not know, eg written by another
+        version, are logged and skipped. ``seq`` stays the position in
+        the journal, so it skips them too.
+        """
+        await self.flush(session_id)
+        seq = 0
+        async for data in self._read(str(session_id)):
+            try:
+                record = self.codec.decode(seq, data)
+            except UnknownEventTypeError as e:
+                logger.warning(
+                    "Skipping journal record of unknown type",
+                    extra={
+                        "context": {
+                            "session_id": str(session_id),
+                            "seq": seq,
+                            "error": str(e),
+                        }
+                    },
+                )
+            else:
+                yield record
+            seq += 1
+
+    async def compact(
+        self,
+        session_id: UUID,
+        keep: Callable[[str], bool] | None = None,
+    ) -> int:
+        """
+        Drop records replay does not need and merge what is left.
+
+        Args:
+            session_id: The session to compact
+            keep: Decides by event type name which records survive,
+                defaults to the types in ``REPLAY_EVENT_TYPES``
+
+        Returns the number of records kept.
+        """
+        await self.flush(session_id)
+        async with self._locks[str(session_id)]:
+            return await self._compact(
+                str(session_id),
+                keep or REPLAY_EVENT_TYPES.__contains__,
+            )
+
+    @abstractmethod
+    async def _write(self, key: str, records: list[bytes]) -> None: ...
+
+    @abstractmethod
+    def _read(self, key: str) -> AsyncIterator[RawRecord]: ...
+
+    @abstractmethod
+    async def _compact(
+        self, key: str, keep: Callable[[str], bool]
+    ) -> int: ...
+
+
+class SegmentFileJournal(EventJournal):
+    """
+    Journal kept as numbered segment files, one directory per session.
+
+    Records are appended to the newest segment until it reaches
+    ``segment_max_bytes``, then a new one is started. Reads stream each
+    segment through a single unpacker. File IO runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        codec: EventCodec | None = None,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 0.5,
+        fsync: bool = False,
+    ) -> None:
+        super().__init__(
+            codec=codec,
+            flush_bytes=flush_bytes,
+            flush_interval=flush_interval,
+        )
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+
+    def __repr__(self) -> str:
+        return f"SegmentFileJournal(directory={str(self.directory)!r})"
+
+    def _session_dir(self, key: str) -> Path:
+        return self.directory / key
+
+    def segments(self, session_id: UUID) -> list[Path]:
+        """A session's segment files, oldest first."""
+        return self._segments(str(session_id))
+
+    def _segments(self, key: str) -> list[Path]:
+        session_dir = self._session_dir(key)
+        if not session_dir.exists():
+            return []
+        return sorted(session_dir.glob("*.seg"))
+
+    @staticmethod
+    def _segment_name(index: int) -> str:
+        return f"{index:08d}.seg"
+
+    def _write_sync(self, key: str, records: list[bytes]) -> None:
+        session_dir = self._session_dir(key)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        segments = self._segments(key)
+        if segments:
+            segment = segments[-1]
+            index = int(segment.stem)
+        else:
+            index = 0
+            segment = session_dir / self._segment_name(index)
+
+        size = segment.stat().st_size if segment.exists() else 0
+        pending = bytearray()
+        for data in records:
+            written = size + len(pending)
+            if written and written + len(data) > self.segment_max_bytes:
+                self._append_file(segment, pending)
+                index += 1
+                segment = session_dir / self._segment_name(index)
+                size = 0
+                pending = bytearray()
+            pending += data
+        self._append_file(segment, pending)
+
+    def _append_file(
+        self, segment: Path, data: bytes | bytearray
+    ) -> None:
+        if not data:
+            return
+        with open(segment, "ab") as file:
+            file.write(data)
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+    async def _write(self, key: str, records: list[bytes]) -> None:
+        await asyncio.to_thread(self._write_sync, key, records)
+
+    @staticmethod
+    def _unpack_batch(unpacker: msgpack.Unpacker) -> list[RawRecord]:
+        return list(itertools.islice(unpacker, READ_BATCH))
+
+    async def _read(self, key: str) -> AsyncIterator[RawRecord]:
+        # segments are streamed a batch of records at a time, a large
+        # one is never held in memory whole
+        for segment in self._segments(key):
+            file = await asyncio.to_thread(open, segment, "rb")
+            try:
+                unpacker = msgpack.Unpacker(file, use_list=True)
+                while batch := await asyncio.to_thread(
+                    self._unpack_batch, unpacker
+                ):
+                    for record in batch:
+                        yield record
+            finally:
+                file.close()
+
+    def _compact_sync(
+        self, key: str, keep: Callable[[str], bool]
+    ) -> int:
+        segments = self._segments(key)
+        if not segments:
+            return 0
+
+        kept = 0
+        compacted = self._session_dir(key) / "compacting.tmp"
+        with open(compacted, "wb") as file:
+            for record in self._iter_records(segments):
+                if keep(record[0]):
+                    file.write(msgpack.packb(record))
+                    kept += 1
+            file.flush()
+            os.fsync(file.fileno())
+
+        # the compacted log takes the first segment's place so it still
+        # sorts ahead of anything appended afterwards
+        os.replace(compacted, segments[0])
+        for segment in segments[1:]:
+            segment.unlink()
+        return kept
+
+    def _iter_records(
+        self, segments: list[Path]
+    ) -> Iterator[RawRecord]:
+        for segment in segments:
+            with open(segment, "rb") as file:
+                yield from msgpack.Unpacker(file, use_list=True)
+
+    async def _compact(
+        self, key: str, keep: Callable[[str], bool]
+    ) -> int:
+        return await asyncio.to_thread(self._compact_sync, key, keep)
+
+
+class MongoEventJournal(EventJournal):
+    """
+    Journal kept in the ``event_journal`` collection.
+
+    Each record is one ``JournalEntry`` carrying the encoded event, indexed
+    on ``(session_id, seq)`` for ordered reads. Buffered records are
+    written with a single ``insert_many`` per flush.
+    """
+
+    def __init__(
+        self,
+        codec: EventCodec | None = None,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 0.5,
+    ) -> None:
+        super().__init__(
+            codec=codec,
+            flush_bytes=flush_bytes,
+            flush_interval=flush_interval,
+        )
+        self._next_seq: dict[str, int] = {}
+
+    async def _write(self, key: str, records: list[bytes]) -> None:
+        session_id = UUID(key)
+        seq = self._next_seq.get(key)
+        if seq is None:
+            last = (
+                await JournalEntry.find(
+                    JournalEntry.session_id == session_id
+                )
+                .sort(-JournalEntry.seq)
+                .first_or_none()
+            )
+            seq = last.seq + 1 if last else 0
+
+        entries = []
+        for data in records:
+            entries.append(
+                JournalEntry(
+                    session_id=session_id,
+                    seq=seq,
+                    event_type=EventCodec.event_type_of(data),
+                    record=data,
+                )
+            )
+            seq += 1
+        await JournalEntry.insert_many(entries)
+        self._next_seq[key] = seq
+
+    async def _read(self, key: str) -> AsyncIterator[RawRecord]:
+        async for entry in JournalEntry.find(
+            JournalEntry.session_id == UUID(key)
+        ).sort(+JournalEntry.seq):
+            yield msgpack.unpackb(entry.record, use_list=True)
+
+    async def _compact(
+        self, key: str, keep: Callable[[str], bool]
+    ) -> int:
+        session_id = UUID(key)
+        event_types = await JournalEntry.distinct(
+            "event_type", {"session_id": session_id}
+        )
+        dropped = [name for name in event_types if not keep(name)]
+        if dropped:
+            await JournalEntry.find(
+                {
+                    "session_id": session_id,
+                    "event_type": {"$in": dropped},
+                }
+            ).delete()
+        return await JournalEntry.find(
+            JournalEntry.session_id == session_id
+        ).count()
+
+
+_default_journal: EventJournal | None = None
+
+
+def get_event_journal() -> EventJournal | None:
+    """
+    Process-wide journal selected by the ``EVENT_JOURNAL`` env var.
+
+    ``file`` writes segments under ``EVENT_JOURNAL_DIR``, ``mongo`` uses the
+    ``event_journal`` collection, anything else disables journaling.
+    """
+    global _default_journal
+    if _default_journal is None:
+        backend = os.getenv("EVENT_JOURNAL", "").lower()
+        if backend == "file":
+            _default_journal = SegmentFileJournal(
+                os.getenv("EVENT_JOURNAL_DIR", "data/journal")
+            )
+        elif backend == "mongo":
+            _default_journal = MongoEventJournal()
+    return _default_journal
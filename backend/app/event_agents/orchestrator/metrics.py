@@ -0,0 +1,104 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class LaneMetrics:
+    """Counters for one priority lane of the broker queue."""
+
+    maxsize: int
+    depth: int = 0
+    high_water: int = 0
+    enqueued: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    blocked: int = 0
+    overcommitted: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# upper bounds in milliseconds, the last bucket catches everything else
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram for one broker handler.
+
+    Observations are counted into ``LATENCY_BUCKETS_MS`` plus an
+    overflow bucket, so recording is O(buckets) and memory stays
+    constant however long the interview runs. Percentiles are
+    estimated from the bucket upper bounds.
+    """
+
+    def __init__(
+        self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS
+    ) -> None:
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.failures = 0
+        self.timeouts = 0
+
+    def observe(self, seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+        index = 0
+        while (
+            index < len(self.buckets_ms)
+            and elapsed_ms > self.buckets_ms[index]
+        ):
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                if index < len(self.buckets_ms):
+                    return min(self.buckets_ms[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound:g}ms" for bound in self.buckets_ms] + [
+            f">{self.buckets_ms[-1]:g}ms"
+        ]
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "mean_ms": self.total_ms / self.count
+            if self.count
+            else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from app.event_agents.orchestrator.commands import (
+    GenerateEvaluationsCommand,
+    GeneratePerspectivesCommand,
+)
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    AnswerProgressEvent,
+    AskQuestionEvent,
+    ErrorEvent,
+    EvaluationsGeneratedEvent,
+    MessageReceivedEvent,
+    PerspectivesGeneratedEvent,
+)
+from app.event_agents.orchestrator.queues import Lane
+from app.types.websocket_types import (
+    WebsocketFrame,
+    WebsocketFrameBatch,
+)
+
+
+@dataclass(frozen=True)
+class DispatchPolicy:
+    """
+    How the broker hands events of one type to their handlers.
+
+    Attributes:
+        ordered: Deliver events of this type one at a time, in publish
+            order. Handlers of an ordered type still run off the main
+            consumer loop, so a slow handler only delays its own type.
+        max_concurrency: Upper bound on handler invocations of this
+            type running at once. ``None`` means unbounded. Ignored for
+            ordered types, which always run one at a time.
+        lane: Priority lane the event is queued on.
+        lossy: Events of this type are safe to lose, eg progress
+            notifications. Only lossy events are dropped or coalesced
+            when their lane overflows with DROP_OLDEST or COALESCE,
+            commands and their results always wait for space.
+        coalesce_key: Maps a lossy event to the key used when its lane
+            overflows with the COALESCE policy. Events without a key
+            are never coalesced.
+        batch_type: For ordered types, the event class several queued
+            events are wrapped into, through its ``from_events``
+            classmethod, and delivered to that class's subscribers as one.
+            Batching only happens while the batch type has subscribers
+            of its own, wildcard ones do not count. Handlers they
+            replace skip the batched events, every other subscriber of
+            the type still gets each event.
+        batch_max: Most events wrapped into one batch.
+        batch_window: Seconds to wait for the rest of a burst when more
+            than one but fewer than ``batch_max`` events are queued. A
+            lone event is delivered right away.
+    """
+
+    ordered: bool = False
+    max_concurrency: int | None = None
+    lane: Lane = Lane.QUESTIONS
+    lossy: bool = False
+    coalesce_key: Callable[[Any], Hashable] | None = None
+    batch_type: type | None = None
+    batch_max: int = 1
+    batch_window: float = 0.0
+
+
+DEFAULT_DISPATCH_POLICY = DispatchPolicy()
+
+DEFAULT_DISPATCH_POLICIES: dict[type, DispatchPolicy] = {
+    # outbound frames must reach the client in the order they were sent,
+    # bursts (setup notifications, evaluations) go out as one message
+    WebsocketFrame: DispatchPolicy(
+        ordered=True,
+        lane=Lane.CONTROL,
+        batch_type=WebsocketFrameBatch,
+        batch_max=16,
+        batch_window=0.01,
+    ),
+    ErrorEvent: DispatchPolicy(lane=Lane.CONTROL),
+    # candidate input and the resulting turns are processed in order
+    MessageReceivedEvent: DispatchPolicy(
+        ordered=True, lane=Lane.CONTROL
+    ),
+    AddToMemoryEvent: DispatchPolicy(ordered=True, lane=Lane.CONTROL),
+    # each partial answer supersedes the previous one
+    AnswerProgressEvent: DispatchPolicy(
+        ordered=True,
+        lane=Lane.CONTROL,
+        lossy=True,
+        coalesce_key=lambda event: event.interview_id,
+    ),
+    AskQuestionEvent: DispatchPolicy(ordered=True, lane=Lane.QUESTIONS),
+    # background work, each handler fans out several llm calls
+    GenerateEvaluationsCommand: DispatchPolicy(
+        max_concurrency=2, lane=Lane.BACKGROUND
+    ),
+    GeneratePerspectivesCommand: DispatchPolicy(
+        max_concurrency=2, lane=Lane.BACKGROUND
+    ),
+    EvaluationsGeneratedEvent: DispatchPolicy(lane=Lane.BACKGROUND),
+    PerspectivesGeneratedEvent: DispatchPolicy(lane=Lane.BACKGROUND),
+}
@@ -0,0 +1,240 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, replace
+from enum import Enum, IntEnum
+from typing import Generic, Hashable, Mapping, NamedTuple, TypeVar
+
+from app.event_agents.orchestrator.metrics import LaneMetrics
+
+Item = TypeVar("Item")
+
+
+class Lane(IntEnum):
+    """Priority lanes, lower values are served first."""
+
+    CONTROL = 0  # outbound frames, candidate input, errors
+    QUESTIONS = 1  # question flow
+    BACKGROUND = 2  # evaluations and perspectives
+
+
+class OverflowPolicy(str, Enum):
+    """What a lane does when an event arrives while it is full."""
+
+    BLOCK = "block"  # publisher waits for space
+    DROP_OLDEST = "drop_oldest"  # oldest queued event is discarded
+    COALESCE = "coalesce"  # replace a queued event with the same key
+
+
+@dataclass(frozen=True)
+class LaneConfig:
+    """
+    Capacity and overflow behaviour of one lane.
+
+    Attributes:
+        maxsize: Maximum number of queued events, 0 means unbounded.
+        overflow: Policy applied to lossy events when the lane is full.
+            COALESCE falls back to dropping the oldest lossy event when
+            no queued event shares the incoming event's coalesce key.
+            Events not put as lossy always wait for space, whatever the
+            lane's policy, and are never dropped to make room.
+    """
+
+    maxsize: int
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+
+
+DEFAULT_LANE_CONFIGS: dict[Lane, LaneConfig] = {
+    Lane.CONTROL: LaneConfig(maxsize=512),
+    Lane.QUESTIONS: LaneConfig(maxsize=64),
+    Lane.BACKGROUND: LaneConfig(maxsize=64),
+}
+
+
+class _Entry(NamedTuple, Generic[Item]):
+    coalesce_key: Hashable | None
+    lossy: bool
+    item: Item
+
+
+class EventQueue(Generic[Item]):
+    """
+    Bounded multi-lane queue used by the broker.
+
+    Items are always taken from the highest priority non-empty lane,
+    FIFO within a lane. Mirrors the ``asyncio.Queue`` surface the broker
+    relies on (``put``/``get``/``task_done``/``join``) with a lane and
+    an optional coalesce key on ``put``.
+    """
+
+    def __init__(
+        self, lane_configs: Mapping[Lane, LaneConfig] | None = None
+    ) -> None:
+        self._configs: dict[Lane, LaneConfig] = {
+            **DEFAULT_LANE_CONFIGS,
+            **(lane_configs or {}),
+        }
+        self._lanes: dict[Lane, deque[_Entry[Item]]] = {
+            lane: deque() for lane in Lane
+        }
+        self._metrics: dict[Lane, LaneMetrics] = {
+            lane: LaneMetrics(maxsize=self._configs[lane].maxsize)
+            for lane in Lane
+        }
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: dict[Lane, deque[asyncio.Future[None]]] = {
+            lane: deque() for lane in Lane
+        }
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def qsize(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def empty(self) -> bool:
+        return not any(self._lanes.values())
+
+    def lane_config(self, lane: Lane) -> LaneConfig:
+        return self._configs[lane]
+
+    def _is_full(self, lane: Lane) -> bool:
+        maxsize = self._configs[lane].maxsize
+        return maxsize > 0 and len(self._lanes[lane]) >= maxsize
+
+    async def put(
+        self,
+        item: Item,
+        lane: Lane = Lane.QUESTIONS,
+        coalesce_key: Hashable | None = None,
+        block: bool = True,
+        lossy: bool = False,
+    ) -> None:
+        """
+        Add an item to a lane, applying the lane's overflow policy.
+
+        Args:
+            item: The event to enqueue
+            lane: The priority lane to put it on
+            coalesce_key: Identity used by the COALESCE policy
+            block: When False a full lane admits the item over capacity
+                instead of waiting. Used for publishes made by broker
+                handlers, which would otherwise deadlock against the
+                consumer that has to drain the lane.
+            lossy: The item is safe to lose. Only lossy items are
+                dropped or coalesced by the DROP_OLDEST and COALESCE
+                policies, any other item waits for space.
+        """
+        config = self._configs[lane]
+        metrics = self._metrics[lane]
+        queue = self._lanes[lane]
+
+        while self._is_full(lane):
+            if lossy and config.overflow is not OverflowPolicy.BLOCK:
+                if (
+                    config.overflow is OverflowPolicy.COALESCE
+                    and coalesce_key is not None
+                    and self._coalesce(queue, coalesce_key, item)
+                ):
+                    metrics.coalesced += 1
+                    return
+                if self._drop_oldest_lossy(queue):
+                    metrics.dropped += 1
+                    self._mark_done()
+                    break
+
+            if not block:
+                metrics.overcommitted += 1
+                break
+            metrics.blocked += 1
+            putter = asyncio.get_running_loop().create_future()
+            self._putters[lane].append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                if putter in self._putters[lane]:
+                    self._putters[lane].remove(putter)
+                if not self._is_full(lane):
+                    self._wake_next(self._putters[lane])
+                raise
+
+        queue.append(_Entry(coalesce_key, lossy, item))
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        metrics.enqueued += 1
+        metrics.high_water = max(metrics.high_water, len(queue))
+        self._wake_next(self._getters)
+
+    def _coalesce(
+        self,
+        queue: deque[_Entry[Item]],
+        coalesce_key: Hashable,
+        item: Item,
+    ) -> bool:
+        """Replace the newest lossy item sharing the key, in place."""
+        for index in range(len(queue) - 1, -1, -1):
+            entry = queue[index]
+            if entry.lossy and entry.coalesce_key == coalesce_key:
+                queue[index] = _Entry(coalesce_key, True, item)
+                return True
+        return False
+
+    def _drop_oldest_lossy(self, queue: deque[_Entry[Item]]) -> bool:
+        for index, entry in enumerate(queue):
+            if entry.lossy:
+                del queue[index]
+                return True
+        return False
+
+    def get_nowait(self) -> Item:
+        for lane in Lane:
+            queue = self._lanes[lane]
+            if queue:
+                item = queue.popleft().item
+                self._wake_next(self._putters[lane])
+                return item
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> Item:
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if getter in self._getters:
+                    self._getters.remove(getter)
+                if not self.empty():
+                    self._wake_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def _wake_next(self, waiters: deque[asyncio.Future[None]]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _mark_done(self) -> None:
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    def task_done(self) -> None:
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._mark_done()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+    def metrics(self) -> dict[str, LaneMetrics]:
+        """Snapshot of the per-lane counters, keyed by lane name."""
+        return {
+            lane.name.lower(): replace(
+                self._metrics[lane], depth=len(self._lanes[lane])
+            )
+            for lane in Lane
+        }
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from app.event_agents.orchestrator.broker import Broker
+
+logger = logging.getLogger(__name__)
+
+
+class _Shard:
+    """Sessions served by one worker task, in round-robin order."""
+
+    def __init__(self) -> None:
+        self.ready: deque["Broker"] = deque()
+        self.scheduled: set[int] = set()
+        self.sessions: set[int] = set()
+        self.wakeup = asyncio.Event()
+
+
+class BrokerRuntime:
+    """
+    Process-wide pool of consumer tasks shared by many session brokers.
+
+    Instead of every interview running its own ``_process_events`` loop,
+    brokers attached to a runtime are served by a fixed number of worker
+    tasks. A session is pinned to one worker by its ``interview_id`` so
+    its events are consumed in order, and each worker takes one event
+    per ready session per turn so a busy interview cannot starve the
+    quiet ones sharing its worker.
+    """
+
+    def __init__(self, workers: int = 8) -> None:
+        if workers < 1:
+            raise ValueError("BrokerRuntime needs at least one worker")
+        self._worker_count = workers
+        self._shards: list[_Shard] = []
+        self._tasks: list[asyncio.Task[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __repr__(self) -> str:
+        return f"BrokerRuntime(workers={self._worker_count}, sessions={sum(len(shard.sessions) for shard in self._shards)})"
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks on the running loop, once."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # first use, or the previous loop is gone (tests, reloads)
+            for task in self._tasks:
+                task.cancel()
+            self._loop = loop
+            self._shards = [_Shard() for _ in range(self._worker_count)]
+            self._tasks = [
+                loop.create_task(self._run_worker(shard))
+                for shard in self._shards
+            ]
+            logger.info("Broker runtime started: %s", self)
+            return
+
+        for index, task in enumerate(self._tasks):
+            if task.done():
+                logger.warning(
+                    "Restarting broker runtime worker %d", index
+                )
+                self._tasks[index] = loop.create_task(
+                    self._run_worker(self._shards[index])
+                )
+
+    def _shard_for(self, broker: "Broker") -> _Shard:
+        session_id = broker.session_id
+        key = (
+            session_id.int
+            if isinstance(session_id, UUID)
+            else hash(session_id)
+        )
+        return self._shards[key % self._worker_count]
+
+    def attach(self, broker: "Broker") -> None:
+        """Start serving a broker's events."""
+        self._ensure_workers()
+        self._shard_for(broker).sessions.add(id(broker))
+        self.notify(broker)
+
+    def detach(self, broker: "Broker") -> None:
+        """Stop serving a broker, queued events are left untouched."""
+        if not self._shards:
+            return
+        shard = self._shard_for(broker)
+        shard.sessions.discard(id(broker))
+        shard.scheduled.discard(id(broker))
+        if broker in shard.ready:
+            shard.ready.remove(broker)
+
+    def notify(self, broker: "Broker") -> None:
+        """Mark a broker as having events ready to be consumed."""
+        if not self._shards:
+            return
+        shard = self._shard_for(broker)
+        key = id(broker)
+        if key not in shard.sessions or key in shard.scheduled:
+            return
+        shard.scheduled.add(key)
+        shard.ready.append(broker)
+        shard.wakeup.set()
+
+    async def _run_worker(self, shard: _Shard) -> None:
+        while True:
+            if not shard.ready:
+                shard.wakeup.clear()
+                await shard.wakeup.wait()
+                continue
+
+            broker = shard.ready.popleft()
+            shard.scheduled.discard(id(broker))
+            try:
+                has_more = broker._step()
+            except Exception as e:
+                logger.error(
+                    "Broker runtime step failed",
+                    extra={
+                        "context": {
+                            "session_id": str(broker.session_id),
+                            "error": str(e),
+                        }
+                    },
+                    exc_info=True,
+                )
+                has_more = False
+
+            if has_more:
+                # back of the line, other sessions get their turn first
+                self.notify(broker)
+            # let handler tasks spawned by this step make progress
+            await asyncio.sleep(0)
+
+    async def shutdown(self) -> None:
+        """Cancel the worker tasks, attached brokers stop being served."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._shards = []
+        self._loop = None
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Sessions and ready backlog per worker."""
+        return [
+            {
+                "worker": index,
+                "sessions": len(shard.sessions),
+                "ready": len(shard.ready),
+            }
+            for index, shard in enumerate(self._shards)
+        ]
+
+
+_default_runtime: BrokerRuntime | None = None
+
+
+def get_broker_runtime() -> BrokerRuntime:
+    """Process-wide runtime shared by interview brokers."""
+    global _default_runtime
+    if _default_runtime is None:
+        _default_runtime = BrokerRuntime()
+    return _default_runtime
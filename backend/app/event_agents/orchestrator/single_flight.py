@@ -0,0 +1,109 @@
+import asyncio
+import copy
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+@dataclass
+class SingleFlightStats:
+    """Upstream calls made versus callers that joined one in flight."""
+
+    calls: int = 0
+    joined: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Flight:
+    future: "asyncio.Future[Any]"
+    waiters: int = 0
+
+
+def _copy_result(result: R) -> R:
+    if isinstance(result, BaseModel):
+        return result.model_copy(deep=True)  # type: ignore[return-value]
+    return copy.deepcopy(result)
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls sharing a key into one.
+
+    The first caller starts the call as its own task, callers arriving
+    while it runs await that same task and get its result or exception.
+    The key is released as soon as the call finishes, so later callers
+    start a fresh one. A caller being cancelled does not cancel the call
+    for the others, the call is cancelled once every caller has left.
+    Each caller gets its own deep copy of the result, so one mutating
+    it does not change what the others see.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Flight] = {}
+        self._stats = SingleFlightStats()
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(in_flight={len(self._calls)}, calls={self._stats.calls}, joined={self._stats.joined})"
+
+    async def run(
+        self, key: str, call: Callable[[], Awaitable[R]]
+    ) -> R:
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = _Flight(future=asyncio.ensure_future(call()))
+            self._calls[key] = flight
+            flight.future.add_done_callback(
+                lambda done: self._release(key, done)
+            )
+            self._stats.calls += 1
+        else:
+            self._stats.joined += 1
+            logger.debug(
+                "Joined in-flight call",
+                extra={"context": {"key": key[:12]}},
+            )
+
+        flight.waiters += 1
+        try:
+            result: R = await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.future.done():
+                # every caller was cancelled, nobody needs the result
+                flight.future.cancel()
+        return _copy_result(result)
+
+    def _release(self, key: str, done: asyncio.Future[Any]) -> None:
+        flight = self._calls.get(key)
+        if flight is not None and flight.future is done:
+            del self._calls[key]
+        if not done.cancelled():
+            # retrieved here so a call nobody waits on anymore does not
+            # log "exception was never retrieved"
+            done.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(**asdict(self._stats))
+
+
+_default_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide single flight shared by every ``Thinker``."""
+    global _default_single_flight
+    if _default_single_flight is None:
+        _default_single_flight = SingleFlight()
+    return _default_single_flight
@@ -1,12 +1,39 @@
 import logging
-from typing import Type, TypeVar
+import weakref
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    Hashable,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import instructor
+from instructor import OpenAISchema, openai_schema
+from jiter import from_json
 from openai import AsyncClient
-from openai.types.chat import ChatCompletion
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from pydantic import BaseModel
 
 from app.constants import DEBUG_CONFIG, model
+from app.event_agents.orchestrator.cache import (
+    ResponseCache,
+    cache_key,
+    get_response_cache,
+)
+from app.event_agents.orchestrator.governor import (
+    LLMGovernor,
+    LLMPriority,
+    estimate_tokens,
+    get_llm_governor,
+)
+from app.event_agents.orchestrator.single_flight import (
+    SingleFlight,
+    get_single_flight,
+)
 from app.event_agents.roles.types import RoleContext
 from app.services.llms.openai_client import openai_async_client
 
@@ -16,14 +43,109 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+def _usage_of(
+    response: ChatCompletion | ChatCompletionChunk | None,
+) -> dict[str, int] | None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+    }
+
+
+_structured_clients: "weakref.WeakKeyDictionary[AsyncClient, instructor.AsyncInstructor]" = weakref.WeakKeyDictionary()
+
+
+def structured_client(
+    client: AsyncClient,
+) -> instructor.AsyncInstructor:
+    """The instructor client patched onto ``client``, built once."""
+    patched = _structured_clients.get(client)
+    if patched is None:
+        patched = instructor.from_openai(client)
+        _structured_clients[client] = patched
+    return patched
+
+
+class _Definition:
+    """``openai_schema`` of a prepared model, computed ahead of time."""
+
+    def __init__(self, definition: dict[str, Any]) -> None:
+        self.definition = definition
+
+    def __get__(self, instance: object, owner: type) -> dict[str, Any]:
+        return self.definition
+
+
+@lru_cache(maxsize=512)
+def structured_model(response_model: type[T]) -> type[T]:
+    """
+    ``response_model`` prepared for instructor, built once per class.
+
+    Instructor wraps a plain model in a new ``OpenAISchema`` subclass
+    and rebuilds its function definition from the JSON schema on every
+    call. The subclass returned here carries that definition
+    precomputed, so instructor uses it as is.
+    """
+    prepared: Any = (
+        response_model
+        if issubclass(response_model, OpenAISchema)
+        else openai_schema(response_model)
+    )
+    model: type[T] = type(
+        prepared.__name__,
+        (prepared,),
+        {
+            "__doc__": prepared.__doc__,
+            "__module__": prepared.__module__,
+            "__annotations__": {
+                "openai_schema": ClassVar[dict[str, Any]]
+            },
+            "openai_schema": _Definition(prepared.openai_schema),
+        },
+    )
+    return model
+
+
+def _total_tokens(usage: dict[str, int] | None, fallback: int) -> int:
+    if usage is None:
+        return fallback
+    return usage["prompt_tokens"] + usage["completion_tokens"]
+
+
 class Thinker:
     debug = DEBUG_CONFIG["thinker"]
 
     def __init__(
         self,
         client: AsyncClient = openai_async_client,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        governor: LLMGovernor | None = None,
+        session_id: Hashable = None,
+        priority: LLMPriority = LLMPriority.SETUP,
     ) -> None:
         self.client = client
+        self.cache = (
+            cache if cache is not None else get_response_cache()
+        )
+        # identical requests in flight at the same time, from any
+        # interview, share one upstream call
+        self.single_flight = (
+            single_flight
+            if single_flight is not None
+            else get_single_flight()
+        )
+        # every upstream call waits for a slot from the process-wide
+        # governor, ``session_id`` is the interview it is fair-queued as
+        # and ``priority`` the class used when a call does not say
+        self.governor = (
+            governor if governor is not None else get_llm_governor()
+        )
+        self.session_id = session_id
+        self.priority = priority
         self._role_context: RoleContext | None = None
 
     @property
@@ -53,25 +175,72 @@ class Thinker:
         use_role_context: bool = True,
         debug: bool = False,
         max_tokens: int | None = None,
+        use_cache: bool = False,
+        priority: LLMPriority | None = None,
     ) -> ChatCompletion:
         # kwargs with None values are not passed to the client
         if use_role_context:
             messages = self._boost_message_context_with_role(messages)
 
-        kwargs = {
+        kwargs: dict[str, object] = {
             "messages": messages,
             "model": model,
         }
         if max_tokens is not None:
-            kwargs["max_tokens"] = max_tokens  # type: ignore
+            kwargs["max_tokens"] = max_tokens
 
-        # having to manually specify type, because kwargs unpacking breaks the type inference
-        response: ChatCompletion = (
-            await self.client.chat.completions.create(
-                **kwargs  # type: ignore
-            )
+        priority = priority if priority is not None else self.priority
+        if not use_cache:
+            return await self._complete(kwargs, priority, debug)
+
+        key = cache_key(
+            "completion", model, messages, max_tokens=max_tokens
+        )
+        return await self.single_flight.run(
+            key,
+            lambda: self._complete_cached(key, kwargs, priority, debug),
         )
 
+    async def _complete_cached(
+        self,
+        key: str,
+        kwargs: dict[str, object],
+        priority: LLMPriority,
+        debug: bool,
+    ) -> ChatCompletion:
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return ChatCompletion.model_validate(cached["value"])
+
+        response = await self._complete(kwargs, priority, debug)
+        await self.cache.set(
+            key,
+            response.model_dump(mode="json"),
+            usage=_usage_of(response),
+        )
+        return response
+
+    async def _complete(
+        self,
+        kwargs: dict[str, object],
+        priority: LLMPriority,
+        debug: bool,
+    ) -> ChatCompletion:
+        estimate = estimate_tokens(
+            kwargs["messages"],  # type: ignore
+            kwargs.get("max_tokens"),  # type: ignore
+        )
+        async with self.governor.slot(
+            priority, self.session_id, estimate
+        ) as permit:
+            # having to manually specify type, because kwargs unpacking breaks the type inference
+            response: ChatCompletion = (
+                await self.client.chat.completions.create(
+                    **kwargs  # type: ignore
+                )
+            )
+            permit.settle(_total_tokens(_usage_of(response), estimate))
+
         if self.debug and debug:
             logger.debug(response.model_dump_json(indent=4))
 
@@ -83,39 +252,240 @@ class Thinker:
         messages: list[dict[str, str]],
         debug: bool = False,
         use_role_context: bool = False,
+        use_cache: bool = False,
+        priority: LLMPriority | None = None,
     ) -> T:
         if use_role_context:
             messages = self._boost_message_context_with_role(messages)
 
-        instructor_client = instructor.from_openai(self.client)
-        extracted_structure = (
-            await instructor_client.chat.completions.create(
-                model=model,
-                response_model=pydantic_structure_to_extract,
-                messages=messages,  # type: ignore
+        priority = priority if priority is not None else self.priority
+        if not use_cache:
+            return await self._extract(
+                pydantic_structure_to_extract, messages, priority, debug
             )
+
+        key = cache_key(
+            "structured",
+            model,
+            messages,
+            response_model=pydantic_structure_to_extract,
+        )
+        return await self.single_flight.run(
+            key,
+            lambda: self._extract_cached(
+                key,
+                pydantic_structure_to_extract,
+                messages,
+                priority,
+                debug,
+            ),
         )
+
+    async def _extract_cached(
+        self,
+        key: str,
+        pydantic_structure_to_extract: Type[T],
+        messages: list[dict[str, str]],
+        priority: LLMPriority,
+        debug: bool,
+    ) -> T:
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return pydantic_structure_to_extract.model_validate(
+                cached["value"]
+            )
+
+        extracted_structure = await self._extract(
+            pydantic_structure_to_extract, messages, priority, debug
+        )
+        await self.cache.set(
+            key,
+            extracted_structure.model_dump(mode="json"),
+            usage=_usage_of(
+                getattr(extracted_structure, "_raw_response", None)
+            ),
+        )
+        return extracted_structure
+
+    async def _extract(
+        self,
+        pydantic_structure_to_extract: Type[T],
+        messages: list[dict[str, str]],
+        priority: LLMPriority,
+        debug: bool,
+    ) -> T:
+        instructor_client = structured_client(self.client)
+        estimate = estimate_tokens(messages)
+        async with self.governor.slot(
+            priority, self.session_id, estimate
+        ) as permit:
+            extracted_structure: T = (
+                await instructor_client.chat.completions.create(
+                    model=model,
+                    response_model=structured_model(
+                        pydantic_structure_to_extract
+                    ),
+                    messages=messages,  # type: ignore
+                )
+            )
+            permit.settle(
+                _total_tokens(
+                    _usage_of(
+                        getattr(
+                            extracted_structure, "_raw_response", None
+                        )
+                    ),
+                    estimate,
+                )
+            )
         if self.debug and debug:
             logger.debug(extracted_structure.model_dump_json(indent=4))
 
         return extracted_structure
 
+    async def stream_structured_response(
+        self,
+        pydantic_structure_to_extract: Type[T],
+        messages: list[dict[str, str]],
+        use_role_context: bool = False,
+        use_cache: bool = False,
+        priority: LLMPriority | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Yield the structure while it is generated, then the full one.
+
+        Every item but the last is a partial model whose fields fill in
+        as tokens arrive, the last is validated against
+        ``pydantic_structure_to_extract`` from the complete tool call
+        arguments. Shares its cache entries with
+        ``extract_structured_response``, a hit is yielded whole.
+
+        The governor slot is held until the stream ends, iterate it in
+        ``contextlib.aclosing`` so that stopping early releases it.
+        """
+        if use_role_context:
+            messages = self._boost_message_context_with_role(messages)
+
+        key = None
+        if use_cache:
+            key = cache_key(
+                "structured",
+                model,
+                messages,
+                response_model=pydantic_structure_to_extract,
+            )
+            cached = await self.cache.get(key)
+            if cached is not None:
+                yield pydantic_structure_to_extract.model_validate(
+                    cached["value"]
+                )
+                return
+
+        definition = structured_model(
+            pydantic_structure_to_extract
+        ).openai_schema
+        partial_model = (
+            cast(Any, instructor.Partial)[pydantic_structure_to_extract]
+        ).get_partial_model()
+        arguments = ""
+        last_chunk: ChatCompletionChunk | None = None
+        estimate = estimate_tokens(messages)
+        async with self.governor.slot(
+            priority if priority is not None else self.priority,
+            self.session_id,
+            estimate,
+        ) as permit:
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,  # type: ignore
+                    tools=[
+                        {"type": "function", "function": definition}
+                    ],
+                    tool_choice={
+                        "type": "function",
+                        "function": {"name": definition["name"]},
+                    },
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                async for chunk in stream:
+                    last_chunk = chunk
+                    if not chunk.choices:
+                        continue
+                    tool_calls = chunk.choices[0].delta.tool_calls
+                    if not tool_calls or not tool_calls[0].function:
+                        continue
+                    delta = tool_calls[0].function.arguments
+                    if not delta:
+                        continue
+                    arguments += delta
+                    yield partial_model.model_validate(
+                        from_json(
+                            arguments.encode(), partial_mode="on"
+                        ),
+                        strict=None,
+                    )
+            finally:
+                # the usage arrives in the last chunk, if the stream
+                # was read to the end
+                permit.settle(
+                    _total_tokens(_usage_of(last_chunk), estimate)
+                )
+
+        if not arguments:
+            raise ValueError("Structured stream ended without output")
+        extracted_structure = (
+            pydantic_structure_to_extract.model_validate_json(arguments)
+        )
+        if key is not None:
+            await self.cache.set(
+                key,
+                extracted_structure.model_dump(mode="json"),
+                usage=_usage_of(last_chunk),
+            )
+        yield extracted_structure
+
     async def think_with_tool(
         self,
         messages: list[dict[str, str]],
         tool: dict[str, str],
         debug: bool = False,
         use_role_context: bool = False,
+        priority: LLMPriority | None = None,
     ) -> ChatCompletion:
         if use_role_context:
             messages = self._boost_message_context_with_role(messages)
 
-        response = await self.client.chat.completions.create(
-            messages=messages,  # type: ignore
-            model=model,
-            tools=[{"type": "function", "function": tool}],
-        )
+        estimate = estimate_tokens(messages)
+        async with self.governor.slot(
+            priority if priority is not None else self.priority,
+            self.session_id,
+            estimate,
+        ) as permit:
+            response = await self.client.chat.completions.create(
+                messages=messages,  # type: ignore
+                model=model,
+                tools=[{"type": "function", "function": tool}],
+            )
+            permit.settle(_total_tokens(_usage_of(response), estimate))
         if self.debug and debug:
             logger.debug(response.model_dump_json(indent=4))
 
         return response
+
+
+_default_thinker: Thinker | None = None
+
+
+def get_thinker() -> Thinker:
+    """
+    Process-wide ``Thinker`` for components outside an interview.
+
+    It carries no role context and no session, interviews build their
+    own in the interview factory.
+    """
+    global _default_thinker
+    if _default_thinker is None:
+        _default_thinker = Thinker()
+    return _default_thinker
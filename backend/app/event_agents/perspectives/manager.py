@@ -36,9 +36,11 @@ class PerspectiveManager:
     ) -> None:
         """Handle the perspective command."""
         perspectives = await self.generate_perspectives(event.questions)
-        perspectives_generated_event = PerspectivesGeneratedEvent(
-            perspectives=perspectives,
-            interview_id=self.interview_context.interview_id,
+        perspectives_generated_event = (
+            PerspectivesGeneratedEvent.internal(
+                perspectives=perspectives,
+                interview_id=self.interview_context.interview_id,
+            )
         )
         await self.interview_context.broker.publish(
             perspectives_generated_event
@@ -6,6 +6,7 @@ from openai.types.chat import ChatCompletion
 
 from app.agents.dispatcher import Dispatcher
 from app.event_agents.memory.protocols import MemoryStore
+from app.event_agents.orchestrator.governor import LLMPriority
 from app.event_agents.types import InterviewContext
 from app.types.interview_concept_types import (
     QuestionAndAnswer,
@@ -86,12 +87,10 @@ class PerspectiveBase:
 
     def _get_correlation_id(self, memory_store: "MemoryStore") -> str:
         """Extract correlation ID as the most recent human websocket frame"""
-        human_frames = [
-            frame
-            for frame in memory_store.memory
-            if frame.address == "human"
-        ]
-        return human_frames[-1].correlation_id
+        human_frame = memory_store.latest_frame("human")
+        if human_frame is None:
+            raise ValueError("No human frame in memory")
+        return human_frame.correlation_id
 
     def _ensure_description_exists(self) -> None:
         """Verify perspective description is initialized"""
@@ -147,6 +146,7 @@ class PerspectiveBase:
             messages=context,
             max_tokens=200,
             debug=True,
+            priority=LLMPriority.PERSPECTIVE,
         )
 
     def _package_response(
@@ -251,6 +251,7 @@ class PerspectiveBase:
         response = await thinker.generate(
             messages=messages,
             debug=True,
+            priority=LLMPriority.PERSPECTIVE,
         )
 
         description = response.choices[0].message.content
@@ -327,7 +328,8 @@ class PerspectiveBase:
                 },
             )
 
-        messages = memory_store.extract_memory_for_generation(
+        # perspectives are built from the whole interview
+        messages = await memory_store.extract_transcript_for_generation(
             address_filter=address_filter,
             custom_user_instruction=custom_user_instruction,
         )
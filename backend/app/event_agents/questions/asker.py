@@ -1,11 +1,19 @@
 import logging
 from abc import ABC, abstractmethod
+from contextlib import aclosing
+from typing import Awaitable, Callable
 
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.orchestrator.governor import LLMPriority
+from app.event_agents.questions.speculation import QuestionSpeculator
 from app.event_agents.types import InterviewContext
 from app.types.interview_concept_types import QuestionAndAnswer
 
 logger = logging.getLogger(__name__)
 
+# receives each new piece of the question text while it is generated
+OnQuestionDelta = Callable[[str], Awaitable[None]]
+
 
 class AskingStrategy(ABC):
     def __init__(
@@ -17,13 +25,45 @@ class AskingStrategy(ABC):
         self.interview_context = interview_context
 
     @abstractmethod
-    async def get_next_question(self) -> QuestionAndAnswer | None:
+    async def get_next_question(
+        self,
+        on_delta: OnQuestionDelta | None = None,
+        direction: ProbeDirection | None = None,
+        answer: str | None = None,
+    ) -> QuestionAndAnswer | None:
+        """
+        Return the next question, None when there are no more.
+
+        Strategies that generate the question may stream its text to
+        ``on_delta`` before returning, the others ignore it.
+        ``direction`` and ``answer`` describe the turn that was just
+        completed, when there is one.
+        """
         raise NotImplementedError
 
+    def question_asked(
+        self, question: QuestionAndAnswer, direction: ProbeDirection
+    ) -> None:
+        """
+        Called once ``question`` has been published to the candidate.
+
+        ``direction`` is the probe direction already drawn for the turn
+        that answering it completes.
+        """
+
+    def answer_updated(self, partial_answer: str) -> None:
+        """Called with the candidate's answer so far, while they type."""
+
+    def close(self) -> None:
+        """Release anything still running for the interview."""
+
 
 class BaseQuestionAskingStrategy(AskingStrategy):
     async def get_next_question(
         self,
+        on_delta: OnQuestionDelta | None = None,
+        direction: ProbeDirection | None = None,
+        answer: str | None = None,
     ) -> QuestionAndAnswer | None:
         try:
             current_question = self.questions.pop(0)
@@ -35,7 +75,12 @@ class BaseQuestionAskingStrategy(AskingStrategy):
 
 
 class DynamicQuestionAskingStrategy(BaseQuestionAskingStrategy):
-    async def get_next_question(self) -> QuestionAndAnswer | None:
+    async def get_next_question(
+        self,
+        on_delta: OnQuestionDelta | None = None,
+        direction: ProbeDirection | None = None,
+        answer: str | None = None,
+    ) -> QuestionAndAnswer | None:
         store = self.interview_context.memory_store
         thinker = self.interview_context.thinker
 
@@ -47,10 +92,16 @@ class DynamicQuestionAskingStrategy(BaseQuestionAskingStrategy):
             Your central purpose is to get the information from the candidate to build up their resume.
             """
         )
-        next_question = await thinker.extract_structured_response(
-            pydantic_structure_to_extract=QuestionAndAnswer,
-            messages=context,
-        )
+        if on_delta is None:
+            next_question = await thinker.extract_structured_response(
+                pydantic_structure_to_extract=QuestionAndAnswer,
+                messages=context,
+                priority=LLMPriority.QUESTION,
+            )
+        else:
+            next_question = await self._stream_question(
+                context, on_delta
+            )
         logger.debug(
             "Next question generated",
             extra={
@@ -64,6 +115,88 @@ class DynamicQuestionAskingStrategy(BaseQuestionAskingStrategy):
         )
         return next_question
 
+    async def _stream_question(
+        self, context: list[dict[str, str]], on_delta: OnQuestionDelta
+    ) -> QuestionAndAnswer:
+        streamed = ""
+        next_question: QuestionAndAnswer | None = None
+        stream = (
+            self.interview_context.thinker.stream_structured_response(
+                QuestionAndAnswer,
+                messages=context,
+                priority=LLMPriority.QUESTION,
+            )
+        )
+        async with aclosing(stream):
+            async for partial in stream:
+                text = partial.question or ""
+                if len(text) > len(streamed) and text.startswith(
+                    streamed
+                ):
+                    await on_delta(text[len(streamed) :])
+                    streamed = text
+                next_question = partial
+        if next_question is None:
+            raise ValueError("No question generated")
+        return next_question
+
+
+class SpeculativeQuestionAskingStrategy(DynamicQuestionAskingStrategy):
+    """
+    Dynamic questions with follow-ups prepared while the candidate answers.
+
+    A prepared follow-up for the turn's probe direction that still fits
+    the answer is asked right away, otherwise the question is generated
+    as in ``DynamicQuestionAskingStrategy``.
+    """
+
+    def __init__(
+        self,
+        questions: list[QuestionAndAnswer],
+        interview_context: InterviewContext,
+    ) -> None:
+        super().__init__(questions, interview_context)
+        self.speculator = QuestionSpeculator(interview_context)
+
+    async def get_next_question(
+        self,
+        on_delta: OnQuestionDelta | None = None,
+        direction: ProbeDirection | None = None,
+        answer: str | None = None,
+    ) -> QuestionAndAnswer | None:
+        if direction is not None and answer is not None:
+            follow_up = await self.speculator.take(direction, answer)
+            if follow_up is not None:
+                logger.info(
+                    "Speculative question hit",
+                    extra={"context": {"direction": direction.value}},
+                )
+                return follow_up
+        self.speculator.cancel()
+        return await super().get_next_question(on_delta)
+
+    def question_asked(
+        self, question: QuestionAndAnswer, direction: ProbeDirection
+    ) -> None:
+        self.speculator.start(question, direction)
+
+    def answer_updated(self, partial_answer: str) -> None:
+        self.speculator.update(partial_answer)
+
+    def close(self) -> None:
+        self.speculator.cancel()
+        logger.info(
+            "Speculative questions",
+            extra={
+                "context": {
+                    "interview_id": str(
+                        self.interview_context.interview_id
+                    ),
+                    "stats": self.speculator.stats().to_dict(),
+                }
+            },
+        )
+
 
 class Prober:
     def __init__(self, parent_question: QuestionAndAnswer) -> None:
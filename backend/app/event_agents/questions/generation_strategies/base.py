@@ -49,7 +49,12 @@ class BaseQuestionGenerationStrategy(ABC):
         return questions
 
     def are_questions_gathered_in_memory(self) -> bool:
-        if self.interview_context.agent_profile.question_bank_structured:
+        agent_profile = self.interview_context.agent_profile
+        if agent_profile.question_bank_structured and (
+            agent_profile.has_fresh_artifact(
+                "question_bank", self.interview_context.interviewer
+            )
+        ):
             return True
         else:
             return False
@@ -123,8 +128,16 @@ class BaseQuestionGenerationStrategy(ABC):
         question_bank_structured = json.dumps(
             questions, cls=AgentConfigJSONEncoder
         )
-        self.interview_context.agent_profile.question_bank_structured = question_bank_structured
-        await self.interview_context.agent_profile.save()
+        # a partial update, the precomputed artifacts may have been
+        # stored since the profile was loaded
+        await self.interview_context.agent_profile.set(
+            {
+                "question_bank_structured": question_bank_structured,
+                "artifact_hashes.question_bank": self.interview_context.interviewer.artifact_hashes()[
+                    "question_bank"
+                ],
+            }
+        )
         logger.info(
             "Questions persisted",
         )
@@ -133,7 +146,7 @@ class BaseQuestionGenerationStrategy(ABC):
         self, messages: list[dict[str, str]]
     ) -> Questions:
         structured_questions = await self.interview_context.thinker.extract_structured_response(
-            Questions, messages=messages, debug=True
+            Questions, messages=messages, debug=True, use_cache=True
         )
         logger.info(
             "Structured questions generated",
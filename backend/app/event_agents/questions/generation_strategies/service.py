@@ -1,5 +1,8 @@
 import logging
 
+from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.schemas.mongo_schemas import Interviewer
+
 from .base import BaseQuestionGenerationStrategy
 
 logger = logging.getLogger(__name__)
@@ -9,41 +12,50 @@ class ServiceQuestionGenerationStrategy(BaseQuestionGenerationStrategy):
     async def prepare_question_context(
         self,
     ) -> list[dict[str, str]]:
+        question_bank = await self.generate_question_bank(
+            self.interview_context.interviewer,
+            self.interview_context.thinker,
+        )
 
-        job_description = (
-            self.interview_context.interviewer.job_description
+        #! TODO not the right place to be doing this, but ok for now refactor later
+        await self.interview_context.agent_profile.set(
+            {"question_bank": question_bank}
         )
-        rating_rubric = self.interview_context.interviewer.rating_rubric
 
-        instruction_prompt = self.build_templated_intruction_prompt(
-            job_description, rating_rubric
+        return [
+            {
+                "role": "user",
+                "content": question_bank,
+            },
+        ]
+
+    @classmethod
+    async def generate_question_bank(
+        cls, interviewer: Interviewer, thinker: Thinker
+    ) -> str:
+        """The free text question bank for an interviewer."""
+        instruction_prompt = cls.build_templated_intruction_prompt(
+            interviewer.job_description, interviewer.rating_rubric
         )
 
-        response = await self.interview_context.thinker.generate(
+        response = await thinker.generate(
             messages=[
                 {
                     "role": "user",
                     "content": instruction_prompt,
                 },
             ],
+            # built concurrently with the role context, keep the prompt
+            # independent of whether it is set yet
+            use_role_context=False,
         )
         if response.choices[0].message.content is None:
             raise ValueError("No content in response")
-        question_bank = response.choices[0].message.content
-
-        #! TODO not the right place to be doing this, but ok for now refactor later
-        self.interview_context.agent_profile.question_bank = question_bank
-        await self.interview_context.agent_profile.save()
-
-        return [
-            {
-                "role": "user",
-                "content": question_bank,
-            },
-        ]
+        return response.choices[0].message.content
 
+    @staticmethod
     def build_templated_intruction_prompt(
-        self, job_description: str, rating_rubric: str
+        job_description: str, rating_rubric: str
     ) -> str:
         return f"""
 You are an expert {job_description} who excels at guiding meaningful conversations with clients to deliver exceptional service.
@@ -3,6 +3,8 @@ import logging
 from uuid import uuid4
 
 from app.agents.dispatcher import Dispatcher
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.conversations.utils import choose_probe_direction
 from app.event_agents.interview.notifications import NotificationManager
 from app.event_agents.orchestrator.events import AskQuestionEvent
 from app.event_agents.questions.asker import AskingStrategy
@@ -31,6 +33,9 @@ class QuestionManager:
         self.interview_context = interview_context
         self.questions: list[QuestionAndAnswer] = []
         self.current_question: QuestionAndAnswer | None = None
+        # direction of the turn answering current_question completes,
+        # drawn up front so the asking strategy can prepare for it
+        self.next_direction = self._draw_direction()
         self.interviewer = interviewer
         # store the class for later instantiation
         self._question_generation_strategy_class = (
@@ -60,6 +65,12 @@ class QuestionManager:
             indent=2,
         )
 
+    @staticmethod
+    def _draw_direction() -> ProbeDirection:
+        return choose_probe_direction(
+            depth_probability=0.5, breadth_probability=0.5
+        )
+
     async def initialize(self) -> None:
         try:
             self.questions = (
@@ -78,13 +89,45 @@ class QuestionManager:
                 extra={"context": {"error": str(e)}},
             )
 
-    async def ask_next_question(self) -> None:
-        """Request and publish next question."""
+    async def ask_next_question(
+        self,
+        direction: ProbeDirection | None = None,
+        answer: str | None = None,
+    ) -> None:
+        """
+        Request and publish next question.
+
+        ``direction`` and ``answer`` describe the turn just completed and
+        are passed on to the asking strategy.
+        """
         if not self.question_asking_strategy:
             raise ValueError("Question asking strategy not initialized")
 
+        frame_id = str(uuid4())
+        correlation_id = str(uuid4())
+        streamed = ""
+
+        async def stream_delta(delta: str) -> None:
+            # the candidate sees the question while it is generated, the
+            # complete frame sent on AskQuestionEvent replaces it
+            nonlocal streamed
+            streamed += delta
+            await self.interview_context.broker.publish(
+                Dispatcher.package_delta_to_webframe(
+                    delta,
+                    streamed,
+                    "content",
+                    frame_id=frame_id,
+                    correlation_id=correlation_id,
+                )
+            )
+
         next_question = (
-            await self.question_asking_strategy.get_next_question()
+            await self.question_asking_strategy.get_next_question(
+                on_delta=stream_delta,
+                direction=direction,
+                answer=answer,
+            )
         )
 
         # this is needed, the answer processor
@@ -101,22 +144,33 @@ class QuestionManager:
         else:
             # add the question to memory
             #! this needs a CQRS
-            await self.add_questions_to_memory(next_question)
+            await self.add_questions_to_memory(next_question, frame_id)
 
+            self.next_direction = self._draw_direction()
             await self.interview_context.broker.publish(
-                AskQuestionEvent(
+                AskQuestionEvent.internal(
                     question=next_question,
                     interview_id=self.interview_context.interview_id,
+                    frame_id=frame_id,
+                    direction=self.next_direction,
                 )
             )
+            self.question_asking_strategy.question_asked(
+                next_question, self.next_direction
+            )
+
+    def answer_progress(self, partial_answer: str) -> None:
+        """Pass the candidate's answer so far to the asking strategy."""
+        if self.question_asking_strategy is not None:
+            self.question_asking_strategy.answer_updated(partial_answer)
 
     async def add_questions_to_memory(
-        self, question: QuestionAndAnswer
+        self, question: QuestionAndAnswer, frame_id: str | None = None
     ) -> None:
         """Add questions to memory."""
         question_frame = Dispatcher.package_and_transform_to_webframe(
             question.question,  # type: ignore
             "content",
-            frame_id=str(uuid4()),
+            frame_id=frame_id or str(uuid4()),
         )
         await self.interview_context.memory_store.add(question_frame)
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.constants import SPECULATION_ANSWER_GROWTH
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.orchestrator.governor import LLMPriority
+from app.event_agents.orchestrator.metrics import LatencyHistogram
+from app.event_agents.types import InterviewContext
+from app.types.interview_concept_types import QuestionAndAnswer
+
+logger = logging.getLogger(__name__)
+
+PROBE_INSTRUCTIONS = {
+    ProbeDirection.DEEPER: """
+    The candidate is answering the last question right now.
+    Prepare the follow-up question you would ask next to dig deeper into
+    the same topic: ask for specifics, reasoning, trade-offs or results.
+    It must make sense whatever the candidate ends up answering.
+    """,
+    ProbeDirection.BROADER: """
+    The candidate is answering the last question right now.
+    Prepare the next question you would ask to move on to a related but
+    different area the interview has not covered yet.
+    It must make sense whatever the candidate ends up answering.
+    """,
+}
+
+PARTIAL_ANSWER = """
+    The candidate's answer so far, they are still typing:
+    {answer}
+"""
+
+VALIDATION_PROMPT = """
+Interview question: {question}
+Candidate's answer: {answer}
+Prepared follow-up: {follow_up}
+
+Is the prepared follow-up still a natural next question after this
+answer, without repeating something the candidate already covered?
+Reply with yes or no only.
+"""
+
+
+@dataclass
+class SpeculationStats:
+    """Outcome of speculative follow-ups for one interview."""
+
+    speculated: int = 0
+    hits: int = 0
+    misses: int = 0
+    failures: int = 0
+    # generation time each hit kept off the turn, net of validation
+    saved: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def hit_rate(self) -> float:
+        taken = self.hits + self.misses
+        return self.hits / taken if taken else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "speculated": self.speculated,
+            "hits": self.hits,
+            "misses": self.misses,
+            "failures": self.failures,
+            "hit_rate": self.hit_rate,
+            "saved": self.saved.to_dict(),
+        }
+
+
+@dataclass
+class _Candidate:
+    question: QuestionAndAnswer
+    direction: ProbeDirection
+    # the partial answer it was generated from
+    answer: str
+    # the follow-up and the seconds it took to generate
+    task: asyncio.Task[tuple[QuestionAndAnswer, float]]
+
+
+def _retrieve(task: asyncio.Task[Any]) -> None:
+    # candidates nobody takes must not log "exception was never
+    # retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+class QuestionSpeculator:
+    """
+    Prepares the follow-up for the question being answered.
+
+    ``start`` is called once a question is asked, with the direction
+    already drawn for the turn, and generates one candidate from the
+    transcript so far while the candidate is still answering. ``update``
+    feeds in their partial answer: once it has grown by
+    ``SPECULATION_ANSWER_GROWTH`` characters since the candidate was
+    generated, the next candidate is generated from it. Only one
+    generation runs at a time. ``take`` then returns the candidate,
+    after a one-token check that the answer did not make it obsolete.
+    A rejected or failed candidate counts as a miss and the caller
+    generates the question as usual.
+    """
+
+    def __init__(self, interview_context: InterviewContext) -> None:
+        self.interview_context = interview_context
+        self._candidate: _Candidate | None = None
+        self._answer = ""
+        self._stats = SpeculationStats()
+
+    def __repr__(self) -> str:
+        return f"QuestionSpeculator(pending={self._candidate is not None}, hits={self._stats.hits}, misses={self._stats.misses})"
+
+    def start(
+        self, question: QuestionAndAnswer, direction: ProbeDirection
+    ) -> None:
+        self.cancel()
+        self._answer = ""
+        self._launch(question, direction)
+
+    def update(self, partial_answer: str) -> None:
+        """The candidate's answer so far, while they are typing."""
+        self._answer = partial_answer
+        candidate = self._candidate
+        if candidate is not None and candidate.task.done():
+            self._refresh(candidate)
+
+    def _launch(
+        self, question: QuestionAndAnswer, direction: ProbeDirection
+    ) -> None:
+        answer = self._answer
+        task = asyncio.create_task(self._generate(direction, answer))
+        task.add_done_callback(_retrieve)
+        candidate = _Candidate(
+            question=question,
+            direction=direction,
+            answer=answer,
+            task=task,
+        )
+        task.add_done_callback(lambda _: self._refresh(candidate))
+        self._candidate = candidate
+        self._stats.speculated += 1
+
+    def _refresh(self, candidate: _Candidate) -> None:
+        # regenerate from the latest partial answer once the previous
+        # generation is done and the answer has grown enough
+        if (
+            self._candidate is candidate
+            and not candidate.task.cancelled()
+            and len(self._answer) - len(candidate.answer)
+            >= SPECULATION_ANSWER_GROWTH
+        ):
+            self._launch(candidate.question, candidate.direction)
+
+    async def _generate(
+        self, direction: ProbeDirection, answer: str
+    ) -> tuple[QuestionAndAnswer, float]:
+        instruction = PROBE_INSTRUCTIONS[direction]
+        if answer:
+            instruction += PARTIAL_ANSWER.format(answer=answer)
+        context = self.interview_context.memory_store.extract_memory_for_generation(
+            custom_user_instruction=instruction
+        )
+        started = time.perf_counter()
+        candidate = await self.interview_context.thinker.extract_structured_response(
+            pydantic_structure_to_extract=QuestionAndAnswer,
+            messages=context,
+            # below the question being waited on, above evaluations
+            priority=LLMPriority.SETUP,
+        )
+        return candidate, time.perf_counter() - started
+
+    async def take(
+        self, direction: ProbeDirection, answer: str
+    ) -> QuestionAndAnswer | None:
+        """The prepared follow-up for ``direction`` if it still fits."""
+        candidate, self._candidate = self._candidate, None
+        if candidate is None:
+            return None
+        if candidate.direction != direction:
+            candidate.task.cancel()
+            return None
+
+        started = time.perf_counter()
+        try:
+            follow_up, generation_seconds = await candidate.task
+            fits = await self._still_fits(
+                candidate.question, answer, follow_up
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats.failures += 1
+            logger.warning(
+                "Speculative question failed",
+                extra={
+                    "context": {
+                        "direction": direction.value,
+                        "error": str(e),
+                    }
+                },
+            )
+            return None
+
+        if not fits:
+            self._stats.misses += 1
+            return None
+
+        self._stats.hits += 1
+        self._stats.saved.observe(
+            max(
+                0.0,
+                generation_seconds - (time.perf_counter() - started),
+            )
+        )
+        return follow_up
+
+    async def _still_fits(
+        self,
+        question: QuestionAndAnswer,
+        answer: str,
+        follow_up: QuestionAndAnswer,
+    ) -> bool:
+        response = await self.interview_context.thinker.generate(
+            messages=[
+                {
+                    "role": "user",
+                    "content": VALIDATION_PROMPT.format(
+                        question=question.question,
+                        answer=answer,
+                        follow_up=follow_up.question,
+                    ),
+                }
+            ],
+            use_role_context=False,
+            max_tokens=1,
+            priority=LLMPriority.QUESTION,
+        )
+        verdict = response.choices[0].message.content or ""
+        return verdict.strip().lower().startswith("y")
+
+    def cancel(self) -> None:
+        """Drop the candidate if it was not taken, and its llm call."""
+        candidate, self._candidate = self._candidate, None
+        if candidate is not None:
+            candidate.task.cancel()
+
+    def stats(self) -> SpeculationStats:
+        return self._stats
@@ -6,11 +6,20 @@ from pprint import pprint
 
 from pydantic import BaseModel, Field
 
-from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.orchestrator.governor import LLMPriority
+from app.event_agents.orchestrator.thinker import get_thinker
 
 logger = logging.getLogger(__name__)
 
 
+class Comparison(BaseModel):
+    better: str = Field(description="The interview that is better")
+    worse: str = Field(description="The interview that is worse")
+    reason: str = Field(
+        description="The reason for the better interview"
+    )
+
+
 class Ranker:
     def __init__(self) -> None:
         self.interviews: list[dict[str, str]] = self.load_interviews()
@@ -65,18 +74,7 @@ class Ranker:
                     },
                 )()
 
-        class Comparison(BaseModel):
-            better: str = Field(
-                description="The interview that is better"
-            )
-            worse: str = Field(
-                description="The interview that is worse"
-            )
-            reason: str = Field(
-                description="The reason for the better interview"
-            )
-
-        t = Thinker()
+        t = get_thinker()
         messages = [
             {
                 "role": "system",
@@ -90,7 +88,10 @@ class Ranker:
             },
         ]
         response = await t.extract_structured_response(
-            Comparison, messages, debug=True
+            Comparison,
+            messages,
+            debug=True,
+            priority=LLMPriority.EVALUATION,
         )
         if response is None:
             raise ValueError("No response from AI")
@@ -3,6 +3,7 @@ import logging
 from app.event_agents.orchestrator.thinker import Thinker
 from app.event_agents.roles.types import RoleContext, StructuredRole
 from app.event_agents.schemas.mongo_schemas import (
+    AgentProfile,
     Interviewer,
 )
 
@@ -10,7 +11,6 @@ from app.event_agents.schemas.mongo_schemas import (
 logger = logging.getLogger(__name__)
 
 
-
 class RoleBuilder:
     def __init__(
         self,
@@ -20,6 +20,8 @@ class RoleBuilder:
         self.interviewer = interviewer
         self.system_prompt = None
         self.thinker = thinker
+        self.structured_role: StructuredRole | None = None
+        self.role_context: RoleContext | None = None
 
     async def build(self) -> RoleContext:
         structured_role = await self._analyze_job_description()
@@ -34,6 +36,8 @@ class RoleBuilder:
             system_prompt=system_prompt,
             role_name=structured_role.role_name,
         )
+        self.structured_role = structured_role
+        self.role_context = role_context
         self.thinker.role_context = role_context
         logger.info(
             "Role context generated",
@@ -56,6 +60,7 @@ class RoleBuilder:
                         "content": self.interviewer.job_description,
                     },
                 ],
+                use_cache=True,
             )
         )
         if not structured_role:
@@ -104,5 +109,56 @@ class RoleBuilder:
         prompt = response.choices[0].message.content
         return prompt
 
-    def persist(self) -> None:
-        raise NotImplementedError
+    async def persist(self, agent_profile: AgentProfile) -> None:
+        """Store the built role on the profile, keyed by its inputs."""
+        if self.structured_role is None or self.role_context is None:
+            raise ValueError(
+                "Role must be built before it is persisted"
+            )
+
+        # a partial update, the other precomputed artifacts may be
+        # stored concurrently
+        await agent_profile.set(
+            {
+                "structured_role": self.structured_role.model_dump_json(),
+                "role_name": self.role_context.role_name,
+                "role_system_prompt": self.role_context.system_prompt,
+                "artifact_hashes.role": self.interviewer.artifact_hashes()[
+                    "role"
+                ],
+            }
+        )
+        logger.info(
+            "Role context persisted",
+            extra={
+                "context": {"role_name": self.role_context.role_name}
+            },
+        )
+
+    def load(self, agent_profile: AgentProfile) -> RoleContext | None:
+        """
+        The role stored on the profile, if it was built from the
+        current job description.
+        """
+        if not agent_profile.structured_role or (
+            not agent_profile.has_fresh_artifact(
+                "role", self.interviewer
+            )
+        ):
+            return None
+
+        self.structured_role = StructuredRole.model_validate_json(
+            agent_profile.structured_role
+        )
+        self.role_context = RoleContext(
+            system_prompt=agent_profile.role_system_prompt,
+            role_name=agent_profile.role_name,
+        )
+        self.thinker.role_context = self.role_context
+        logger.info(
+            "Role context loaded",
+            extra={
+                "context": {"role_name": self.role_context.role_name}
+            },
+        )
+        return self.role_context
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
@@ -5,6 +6,7 @@ from uuid import UUID, uuid4
 
 from beanie import Document
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 
 from app.types.websocket_types import WebsocketFrame
 
@@ -14,6 +16,22 @@ class CollectionName(str, Enum):
     CANDIDATES = "candidates"
     INTERVIEW_SESSIONS = "interview_sessions"
     AGENT_PROFILES = "agent_profiles"
+    EVENT_JOURNAL = "event_journal"
+    MEMORY_FRAMES = "memory_frames"
+
+
+# bump when the prompts building the precomputed artifacts change, so
+# stored artifacts are rebuilt
+ARTIFACTS_VERSION = 1
+
+
+def artifact_hash(*inputs: str) -> str:
+    """Content hash of the inputs an artifact is built from."""
+    digest = hashlib.sha256(str(ARTIFACTS_VERSION).encode())
+    for value in inputs:
+        digest.update(b"\0")
+        digest.update(value.encode())
+    return digest.hexdigest()
 
 
 class BehaviorMode(str, Enum):
@@ -49,15 +67,37 @@ class Interviewer(Document):
             {"interviewer_id": self.id}  # Use dictionary for query
         )
 
-        if agent_profile:
+        if isinstance(agent_profile, AgentProfile):
             # Update the agent profile
             agent_profile.job_description = self.job_description
             agent_profile.rating_rubric = self.rating_rubric
             agent_profile.behavior_mode = self.behavior_mode
             await agent_profile.save()
         else:
-            # Create a new agent profile
-            await AgentProfile.create_from_interviewer(self)
+            # No profile yet, create one
+            agent_profile = await AgentProfile.create_from_interviewer(
+                self
+            )
+
+        # imported here, the precompute pipeline depends on this module
+        from app.event_agents.interview.precompute import (
+            schedule_precompute,
+        )
+
+        schedule_precompute(self, agent_profile)
+
+    def artifact_hashes(self) -> dict[str, str]:
+        """Hash of the current inputs of each precomputed artifact."""
+        return {
+            "role": artifact_hash(self.job_description),
+            # the rubric is extracted from the job description
+            "rubric": artifact_hash(self.job_description),
+            "question_bank": artifact_hash(
+                self.job_description,
+                self.rating_rubric,
+                self.question_bank,
+            ),
+        }
 
     @classmethod
     async def get(cls, *args, **kwargs) -> Optional["Interviewer"]:  # type: ignore
@@ -81,10 +121,28 @@ class AgentProfile(Document):
     # communication_style: Optional[CommunicationStyle] = None
     question_bank_structured: str = Field(default="")
     question_bank: str = Field(default="")
+    # precomputed from the interviewer, see interview.precompute
+    structured_role: str = Field(default="")
+    role_name: str = Field(default="")
+    role_system_prompt: str = Field(default="")
+    rating_rubric_structured: str = Field(default="")
+    # evaluator definitions, see evaluations.store
+    evaluators: str = Field(default="")
+    # hash of the inputs each artifact was built from, by artifact name
+    artifact_hashes: dict[str, str] = Field(default_factory=dict)
 
     class Settings:
         name = CollectionName.AGENT_PROFILES.value
 
+    def has_fresh_artifact(
+        self, name: str, interviewer: Interviewer
+    ) -> bool:
+        """Whether artifact ``name`` was built from the current inputs."""
+        return (
+            self.artifact_hashes.get(name)
+            == interviewer.artifact_hashes()[name]
+        )
+
     @classmethod
     async def create_from_interviewer(
         cls, interviewer: Interviewer
@@ -104,7 +162,6 @@ class Candidate(Document):
     name: str
     email: str
     phone_number: str
-    memory: List[WebsocketFrame] = Field(default_factory=list)
 
     class Settings:
         name = CollectionName.CANDIDATES.value
@@ -128,8 +185,43 @@ class InterviewSession(Document):
     )
     start_time: datetime | None = None
     end_time: datetime | None = None
-    memory: List[WebsocketFrame] = Field(default_factory=list)
     max_time_allowed: int = Field(default=10 * 60)
 
     class Settings:
         name = CollectionName.INTERVIEW_SESSIONS.value
+
+
+class JournalEntry(Document):
+    """One msgpack encoded broker event of an interview session."""
+
+    session_id: UUID
+    seq: int
+    event_type: str
+    record: bytes
+
+    class Settings:
+        name = CollectionName.EVENT_JOURNAL.value
+        indexes = [
+            IndexModel(
+                [("session_id", ASCENDING), ("seq", ASCENDING)],
+                unique=True,
+            ),
+        ]
+
+
+class MemoryFrame(Document):
+    """One frame of an interview's memory, see FrameStore."""
+
+    session_id: UUID
+    seq: int
+    frame: WebsocketFrame
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = CollectionName.MEMORY_FRAMES.value
+        indexes = [
+            IndexModel(
+                [("session_id", ASCENDING), ("seq", ASCENDING)],
+                unique=True,
+            ),
+        ]
@@ -16,6 +16,8 @@ from app.event_agents.websocket_handler import Channel
 class InterviewAbilities:
     evaluations_enabled: bool = False
     perspectives_enabled: bool = False
+    # prepare follow-up questions while the candidate answers
+    speculative_questions_enabled: bool = False
 
 
 @dataclass(frozen=True)
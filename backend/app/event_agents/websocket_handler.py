@@ -6,6 +6,7 @@ import starlette.websockets
 from fastapi import WebSocket
 
 from app.event_agents.orchestrator.events import MessageReceivedEvent
+from app.types.websocket_types import WebsocketFrameBatch
 
 if TYPE_CHECKING:
     from app.event_agents.orchestrator.broker import Broker
@@ -37,6 +38,10 @@ class Channel:
             logger.error(f"Error sending message: {str(e)}")
             raise
 
+    async def send_batch(self, batch: WebsocketFrameBatch) -> None:
+        """Send several frames to the client as one message."""
+        await self.send_message(batch.model_dump_json(by_alias=True))
+
     async def receive_message(self) -> str | None:
         message_from_client = await self.websocket.receive_text()
         match message_from_client:
@@ -10,6 +10,8 @@ from app.event_agents.schemas.mongo_schemas import (
     Candidate,
     Interviewer,
     InterviewSession,
+    JournalEntry,
+    MemoryFrame,
 )
 
 load_dotenv()
@@ -30,5 +32,7 @@ async def init_db() -> None:
             Candidate,
             InterviewSession,
             AgentProfile,
+            JournalEntry,
+            MemoryFrame,
         ],
     )
@@ -54,7 +54,8 @@ class CompletionFrameChunk(BaseModel):
     )
     title: str | None = None
     index: int = 0
-    finish_reason: FinishReasonType
+    # None while the completion is still streaming
+    finish_reason: FinishReasonType | None
 
     def get_human_readable_created_ts(self) -> str:
         return datetime.fromtimestamp(self.created_ts).strftime(
@@ -74,6 +75,23 @@ class WebsocketFrame(BaseModel):
     frame: CompletionFrameChunk
 
 
+class WebsocketFrameBatch(BaseModel):
+    """Several outbound frames delivered to the client in one message."""
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+    type: Literal["batch"] = "batch"
+    frames: list[WebsocketFrame]
+
+    @classmethod
+    def from_events(
+        cls, frames: list[WebsocketFrame]
+    ) -> "WebsocketFrameBatch":
+        return cls.model_construct(type="batch", frames=frames)
+
+
 ## Old types
 
 
@@ -10,6 +10,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import router as api_v1_router
 from app.api.v2.router import router as api_v2_router
 from app.api.v3.router import router as api_v3_router
+from app.event_agents.orchestrator.journal import get_event_journal
+from app.event_agents.orchestrator.runtime import get_broker_runtime
 from app.services import setup_logging
 from app.services.database.get_mongo_dep import init_db
 
@@ -44,6 +46,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     yield
 
+    await get_broker_runtime().shutdown()
+    journal = get_event_journal()
+    if journal is not None:
+        await journal.close()
     # cleanup beanie
 
 
@@ -0,0 +1,30 @@
+# Minimal stubs for the parts of msgpack 1.1 the backend uses, the
+# package ships no type information.
+from typing import IO, Any, Callable, Iterator
+
+def packb(
+    o: Any,
+    *,
+    default: Callable[[Any], Any] | None = ...,
+    use_bin_type: bool = ...,
+) -> bytes: ...
+def unpackb(
+    packed: bytes,
+    *,
+    use_list: bool = ...,
+    raw: bool = ...,
+) -> Any: ...
+
+class Unpacker:
+    def __init__(
+        self,
+        file_like: IO[bytes] | None = ...,
+        *,
+        read_size: int = ...,
+        use_list: bool = ...,
+        raw: bool = ...,
+        max_buffer_size: int = ...,
+    ) -> None: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __next__(self) -> Any: ...
+    def feed(self, next_bytes: bytes) -> None: ...
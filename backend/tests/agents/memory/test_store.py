@@ -0,0 +1,457 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.agents.dispatcher import Dispatcher
+from app.constants import MEMORY_CONTEXT_WINDOW
+from app.event_agents.memory.stores import (
+    FrameStore,
+    InMemoryStore,
+    MongoStore,
+)
+from app.event_agents.schemas.mongo_schemas import (
+    InterviewSession,
+    MemoryFrame,
+)
+from app.types.websocket_types import AddressType, WebsocketFrame
+
+from .conftest import MockConfigProvider
+
+
+class RecordingEntity:
+    """Stands in for an ``InterviewSession``, records its updates."""
+
+    def __init__(self) -> None:
+        self.memory: list[WebsocketFrame] = []
+        self.updates: list[dict[str, Any]] = []
+        self.fail = False
+
+    async def update(self, update: dict[str, Any], **_: Any) -> None:
+        if self.fail:
+            raise ConnectionError("mongo is down")
+        self.updates.append(update)
+
+
+def make_frame(content: str) -> WebsocketFrame:
+    return Dispatcher.package_and_transform_to_webframe(
+        content,  # type: ignore
+        "content",
+        frame_id=str(uuid4()),
+    )
+
+
+def make_store(entity: RecordingEntity, **kwargs: Any) -> MongoStore:
+    return MongoStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=entity,  # type: ignore
+        **kwargs,
+    )
+
+
+def pushed(entity: RecordingEntity) -> list[list[str]]:
+    return [
+        [
+            frame["frame"]["content"]
+            for frame in update["$push"]["memory"]["$each"]
+        ]
+        for update in entity.updates
+    ]
+
+
+@pytest.mark.asyncio
+async def test_frames_are_readable_before_they_are_written() -> None:
+    entity = RecordingEntity()
+    store = make_store(entity, flush_interval=60)
+
+    await store.add(make_frame("a"))
+    await store.add(make_frame("b"))
+
+    assert [f.frame.content for f in store.get()] == ["a", "b"]
+    assert store.extract_memory_for_generation()[-1]["content"] == "b"
+    assert entity.updates == []
+
+    await store.flush()
+    assert pushed(entity) == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_by_size_and_interval() -> None:
+    entity = RecordingEntity()
+    store = make_store(entity, flush_interval=0.01, max_batch=3)
+
+    for content in "abcd":
+        await store.add(make_frame(content))
+    assert pushed(entity) == [["a", "b", "c"]]
+
+    await asyncio.sleep(0.05)
+    assert pushed(entity) == [["a", "b", "c"], ["d"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_stay_pending() -> None:
+    entity = RecordingEntity()
+    store = make_store(entity, flush_interval=60)
+    await store.add(make_frame("a"))
+
+    entity.fail = True
+    with pytest.raises(ConnectionError):
+        await store.flush()
+    await store.add(make_frame("b"))
+
+    entity.fail = False
+    await store.flush()
+    assert pushed(entity) == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_frame_store_keeps_a_tail_in_memory() -> None:
+    session = InterviewSession.model_construct(id=uuid4())
+    store = FrameStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=session,
+        tail_size=3,
+        flush_interval=60,
+    )
+
+    for content in "abcde":
+        await store.add(make_frame(content))
+
+    assert [f.frame.content for f in store.get()] == ["c", "d", "e"]
+    # every frame is still written, not just the tail
+    assert len(store._pending) == 5
+    store._cancel_timer()
+
+
+@pytest.mark.asyncio
+async def test_frame_store_transcript_includes_trimmed_frames(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = FrameStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=InterviewSession.model_construct(id=uuid4()),
+        tail_size=3,
+        flush_interval=60,
+    )
+    written: list[WebsocketFrame] = []
+
+    async def write_batch(batch: list[WebsocketFrame]) -> None:
+        written.extend(batch)
+        assert store._next_seq is not None
+        store._next_seq += len(batch)
+
+    async def load_range(
+        start: int, stop: int | None = None
+    ) -> list[WebsocketFrame]:
+        return written[start:stop]
+
+    monkeypatch.setattr(store, "_write_batch", write_batch)
+    monkeypatch.setattr(store, "load_range", load_range)
+    store._next_seq = 0
+    for content in "abcde":
+        await store.add(make_frame(content))
+
+    recent = store.extract_memory_for_generation(window=False)
+    assert [m["content"] for m in recent[1:]] == ["c", "d", "e"]
+    transcript = await store.extract_transcript_for_generation("next?")
+    assert [m["content"] for m in transcript[1:]] == [
+        *"abcde",
+        "next?",
+    ]
+
+
+class LegacySession:
+    """Stands in for the query of a session with an embedded memory."""
+
+    def __init__(self, frames: list[WebsocketFrame]) -> None:
+        self.frames = frames
+        self.updates: list[dict[str, Any]] = []
+
+    async def project(self, model: type[Any]) -> Any:
+        return model(memory=self.frames)
+
+    async def update(self, update: dict[str, Any], **_: Any) -> None:
+        self.updates.append(update)
+
+
+@pytest.mark.asyncio
+async def test_frame_store_imports_legacy_embedded_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = FrameStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=InterviewSession.model_construct(id=uuid4()),
+    )
+    session = LegacySession([make_frame("a"), make_frame("b")])
+    written: list[MemoryFrame] = []
+
+    async def read_tail() -> list[MemoryFrame]:
+        return list(reversed(written))
+
+    async def write_batch(batch: list[WebsocketFrame]) -> None:
+        assert store._next_seq is not None
+        written.extend(
+            MemoryFrame.model_construct(
+                session_id=store.session_id,
+                seq=store._next_seq + offset,
+                frame=frame,
+            )
+            for offset, frame in enumerate(batch)
+        )
+
+    monkeypatch.setattr(store, "_session", lambda: session)
+    monkeypatch.setattr(store, "_read_tail", read_tail)
+    monkeypatch.setattr(store, "_write_batch", write_batch)
+
+    await store.load()
+
+    assert [document.seq for document in written] == [0, 1]
+    assert [f.frame.content for f in store.get()] == ["a", "b"]
+    assert session.updates == [{"$unset": {"memory": ""}}]
+    assert store._next_seq == 2
+
+
+def naive_messages(
+    store: MongoStore, address_filter: list[AddressType]
+) -> list[dict[str, str]]:
+    return [
+        {"role": f.frame.role, "content": f.frame.content or ""}
+        for f in store.memory
+        if not address_filter or f.address in address_filter
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generation_views_follow_memory() -> None:
+    store = make_store(RecordingEntity(), flush_interval=60)
+    filters: list[list[AddressType]] = [[], ["human"], ["content"]]
+
+    for i in range(6):
+        frame = make_frame(str(i))
+        frame.address = "human" if i % 2 else "content"
+        await store.add(frame)
+        for address_filter in filters:
+            messages = store.extract_memory_for_generation(
+                address_filter=address_filter
+            )
+            assert messages[1:] == naive_messages(store, address_filter)
+
+    with_instruction = store.extract_memory_for_generation("next?")
+    assert with_instruction[-1] == {"role": "user", "content": "next?"}
+    assert len(store.extract_memory_for_generation()) == 7
+
+    store.memory = store.memory[:2]
+    assert store.extract_memory_for_generation()[1:] == naive_messages(
+        store, []
+    )
+    store._cancel_timer()
+
+
+@pytest.mark.asyncio
+async def test_generation_views_drop_trimmed_frames() -> None:
+    store = FrameStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=InterviewSession.model_construct(id=uuid4()),
+        tail_size=3,
+        flush_interval=60,
+    )
+    await store.add(make_frame("a"))
+    store.extract_memory_for_generation()
+
+    for content in "bcdef":
+        await store.add(make_frame(content))
+        assert [
+            m["content"]
+            for m in store.extract_memory_for_generation()[1:]
+        ] == [f.frame.content for f in store.memory]
+    store._cancel_timer()
+
+
+@pytest.mark.asyncio
+async def test_indexes_answer_lookups_by_id_correlation_and_address() -> (
+    None
+):
+    store = FrameStore(
+        agent_id=uuid4(),
+        config_provider=MockConfigProvider(),
+        entity=InterviewSession.model_construct(id=uuid4()),
+        tail_size=3,
+        flush_interval=60,
+    )
+    answer = make_frame("answer")
+    answer.address = "human"
+    evaluations = [make_frame(f"evaluation {i}") for i in range(2)]
+    for evaluation in evaluations:
+        evaluation.correlation_id = answer.correlation_id
+
+    await store.add(answer)
+    for evaluation in evaluations:
+        await store.add(evaluation)
+
+    assert store.find_parent_frame(answer.frame) is answer
+    assert store.latest_frame("human") is answer
+    assert store.latest_frame("content") is evaluations[-1]
+    assert store.frames_for_correlation(answer.correlation_id) == [
+        answer,
+        *evaluations,
+    ]
+
+    # dropped from the tail, dropped from the indexes
+    await store.add(make_frame("question"))
+    assert store.find_parent_frame(answer.frame) is None
+    assert store.latest_frame("human") is None
+    assert store.frames_for_correlation(answer.correlation_id) == (
+        evaluations
+    )
+
+    store.memory = [answer]
+    assert store.latest_frame("human") is answer
+    assert store.latest_frame("content") is None
+    store._cancel_timer()
+
+
+class RecordingSummarizer:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def __call__(
+        self, summary: str, messages: list[dict[str, str]]
+    ) -> str:
+        self.calls.append([m["content"] for m in messages])
+        return summary + "".join(m["content"][0] for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_context_window_summarizes_older_turns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(MEMORY_CONTEXT_WINDOW, "summary_tokens", 0)
+    monkeypatch.setitem(
+        MEMORY_CONTEXT_WINDOW, "summary_chunk_tokens", 20
+    )
+    store = make_store(RecordingEntity(), flush_interval=60)
+    # the system prompt is 2 tokens, every turn 10
+    for i in range(6):
+        await store.add(make_frame(str(i) * 40))
+    assert len(store.extract_memory_for_generation()) == 7
+
+    # without a summarizer the older turns are left out
+    windowed = store.extract_memory_for_generation(token_budget=32)
+    assert [m["content"][0] for m in windowed[1:]] == ["3", "4", "5"]
+
+    summarizer = RecordingSummarizer()
+    store.summarizer = summarizer
+    store.token_budget = 32
+    # sent verbatim until the summary covers them
+    assert len(store.extract_memory_for_generation()) == 7
+    await asyncio.sleep(0)
+    assert summarizer.calls == [["0" * 40, "1" * 40, "2" * 40]]
+
+    windowed = store.extract_memory_for_generation()
+    assert windowed[1]["content"].endswith("012")
+    assert [m["content"][0] for m in windowed[2:]] == ["3", "4", "5"]
+
+    # the summary is extended a chunk at a time
+    await store.add(make_frame("6" * 40))
+    assert len(store.extract_memory_for_generation()) == 6
+    await store.add(make_frame("7" * 40))
+    store.extract_memory_for_generation()
+    await asyncio.sleep(0)
+    assert summarizer.calls[1:] == [["3" * 40, "4" * 40]]
+    windowed = store.extract_memory_for_generation()
+    assert windowed[1]["content"].endswith("01234")
+    assert len(windowed) == 5
+
+    # opting out of the window returns every turn
+    full = store.extract_memory_for_generation(window=False)
+    assert [m["content"][0] for m in full[1:]] == list("01234567")
+    store._cancel_timer()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_a_running_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(MEMORY_CONTEXT_WINDOW, "summary_tokens", 0)
+    monkeypatch.setitem(
+        MEMORY_CONTEXT_WINDOW, "summary_chunk_tokens", 20
+    )
+    cancelled = asyncio.Event()
+
+    async def hanging(
+        summary: str, messages: list[dict[str, str]]
+    ) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return summary
+
+    entity = RecordingEntity()
+    store = make_store(entity, flush_interval=60)
+    store.summarizer = hanging
+    store.token_budget = 32
+    for i in range(6):
+        await store.add(make_frame(str(i) * 40))
+    store.extract_memory_for_generation()
+    await asyncio.sleep(0)
+
+    await store.close()
+
+    assert cancelled.is_set()
+    assert not store._summaries
+    # pending frames are still written
+    assert pushed(entity) == [[str(i) * 40 for i in range(6)]]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_rebuilds_from_its_journal(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "memory.ndjson"
+    store = InMemoryStore(
+        config_provider=MockConfigProvider(),
+        path=path,
+        flush_interval=60,
+        max_batch=2,
+    )
+    for content in "abc":
+        await store.add(make_frame(content))
+    # a batch of two is written, the third frame is pending
+    assert len(path.read_text().splitlines()) == 2
+    await store.flush()
+    assert len(path.read_text().splitlines()) == 3
+
+    # a crash mid-append leaves a partial last line behind
+    with open(path, "a") as file:
+        file.write('{"frame": {"con')
+    loaded = InMemoryStore(
+        config_provider=MockConfigProvider(), path=path
+    )
+    await loaded.load()
+    assert [f.frame.content for f in loaded.get()] == ["a", "b", "c"]
+    await loaded.add(make_frame("d"))
+    await loaded.flush()
+
+    reloaded = InMemoryStore(
+        config_provider=MockConfigProvider(), path=path
+    )
+    await reloaded.load()
+    assert [f.frame.content for f in reloaded.get()] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+    await reloaded.clear()
+    assert reloaded.get() == []
+    assert path.read_text() == ""
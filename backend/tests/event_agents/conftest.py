@@ -0,0 +1,54 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.event_agents.schemas.mongo_schemas import (
+    AgentProfile,
+    Interviewer,
+)
+
+
+def make_interviewer(
+    job_description: str = "Backend engineer, Python",
+) -> Interviewer:
+    """An interviewer built without Mongo, with nothing precomputed."""
+    interviewer: Interviewer = Interviewer.model_construct(
+        id=uuid4(),
+        job_description=job_description,
+        rating_rubric="Depth of answers",
+        question_bank="",
+    )
+    return interviewer
+
+
+def make_profile() -> AgentProfile:
+    """An empty profile, pair with ``local_profile_updates``."""
+    profile: AgentProfile = AgentProfile.model_construct(
+        structured_role="",
+        role_name="",
+        role_system_prompt="",
+        rating_rubric_structured="",
+        question_bank="",
+        question_bank_structured="",
+        evaluators="",
+        artifact_hashes={},
+    )
+    return profile
+
+
+@pytest.fixture
+def local_profile_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Apply ``AgentProfile.set`` updates in memory instead of Mongo."""
+
+    async def set(
+        self: AgentProfile, expression: dict[str, Any], **_: Any
+    ) -> AgentProfile:
+        for key, value in expression.items():
+            if key.startswith("artifact_hashes."):
+                self.artifact_hashes[key.split(".", 1)[1]] = value
+            else:
+                setattr(self, key, value)
+        return self
+
+    monkeypatch.setattr(AgentProfile, "set", set)
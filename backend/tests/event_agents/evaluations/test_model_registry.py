@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from app.event_agents.evaluations.model_registry import (
+    EvaluationModelRegistry,
+    schema_hash,
+)
+from app.event_agents.evaluations.rating_rubric_evaluator import (
+    CandidateEvaluationCriteria,
+    CandidateEvaluationRubric,
+    RatingRubricEvaluationBuilder,
+)
+from app.event_agents.memory.json_decoders import AgentConfigJSONDecoder
+
+
+def rubric(description: str) -> CandidateEvaluationRubric:
+    return CandidateEvaluationRubric(
+        ratings=[
+            CandidateEvaluationCriteria(
+                criteria="Depth",
+                description=description,
+                rating_scale=["1", "2", "3", "4", "5"],
+            )
+        ]
+    )
+
+
+def test_schema_hash_ignores_key_order() -> None:
+    assert schema_hash({"a": 1, "b": {"c": 2, "d": 3}}) == schema_hash(
+        {"b": {"d": 3, "c": 2}, "a": 1}
+    )
+    assert schema_hash({"a": 1}) != schema_hash({"a": 2})
+
+
+def test_registry_builds_each_schema_once() -> None:
+    registry = EvaluationModelRegistry(maxsize=1)
+    built = []
+
+    def create() -> type[BaseModel]:
+        built.append(1)
+        return create_model("Model")
+
+    first = registry.get_or_create({"title": "A"}, create)
+    assert registry.get_or_create({"title": "A"}, create) is first
+    registry.get_or_create({"title": "B"}, create)
+    assert len(registry) == 1
+    assert len(built) == 2
+    assert registry.stats().to_dict() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_identical_rubrics_share_one_model() -> None:
+    builder = RatingRubricEvaluationBuilder(
+        interviewer=None,  # type: ignore
+        thinker=object(),  # type: ignore
+    )
+    first = await builder.build_evaluation_pydantic_model(
+        rubric("How deep the answers go")
+    )
+    second = await builder.build_evaluation_pydantic_model(
+        rubric("How deep the answers go")
+    )
+    other = await builder.build_evaluation_pydantic_model(
+        rubric("How far the answers go")
+    )
+
+    assert second is first
+    assert other is not first
+    assert first.model_fields["depth"].description == (
+        "How deep the answers go"
+    )
+
+
+def test_decoded_evaluators_share_one_model() -> None:
+    state = json.dumps(
+        {
+            "evaluators": {
+                "Rubric Evaluator": {
+                    "title": "DynamicEvaluationModel",
+                    "type": "object",
+                    "properties": {
+                        "depth": {
+                            "title": "Depth",
+                            "type": "string",
+                            "description": "How deep the answers go",
+                        }
+                    },
+                    "required": ["depth"],
+                }
+            }
+        }
+    )
+    first = json.loads(state, cls=AgentConfigJSONDecoder)["evaluators"]
+    second = json.loads(state, cls=AgentConfigJSONDecoder)["evaluators"]
+
+    assert (
+        second["Rubric Evaluator"].evaluation_schema
+        is first["Rubric Evaluator"].evaluation_schema
+    )
@@ -0,0 +1,53 @@
+import pytest
+from pydantic import BaseModel, Field
+
+from app.event_agents.evaluations.evaluator_base import (
+    EvaluatorSimple,
+    EvaluatorStructured,
+)
+from app.event_agents.evaluations.evaluators import relevance_evaluator
+from app.event_agents.evaluations.store import EvaluatorStore
+
+from tests.event_agents.conftest import make_interviewer, make_profile
+
+
+class RubricEvaluation(BaseModel):
+    depth: str = Field(description="How deep the answers go")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("local_profile_updates")
+async def test_evaluators_round_trip_through_the_profile() -> None:
+    interviewer = make_interviewer()
+    profile = make_profile()
+    await EvaluatorStore().save(
+        interviewer,
+        profile,
+        {
+            "Rubric Evaluator": EvaluatorStructured(RubricEvaluation),
+            "Relevance Evaluator": relevance_evaluator,
+        },
+    )
+
+    # another worker, nothing decoded yet
+    store = EvaluatorStore()
+    evaluators = store.load(interviewer, profile)
+    assert evaluators is not None
+    rubric = evaluators["Rubric Evaluator"]
+    assert isinstance(rubric, EvaluatorStructured)
+    assert list(rubric.evaluation_schema.model_fields) == ["depth"]
+    assert isinstance(
+        evaluators["Relevance Evaluator"], EvaluatorSimple
+    )
+
+    # later interviews share the decoded evaluators
+    again = store.load(interviewer, profile)
+    assert again is not None
+    assert again["Rubric Evaluator"] is rubric
+    again.pop("Rubric Evaluator")
+    assert "Rubric Evaluator" in (
+        store.load(interviewer, profile) or {}
+    )
+
+    interviewer.job_description = "Frontend engineer, TypeScript"
+    assert store.load(interviewer, profile) is None
@@ -0,0 +1,109 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.interview.lifecycle_manager import (
+    InterviewLifecyceManager,
+)
+from app.event_agents.orchestrator.broker import Broker
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    ErrorEvent,
+)
+from app.event_agents.orchestrator.governor import LLMGovernor
+from app.event_agents.orchestrator.journal import SegmentFileJournal
+
+
+class BufferedStore:
+    """Stands in for a write-behind memory store with pending frames."""
+
+    def __init__(self) -> None:
+        self.pending = ["a", "b"]
+        self.written: list[str] = []
+        self.flushed = asyncio.Event()
+
+    async def close(self) -> None:
+        await asyncio.sleep(0)  # the write
+        self.written.extend(self.pending)
+        self.pending.clear()
+        self.flushed.set()
+
+
+async def noop() -> None:
+    pass
+
+
+def make_lifecycle_manager(
+    broker: Broker, store: BufferedStore
+) -> InterviewLifecyceManager:
+    interview_context = SimpleNamespace(
+        interview_id=broker.session_id,
+        broker=broker,
+        memory_store=store,
+        thinker=SimpleNamespace(
+            governor=LLMGovernor(), session_id=uuid4()
+        ),
+    )
+    return InterviewLifecyceManager(
+        interview_context=interview_context,  # type: ignore
+        question_manager=SimpleNamespace(  # type: ignore
+            question_asking_strategy=None
+        ),
+        time_manager=None,  # type: ignore
+        evaluation_manager=None,
+        perspective_manager=None,
+        setup_subscribers=noop,
+        setup_command_subscribers=noop,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stopping_from_a_handler_still_flushes_memory() -> None:
+    broker = Broker()
+    store = BufferedStore()
+    lifecycle_manager = make_lifecycle_manager(broker, store)
+
+    async def stop_on_error(event: ErrorEvent) -> None:
+        await lifecycle_manager.stop()
+
+    await broker.subscribe(ErrorEvent, stop_on_error)
+    await broker.start()
+    await broker.publish(
+        ErrorEvent(error="upstream failed", interview_id=uuid4())
+    )
+
+    await asyncio.wait_for(store.flushed.wait(), timeout=1)
+    assert store.written == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_stopping_compacts_the_journal(tmp_path: Path) -> None:
+    journal = SegmentFileJournal(tmp_path)
+    session_id = uuid4()
+    broker = Broker(session_id=session_id, journal=journal)
+    lifecycle_manager = make_lifecycle_manager(broker, BufferedStore())
+    await broker.start()
+    answer = AddToMemoryEvent(
+        frame=Dispatcher.package_and_transform_to_webframe(
+            "Because",  # type: ignore
+            "content",
+            frame_id=str(uuid4()),
+        ),
+        interview_id=session_id,
+    )
+    for event in (
+        ErrorEvent(error="retry", interview_id=session_id),
+        answer,
+    ):
+        await broker.publish(event)
+        await broker.join()
+
+    await lifecycle_manager.stop()
+
+    records = [record async for record in journal.read(session_id)]
+    assert [record.event for record in records] == [answer]
+    await journal.close()
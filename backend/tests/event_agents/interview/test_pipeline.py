@@ -0,0 +1,96 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+
+from app.event_agents.interview.pipeline import (
+    Pipeline,
+    Stage,
+    StageTiming,
+)
+
+
+def sleeper(
+    seconds: float, result: str, log: list[str]
+) -> Callable[[], Awaitable[str]]:
+    async def run() -> str:
+        log.append(f"start {result}")
+        await asyncio.sleep(seconds)
+        log.append(f"end {result}")
+        return result
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently() -> None:
+    log: list[str] = []
+    done: list[StageTiming] = []
+
+    async def record(timing: StageTiming) -> None:
+        done.append(timing)
+
+    pipeline = Pipeline(
+        [
+            Stage(
+                "first_question",
+                sleeper(0, "first_question", log),
+                after=("questions", "role"),
+            ),
+            Stage("questions", sleeper(0.05, "questions", log)),
+            Stage("role", sleeper(0.05, "role", log)),
+        ],
+        on_stage_done=record,
+    )
+
+    results = await pipeline.run()
+
+    # both started before either finished
+    assert sorted(log[:2]) == ["start questions", "start role"]
+    assert results == {
+        "questions": "questions",
+        "role": "role",
+        "first_question": "first_question",
+    }
+    assert log[-2:] == ["start first_question", "end first_question"]
+    assert [timing.name for timing in done][-1] == "first_question"
+    assert pipeline.timings["first_question"].started_at >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_the_rest() -> None:
+    log: list[str] = []
+
+    async def fail() -> None:
+        raise RuntimeError("rubric extraction failed")
+
+    pipeline = Pipeline(
+        [
+            Stage("rubric", fail),
+            Stage("role", sleeper(1, "role", log)),
+            Stage(
+                "first_question",
+                sleeper(0, "q", log),
+                after=("rubric",),
+            ),
+        ]
+    )
+
+    with pytest.raises(RuntimeError):
+        await pipeline.run()
+    assert "end role" not in log
+    assert "start q" not in log
+
+
+def test_unknown_dependencies_and_cycles_are_rejected() -> None:
+    async def noop() -> None: ...
+
+    with pytest.raises(ValueError):
+        Pipeline([Stage("a", noop, after=("b",))])
+    with pytest.raises(ValueError):
+        Pipeline(
+            [
+                Stage("a", noop, after=("b",)),
+                Stage("b", noop, after=("a",)),
+            ]
+        )
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+
+from app.event_agents.interview import precompute
+from app.event_agents.interview.precompute import (
+    InterviewerArtifacts,
+    schedule_precompute,
+)
+from app.event_agents.orchestrator.cache import ResponseCache
+from app.event_agents.orchestrator.governor import LLMGovernor
+from app.event_agents.orchestrator.single_flight import SingleFlight
+from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.roles.manager import RoleBuilder
+
+from tests.event_agents.conftest import make_interviewer, make_profile
+from tests.event_agents.orchestrator.conftest import StubCompletions
+
+# one reply that validates as a role, a rubric and a question bank
+TOOL_ARGUMENTS = {
+    "role_name": "Backend Engineer",
+    "responsibilities": ["build services"],
+    "qualifications": [],
+    "expertise": [],
+    "personality": [],
+    "technical_skills": ["python"],
+    "soft_skills": [],
+    "ratings": [
+        {
+            "criteria": "Depth",
+            "description": "How deep the answers go",
+            "rating_scale": ["1", "2", "3", "4", "5"],
+        }
+    ],
+    "questions": [
+        {
+            "question": "Describe a system you built.",
+            "sample_answer": "",
+            "options": "",
+        }
+    ],
+}
+
+
+def make_thinker(completions: StubCompletions) -> Thinker:
+    client = AsyncOpenAI(api_key="sk-test")
+    client.chat.completions.create = completions.create  # type: ignore
+    return Thinker(
+        client=client,
+        cache=ResponseCache(),
+        single_flight=SingleFlight(),
+        governor=LLMGovernor(),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("local_profile_updates")
+async def test_refresh_stores_artifacts_until_inputs_change() -> None:
+    completions = StubCompletions()
+    completions.tool_arguments = TOOL_ARGUMENTS
+    completions.content = "You are a backend engineer."
+    interviewer = make_interviewer("Backend engineer, Python")
+    profile = make_profile()
+
+    artifacts = InterviewerArtifacts(
+        interviewer, profile, make_thinker(completions)
+    )
+    assert artifacts.stale() == ["role", "rubric", "question_bank"]
+    await artifacts.refresh()
+    calls = completions.calls
+
+    assert artifacts.stale() == []
+    assert profile.role_name == "Backend Engineer"
+    assert "python" in profile.structured_role
+    assert profile.question_bank_structured
+
+    # connect time reads what was stored, without calling the model
+    thinker = make_thinker(completions)
+    connect = InterviewerArtifacts(interviewer, profile, thinker)
+    role = await connect.role()
+    rubric = await connect.rubric()
+    questions = await connect.question_bank()
+    assert completions.calls == calls
+    assert role.system_prompt == "You are a backend engineer."
+    assert thinker.role_context == role
+    assert rubric.ratings[0].criteria == "Depth"
+    assert questions.questions[0].question == (
+        "Describe a system you built."
+    )
+
+    interviewer.rating_rubric = "Clarity of answers"
+    assert artifacts.stale() == ["question_bank"]
+    interviewer.job_description = "Frontend engineer, TypeScript"
+    assert artifacts.stale() == ["role", "rubric", "question_bank"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("local_profile_updates")
+async def test_role_is_loaded_only_for_the_same_job_description() -> (
+    None
+):
+    completions = StubCompletions()
+    completions.tool_arguments = TOOL_ARGUMENTS
+    interviewer = make_interviewer("Backend engineer, Python")
+    profile = make_profile()
+
+    builder = RoleBuilder(interviewer, make_thinker(completions))
+    with pytest.raises(ValueError):
+        await builder.persist(profile)
+    assert builder.load(profile) is None
+
+    await builder.build()
+    await builder.persist(profile)
+    loaded = RoleBuilder(interviewer, make_thinker(completions))
+    assert loaded.load(profile) == builder.role_context
+    assert loaded.structured_role is not None
+    assert builder.structured_role is not None
+    assert (
+        loaded.structured_role.model_dump()
+        == builder.structured_role.model_dump()
+    )
+
+    interviewer.job_description = "Frontend engineer, TypeScript"
+    assert (
+        RoleBuilder(interviewer, make_thinker(completions)).load(
+            profile
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_precompute_restarts_when_inputs_change_while_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started: list[str] = []
+
+    async def slow_precompute(artifacts: InterviewerArtifacts) -> None:
+        started.append(artifacts.interviewer.job_description)
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(precompute, "_precompute", slow_precompute)
+    interviewer = make_interviewer("Backend engineer, Python")
+    profile = make_profile()
+
+    first = schedule_precompute(interviewer, profile)
+    await asyncio.sleep(0)
+    # saved again without changing the inputs
+    assert schedule_precompute(interviewer, profile) is first
+
+    interviewer.job_description = "Frontend engineer, TypeScript"
+    second = schedule_precompute(interviewer, profile)
+    assert first is not None and second is not None
+    assert second is not first
+    await asyncio.sleep(0)
+    assert first.cancelled()
+
+    second.cancel()
+    await asyncio.gather(second, return_exceptions=True)
+    await asyncio.sleep(0)  # done callbacks
+    assert started == [
+        "Backend engineer, Python",
+        "Frontend engineer, TypeScript",
+    ]
+    assert interviewer.id not in precompute._running
@@ -0,0 +1,165 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from openai import AsyncOpenAI
+
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.orchestrator.cache import ResponseCache
+from app.event_agents.orchestrator.governor import LLMGovernor
+from app.event_agents.orchestrator.single_flight import SingleFlight
+from app.event_agents.orchestrator.thinker import Thinker
+from app.event_agents.questions.asker import (
+    SpeculativeQuestionAskingStrategy,
+)
+from app.types.interview_concept_types import QuestionAndAnswer
+
+from tests.event_agents.orchestrator.conftest import StubCompletions
+
+FOLLOW_UP = {
+    "question": "What would you change about that design today?",
+    "sample_answer": "",
+    "options": "",
+}
+
+
+class TranscriptStore:
+    def __init__(self) -> None:
+        self.instructions: list[str | None] = []
+
+    def extract_memory_for_generation(
+        self, custom_user_instruction: str | None = None, **_: object
+    ) -> list[dict[str, str]]:
+        self.instructions.append(custom_user_instruction)
+        return [
+            {
+                "role": "assistant",
+                "content": "Describe a system you built.",
+            },
+            {"role": "user", "content": custom_user_instruction or ""},
+        ]
+
+
+def make_strategy(
+    completions: StubCompletions, store: TranscriptStore | None = None
+) -> SpeculativeQuestionAskingStrategy:
+    client = AsyncOpenAI(api_key="sk-test")
+    client.chat.completions.create = completions.create  # type: ignore
+    thinker = Thinker(
+        client=client,
+        cache=ResponseCache(),
+        single_flight=SingleFlight(),
+        governor=LLMGovernor(),
+    )
+    interview_context = SimpleNamespace(
+        interview_id=uuid4(),
+        memory_store=store or TranscriptStore(),
+        thinker=thinker,
+    )
+    return SpeculativeQuestionAskingStrategy(
+        questions=[],
+        interview_context=interview_context,  # type: ignore
+    )
+
+
+def asked() -> QuestionAndAnswer:
+    return QuestionAndAnswer(
+        question="Describe a system you built.",
+        sample_answer="",
+        options="",
+    )
+
+
+@pytest.mark.asyncio
+async def test_prepared_follow_up_is_asked_when_it_still_fits() -> None:
+    completions = StubCompletions()
+    completions.tool_arguments = FOLLOW_UP
+    completions.content = "yes"
+    strategy = make_strategy(completions)
+
+    strategy.question_asked(asked(), ProbeDirection.DEEPER)
+    await asyncio.sleep(0.01)  # the candidate is typing
+    question = await strategy.get_next_question(
+        direction=ProbeDirection.DEEPER, answer="A billing pipeline."
+    )
+
+    assert question is not None
+    assert question.question == FOLLOW_UP["question"]
+    stats = strategy.speculator.stats()
+    assert (stats.speculated, stats.hits, stats.misses) == (1, 1, 0)
+    assert stats.saved.count == 1
+    # only the turn's direction was prepared, plus one validation
+    assert completions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_follow_up_is_regenerated() -> None:
+    completions = StubCompletions()
+    completions.tool_arguments = FOLLOW_UP
+    completions.content = "no"
+    strategy = make_strategy(completions)
+
+    strategy.question_asked(asked(), ProbeDirection.BROADER)
+    question = await strategy.get_next_question(
+        direction=ProbeDirection.BROADER, answer="A billing pipeline."
+    )
+
+    assert question is not None
+    stats = strategy.speculator.stats()
+    assert (stats.hits, stats.misses) == (0, 1)
+    assert stats.hit_rate == 0.0
+    strategy.close()
+
+
+@pytest.mark.asyncio
+async def test_follow_up_is_regenerated_from_the_partial_answer() -> (
+    None
+):
+    completions = StubCompletions()
+    completions.tool_arguments = FOLLOW_UP
+    completions.delay = 0.01
+    store = TranscriptStore()
+    strategy = make_strategy(completions, store)
+
+    strategy.question_asked(asked(), ProbeDirection.DEEPER)
+    # arrives while the first candidate is generated
+    strategy.answer_updated("A billing pipeline. " * 20)
+    await asyncio.sleep(0.05)
+    # not enough new text to generate again
+    strategy.answer_updated("A billing pipeline. " * 21)
+    await asyncio.sleep(0.05)
+
+    stats = strategy.speculator.stats()
+    assert stats.speculated == 2
+    assert completions.calls == 2
+    assert "A billing pipeline." not in (store.instructions[0] or "")
+    assert "A billing pipeline." in (store.instructions[1] or "")
+    strategy.close()
+
+
+class HangingCompletions(StubCompletions):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = asyncio.Event()
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+@pytest.mark.asyncio
+async def test_dropping_the_follow_up_cancels_its_llm_call() -> None:
+    completions = HangingCompletions()
+    strategy = make_strategy(completions)
+
+    strategy.question_asked(asked(), ProbeDirection.DEEPER)
+    await asyncio.sleep(0.01)
+    strategy.close()
+
+    await asyncio.wait_for(completions.cancelled.wait(), timeout=1)
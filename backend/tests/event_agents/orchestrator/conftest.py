@@ -0,0 +1,120 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+import pytest
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+
+def make_completion(
+    content: str | None = None,
+    tool_arguments: dict[str, Any] | None = None,
+    tool_name: str = "extract",
+) -> ChatCompletion:
+    message: dict[str, Any] = {"role": "assistant", "content": content}
+    if tool_arguments is not None:
+        message["tool_calls"] = [
+            {
+                "id": f"call_{uuid4().hex}",
+                "type": "function",
+                "function": {
+                    "name": tool_name,
+                    "arguments": json.dumps(tool_arguments),
+                },
+            }
+        ]
+    return ChatCompletion.model_validate(
+        {
+            "id": f"chatcmpl-{uuid4().hex}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "stub",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": message,
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 100,
+                "completion_tokens": 20,
+                "total_tokens": 120,
+            },
+        }
+    )
+
+
+async def stream_tool_call(
+    tool_arguments: dict[str, Any], tool_name: str, piece: int = 8
+) -> AsyncIterator[ChatCompletionChunk]:
+    """The arguments of one tool call, streamed ``piece`` characters at a time."""
+    arguments = json.dumps(tool_arguments)
+    completion_id = f"chatcmpl-{uuid4().hex}"
+    for start in range(0, len(arguments), piece):
+        tool_call: dict[str, Any] = {
+            "index": 0,
+            "function": {"arguments": arguments[start : start + piece]},
+        }
+        if start == 0:
+            tool_call.update(id=f"call_{uuid4().hex}", type="function")
+            tool_call["function"]["name"] = tool_name
+        yield ChatCompletionChunk.model_validate(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "stub",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": None,
+                        "delta": {"tool_calls": [tool_call]},
+                    }
+                ],
+            }
+        )
+
+
+class StubCompletions:
+    """Stands in for ``client.chat.completions``, counts upstream calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.tool_arguments: dict[str, Any] = {}
+        self.delay = 0.0
+        # plain completions reply with this, or a numbered reply
+        self.content: str | None = None
+
+    async def create(self, **kwargs: Any) -> ChatCompletion:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if kwargs.get("stream"):
+            return stream_tool_call(  # type: ignore
+                self.tool_arguments,
+                kwargs["tools"][0]["function"]["name"],
+            )
+        if kwargs.get("tools"):
+            return make_completion(
+                tool_arguments=self.tool_arguments,
+                tool_name=kwargs["tools"][0]["function"]["name"],
+            )
+        return make_completion(
+            content=self.content or f"reply {self.calls}"
+        )
+
+
+@pytest.fixture
+def stub_completions() -> StubCompletions:
+    return StubCompletions()
+
+
+@pytest.fixture
+def stub_client(stub_completions: StubCompletions) -> AsyncOpenAI:
+    """A real client object whose completions never leave the process."""
+    client = AsyncOpenAI(api_key="sk-test")
+    client.chat.completions.create = stub_completions.create  # type: ignore
+    return client
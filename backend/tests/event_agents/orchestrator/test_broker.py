@@ -0,0 +1,451 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.orchestrator.broker import Broker, Route
+from app.event_agents.orchestrator.commands import (
+    GenerateEvaluationsCommand,
+    GeneratePerspectivesCommand,
+)
+from app.event_agents.orchestrator.events import (
+    AnswerReceivedEvent,
+    ErrorEvent,
+    MessageReceivedEvent,
+)
+from app.event_agents.orchestrator.policies import DispatchPolicy
+from app.types.websocket_types import (
+    WebsocketFrame,
+    WebsocketFrameBatch,
+)
+
+
+def make_frame(content: str) -> WebsocketFrame:
+    return Dispatcher.package_and_transform_to_webframe(
+        content,  # type: ignore
+        "notification",
+        frame_id=str(uuid4()),
+    )
+
+
+@pytest_asyncio.fixture
+async def broker():  # type: ignore
+    broker = Broker()
+    await broker.start()
+    yield broker
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block_other_events(
+    broker: Broker,
+) -> None:
+    release = asyncio.Event()
+    delivered: list[str] = []
+
+    async def slow_evaluations(
+        event: GenerateEvaluationsCommand,
+    ) -> None:
+        await release.wait()
+        delivered.append("evaluations")
+
+    async def send_frame(event: WebsocketFrame) -> None:
+        delivered.append(event.frame.content or "")
+
+    await broker.subscribe(GenerateEvaluationsCommand, slow_evaluations)
+    await broker.subscribe(WebsocketFrame, send_frame)
+
+    await broker.publish(GenerateEvaluationsCommand(questions=[]))
+    await broker.publish(make_frame("next question"))
+    await asyncio.sleep(0.01)
+
+    assert delivered == ["next question"]
+
+    release.set()
+    await broker.join()
+    assert delivered == ["next question", "evaluations"]
+
+
+@pytest.mark.asyncio
+async def test_ordered_type_keeps_publish_order(broker: Broker) -> None:
+    delivered: list[str] = []
+
+    async def send_frame(event: WebsocketFrame) -> None:
+        # later frames finish faster, ordering must still hold
+        await asyncio.sleep(0.001 * (5 - len(delivered)))
+        delivered.append(event.frame.content or "")
+
+    await broker.subscribe(WebsocketFrame, send_frame)
+    for i in range(5):
+        await broker.publish(make_frame(str(i)))
+    await broker.join()
+
+    assert delivered == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_is_respected() -> None:
+    broker = Broker(
+        dispatch_policies={
+            GenerateEvaluationsCommand: DispatchPolicy(
+                max_concurrency=2
+            )
+        }
+    )
+    await broker.start()
+    running = 0
+    peak = 0
+
+    async def evaluate(event: GenerateEvaluationsCommand) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+
+    await broker.subscribe(GenerateEvaluationsCommand, evaluate)
+    for _ in range(6):
+        await broker.publish(GenerateEvaluationsCommand(questions=[]))
+    await broker.join()
+    await broker.stop()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_kill_consumer(
+    broker: Broker,
+) -> None:
+    received: list[str] = []
+
+    async def explode(event: ErrorEvent) -> None:
+        raise RuntimeError("boom")
+
+    async def record(event: MessageReceivedEvent) -> None:
+        received.append(event.message)
+
+    await broker.subscribe(ErrorEvent, explode)
+    await broker.subscribe(MessageReceivedEvent, record)
+
+    await broker.publish(ErrorEvent(error="x", interview_id=uuid4()))
+    await broker.publish(
+        MessageReceivedEvent(message="hello", interview_id=uuid4())
+    )
+    await broker.join()
+
+    assert received == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_failed_events_are_dead_lettered_and_replayed(
+    broker: Broker,
+) -> None:
+    attempts: list[str] = []
+    others: list[str] = []
+
+    async def flaky(event: ErrorEvent) -> None:
+        attempts.append(event.error)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+
+    async def steady(event: ErrorEvent) -> None:
+        others.append(event.error)
+
+    await broker.subscribe(ErrorEvent, flaky)
+    await broker.subscribe(ErrorEvent, steady)
+
+    await broker.publish(ErrorEvent(error="x", interview_id=uuid4()))
+    await broker.join()
+
+    assert others == ["x"]
+    [letter] = broker.dead_letters()
+    assert letter.error == "boom"
+    assert letter.error_type == "RuntimeError"
+    assert letter.handler_name.endswith("flaky")
+
+    assert await broker.replay_dead_letters() == 1
+    # only the failed handler runs again
+    assert attempts == ["x", "x"]
+    assert others == ["x"]
+    assert broker.dead_letters() == []
+
+
+@pytest.mark.asyncio
+async def test_hung_handler_times_out_without_stalling_ordered_lane(
+    broker: Broker,
+) -> None:
+    delivered: list[str] = []
+
+    async def send_frame(event: WebsocketFrame) -> None:
+        if event.frame.content == "hang":
+            await asyncio.Event().wait()
+        delivered.append(event.frame.content or "")
+
+    await broker.subscribe(WebsocketFrame, send_frame, timeout=0.05)
+    await broker.publish(make_frame("hang"))
+    await broker.publish(make_frame("after"))
+    await asyncio.wait_for(broker.join(), timeout=1)
+
+    assert delivered == ["after"]
+    [letter] = broker.dead_letters()
+    assert letter.timed_out
+    latencies = broker.handler_latencies()
+    [(name, histogram)] = latencies.items()
+    assert name.endswith("send_frame")
+    assert histogram["count"] == 2
+    assert histogram["timeouts"] == 1
+    assert histogram["max_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_buffer_is_bounded() -> None:
+    broker = Broker(dead_letter_capacity=3)
+    await broker.start()
+
+    async def explode(event: ErrorEvent) -> None:
+        raise RuntimeError(event.error)
+
+    await broker.subscribe(ErrorEvent, explode)
+    for i in range(10):
+        await broker.publish(
+            ErrorEvent(error=str(i), interview_id=uuid4())
+        )
+    await broker.join()
+    await broker.stop()
+
+    assert [letter.error for letter in broker.dead_letters()] == [
+        "7",
+        "8",
+        "9",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_frame_bursts_are_delivered_as_one_batch(
+    broker: Broker,
+) -> None:
+    deliveries: list[list[str]] = []
+
+    async def send_frame(event: WebsocketFrame) -> None:
+        deliveries.append([event.frame.content or ""])
+
+    async def send_batch(event: WebsocketFrameBatch) -> None:
+        deliveries.append(
+            [frame.frame.content or "" for frame in event.frames]
+        )
+
+    await broker.subscribe(WebsocketFrame, send_frame)
+    await broker.subscribe(
+        WebsocketFrameBatch, send_batch, replaces=send_frame
+    )
+
+    for i in range(20):
+        await broker.publish(make_frame(str(i)))
+    await broker.join()
+
+    # split at the policy's batch_max, order kept across batches
+    assert deliveries == [
+        [str(i) for i in range(16)],
+        [str(i) for i in range(16, 20)],
+    ]
+
+    await broker.publish(make_frame("alone"))
+    await broker.join()
+    assert deliveries[-1] == ["alone"]
+
+
+@pytest.mark.asyncio
+async def test_batching_keeps_other_frame_subscribers_fed(
+    broker: Broker,
+) -> None:
+    frames: list[str] = []
+    everything: list[object] = []
+
+    async def log_frame(event: WebsocketFrame) -> None:
+        frames.append(event.frame.content or "")
+
+    async def on_anything(event: object) -> None:
+        everything.append(event)
+
+    # a wildcard subscriber alone does not turn batching on
+    await broker.subscribe(WebsocketFrame, log_frame)
+    await broker.subscribe("*", on_anything)
+    for i in range(3):
+        await broker.publish(make_frame(str(i)))
+    await broker.join()
+    assert frames == ["0", "1", "2"]
+    assert len(everything) == 3
+
+    batches: list[int] = []
+
+    async def send_batch(event: WebsocketFrameBatch) -> None:
+        batches.append(len(event.frames))
+
+    await broker.subscribe(WebsocketFrameBatch, send_batch)
+    for i in range(3, 6):
+        await broker.publish(make_frame(str(i)))
+    await broker.join()
+    assert batches == [3]
+    assert frames == [str(i) for i in range(6)]
+    assert all(isinstance(e, WebsocketFrame) for e in everything)
+    assert len(everything) == 6
+
+
+@pytest.mark.asyncio
+async def test_lone_frames_are_not_delayed() -> None:
+    broker = Broker(
+        dispatch_policies={
+            WebsocketFrame: DispatchPolicy(
+                ordered=True,
+                batch_type=WebsocketFrameBatch,
+                batch_max=16,
+                batch_window=60,
+            )
+        }
+    )
+    await broker.start()
+    sent: list[str] = []
+
+    async def send_frame(event: WebsocketFrame) -> None:
+        sent.append(event.frame.content or "")
+
+    async def send_batch(event: WebsocketFrameBatch) -> None:
+        sent.extend(frame.frame.content or "" for frame in event.frames)
+
+    await broker.subscribe(WebsocketFrame, send_frame)
+    await broker.subscribe(
+        WebsocketFrameBatch, send_batch, replaces=send_frame
+    )
+    await broker.publish(make_frame("alone"))
+    await asyncio.wait_for(broker.join(), timeout=1)
+    assert sent == ["alone"]
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_subclass_events_reach_base_class_subscribers(
+    broker: Broker,
+) -> None:
+    received: list[str] = []
+
+    async def on_message(event: MessageReceivedEvent) -> None:
+        received.append(type(event).__name__)
+
+    await broker.subscribe(MessageReceivedEvent, on_message)
+    await broker.publish(
+        AnswerReceivedEvent(
+            message="answer",
+            interview_id=uuid4(),
+            question={
+                "question": "q",
+                "sample_answer": "a",
+                "options": "o",
+            },
+        )
+    )
+    await broker.join()
+
+    assert received == ["AnswerReceivedEvent"]
+
+
+@pytest.mark.asyncio
+async def test_wildcard_subscribers_do_not_accumulate(
+    broker: Broker,
+) -> None:
+    calls = 0
+
+    async def on_error(event: ErrorEvent) -> None:
+        nonlocal calls
+        calls += 1
+
+    async def on_anything(event: object) -> None:
+        nonlocal calls
+        calls += 1
+
+    await broker.subscribe(ErrorEvent, on_error)
+    await broker.subscribe("*", on_anything)
+
+    for _ in range(50):
+        await broker.publish(
+            ErrorEvent(error="x", interview_id=uuid4())
+        )
+    await broker.join()
+
+    assert calls == 100
+    assert broker._route_for(ErrorEvent).handlers == (
+        on_error,
+        on_anything,
+    )
+
+    await broker.unsubscribe("*", on_anything)
+    assert broker._route_for(ErrorEvent).handlers == (on_error,)
+
+
+@pytest.mark.asyncio
+async def test_routes_are_built_once_and_reused() -> None:
+    broker = Broker()
+    builds: list[type] = []
+    build_route = broker._build_route
+
+    def counting_build_route(event_class: type) -> Route:
+        builds.append(event_class)
+        return build_route(event_class)
+
+    broker._build_route = counting_build_route  # type: ignore[method-assign]
+
+    async def on_error(event: object) -> None:
+        return None
+
+    async def on_anything(event: object) -> None:
+        return None
+
+    await broker.subscribe(ErrorEvent, on_error)
+    event = ErrorEvent(error="x", interview_id=uuid4())
+    for _ in range(100):
+        broker._dispatch(event)
+    await broker.join()
+    assert builds == [ErrorEvent]
+
+    # a subscription rebuilds the routes seen so far, once
+    await broker.subscribe("*", on_anything)
+    assert builds == [ErrorEvent, ErrorEvent]
+    for _ in range(100):
+        broker._dispatch(event)
+    await broker.join()
+    assert builds == [ErrorEvent, ErrorEvent]
+    assert broker._route_for(ErrorEvent).handlers == (
+        on_error,
+        on_anything,
+    )
+
+
+@pytest.mark.asyncio
+async def test_control_lane_is_served_before_background() -> None:
+    broker = Broker()
+    delivered: list[str] = []
+
+    async def on_frame(event: WebsocketFrame) -> None:
+        delivered.append("frame")
+
+    async def on_perspectives(
+        event: GeneratePerspectivesCommand,
+    ) -> None:
+        delivered.append("perspectives")
+
+    await broker.subscribe(WebsocketFrame, on_frame)
+    await broker.subscribe(GeneratePerspectivesCommand, on_perspectives)
+
+    # queue up before the consumer starts so priority decides the order
+    await broker.publish(GeneratePerspectivesCommand(questions=[]))
+    await broker.publish(make_frame("notification"))
+    await broker.start()
+    await broker.join()
+    await broker.stop()
+
+    assert delivered == ["frame", "perspectives"]
+    metrics = broker.queue_metrics()
+    assert metrics["control"].enqueued == 1
+    assert metrics["background"].enqueued == 1
+    assert metrics["control"].depth == 0
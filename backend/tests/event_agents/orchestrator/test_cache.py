@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+from app.event_agents.orchestrator.cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+from app.event_agents.orchestrator.thinker import Thinker
+
+from tests.event_agents.orchestrator.conftest import StubCompletions
+
+
+class Rubric(BaseModel):
+    criteria: list[str]
+
+
+def messages() -> list[dict[str, str]]:
+    return [{"role": "user", "content": "Analyze this job description"}]
+
+
+@pytest.mark.asyncio
+async def test_generate_is_served_from_cache(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    cache = ResponseCache()
+    thinker = Thinker(client=stub_client, cache=cache)
+
+    first = await thinker.generate(messages(), use_cache=True)
+    second = await thinker.generate(messages(), use_cache=True)
+
+    assert stub_completions.calls == 1
+    assert second == first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.prompt_tokens_saved == 100
+    assert stats.completion_tokens_saved == 20
+
+
+@pytest.mark.asyncio
+async def test_cache_key_covers_max_tokens_and_opt_out(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    thinker = Thinker(client=stub_client, cache=ResponseCache())
+
+    await thinker.generate(messages(), use_cache=True)
+    await thinker.generate(messages(), max_tokens=50, use_cache=True)
+    await thinker.generate(messages(), use_cache=False)
+
+    assert stub_completions.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_structured_response_is_served_from_cache(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.tool_arguments = {"criteria": ["clarity", "depth"]}
+    cache = ResponseCache()
+    thinker = Thinker(client=stub_client, cache=cache)
+
+    first = await thinker.extract_structured_response(
+        Rubric, messages(), use_cache=True
+    )
+    second = await thinker.extract_structured_response(
+        Rubric, messages(), use_cache=True
+    )
+
+    assert stub_completions.calls == 1
+    assert isinstance(second, Rubric)
+    assert second.model_dump() == first.model_dump()
+    assert second.criteria == ["clarity", "depth"]
+    assert cache.stats().prompt_tokens_saved == 100
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_lru_and_expires() -> None:
+    backend = MemoryCacheBackend(maxsize=2, ttl=None)
+    await backend.set("a", {"value": 1})
+    await backend.set("b", {"value": 2})
+    await backend.get("a")
+    await backend.set("c", {"value": 3})
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == {"value": 1}
+
+    expiring = MemoryCacheBackend(ttl=0)
+    await expiring.set("a", {"value": 1})
+    assert await expiring.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_backend_survives_a_new_instance(
+    tmp_path: Path,
+) -> None:
+    await DiskCacheBackend(tmp_path).set("ab12", {"value": "x"})
+
+    assert await DiskCacheBackend(tmp_path).get("ab12") == {
+        "value": "x"
+    }
+    assert await DiskCacheBackend(tmp_path, ttl=-1).get("ab12") is None
@@ -0,0 +1,172 @@
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.orchestrator.broker import Broker
+from app.event_agents.orchestrator.commands import (
+    CommandBase,
+    GenerateEvaluationsCommand,
+)
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    BaseEvent,
+    EvaluationsGeneratedEvent,
+)
+from app.types.interview_concept_types import QuestionAndAnswer
+from app.types.websocket_types import WebsocketFrame
+
+CHAINS = 300
+
+Build = Callable[..., Any]
+
+
+def validated(event_type: type[BaseEvent | CommandBase]) -> Build:
+    """Construction as it was before the fast path existed."""
+    if not issubclass(event_type, BaseEvent):
+        return event_type
+
+    def build(**data: Any) -> BaseEvent:
+        return event_type(
+            event_id=uuid4(),
+            timestamp=int(datetime.now().timestamp()),
+            correlation_id=uuid4(),
+            **data,
+        )
+
+    return build
+
+
+def internal(event_type: type[BaseEvent | CommandBase]) -> Build:
+    return event_type.internal
+
+
+def test_internal_event_matches_validated_event() -> None:
+    interview_id = uuid4()
+    frame = Dispatcher.package_and_transform_to_webframe(
+        "answer",  # type: ignore
+        "content",
+        frame_id=str(uuid4()),
+    )
+
+    event = AddToMemoryEvent.internal(
+        frame=frame, interview_id=interview_id
+    )
+
+    assert isinstance(event.event_id, UUID)
+    assert event.event_id != event.correlation_id
+    assert event.event_id.version == 4
+    assert AddToMemoryEvent.model_validate(event.model_dump()) == event
+
+
+class RejectingValidator:
+    """Stands in for a model's pydantic validator, fails if used."""
+
+    def validate_python(self, *args: Any, **kwargs: Any) -> None:
+        raise AssertionError("validated")
+
+
+def test_internal_event_skips_validation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frame = Dispatcher.package_and_transform_to_webframe(
+        "answer",  # type: ignore
+        "content",
+        frame_id=str(uuid4()),
+    )
+    interview_id = uuid4()
+    expected = validated(AddToMemoryEvent)(
+        frame=frame, interview_id=interview_id
+    )
+    monkeypatch.setattr(
+        AddToMemoryEvent, "__pydantic_validator__", RejectingValidator()
+    )
+    with pytest.raises(AssertionError):
+        validated(AddToMemoryEvent)(
+            frame=frame, interview_id=interview_id
+        )
+
+    event = AddToMemoryEvent.internal(
+        frame=frame,
+        interview_id=interview_id,
+        event_id=expected.event_id,
+        timestamp=expected.timestamp,
+        correlation_id=expected.correlation_id,
+    )
+
+    assert event == expected
+    assert event.model_fields_set == expected.model_fields_set
+
+
+async def run_chain(build: Callable[[type], Build]) -> None:
+    """
+    Run events through answer -> evaluate -> publish.
+
+    Mirrors the interview loop: the answer is added to memory, that
+    issues an evaluation command, its result is published as an event
+    and each evaluation frame is sent out.
+    """
+    broker = Broker()
+    await broker.start()
+    interview_id = uuid4()
+    question = QuestionAndAnswer(
+        question="Why?", sample_answer="", options=""
+    )
+    frame = Dispatcher.package_and_transform_to_webframe(
+        "answer",  # type: ignore
+        "content",
+        frame_id=str(uuid4()),
+    )
+    sent = 0
+
+    async def process_answer(event: AddToMemoryEvent) -> None:
+        await broker.publish(
+            build(GenerateEvaluationsCommand)(questions=[question])
+        )
+
+    async def evaluate(event: GenerateEvaluationsCommand) -> None:
+        await broker.publish(
+            build(EvaluationsGeneratedEvent)(
+                evaluations=[frame, frame],
+                interview_id=interview_id,
+            )
+        )
+
+    async def publish_evaluations(
+        event: EvaluationsGeneratedEvent,
+    ) -> None:
+        for evaluation in event.evaluations:
+            await broker.publish(evaluation)
+
+    async def send(event: WebsocketFrame) -> None:
+        nonlocal sent
+        sent += 1
+
+    await broker.subscribe(AddToMemoryEvent, process_answer)
+    await broker.subscribe(GenerateEvaluationsCommand, evaluate)
+    await broker.subscribe(
+        EvaluationsGeneratedEvent, publish_evaluations
+    )
+    await broker.subscribe(WebsocketFrame, send)
+
+    for _ in range(CHAINS):
+        await broker.publish(
+            build(AddToMemoryEvent)(
+                frame=frame, interview_id=interview_id
+            )
+        )
+    await broker.join()
+    await broker.stop()
+
+    # two evaluation frames sent out per answer
+    assert sent == 2 * CHAINS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("build", [validated, internal])
+async def test_answer_chain_delivers_every_event(
+    build: Callable[[type], Build],
+) -> None:
+    await run_chain(build)
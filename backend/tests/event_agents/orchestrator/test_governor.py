@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from app.event_agents.orchestrator.governor import (
+    LLMGovernor,
+    LLMPriority,
+    TokenBucket,
+)
+
+
+async def hold(
+    governor: LLMGovernor,
+    order: list[str],
+    name: str,
+    priority: LLMPriority,
+    session_id: str = "a",
+    tokens: int = 10,
+) -> None:
+    async with governor.slot(priority, session_id, tokens):
+        order.append(name)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_is_served_first() -> None:
+    governor = LLMGovernor(max_concurrency=1)
+    order: list[str] = []
+
+    async with governor.slot(LLMPriority.SETUP):
+        tasks = [
+            asyncio.create_task(hold(governor, order, name, priority))
+            for name, priority in [
+                ("perspective", LLMPriority.PERSPECTIVE),
+                ("evaluation", LLMPriority.EVALUATION),
+                ("question", LLMPriority.QUESTION),
+            ]
+        ]
+        await asyncio.sleep(0)
+        assert governor.queued() == 3
+
+    await asyncio.gather(*tasks)
+    assert order == ["question", "evaluation", "perspective"]
+
+
+@pytest.mark.asyncio
+async def test_interviews_are_interleaved_within_a_priority() -> None:
+    governor = LLMGovernor(max_concurrency=1)
+    order: list[str] = []
+
+    async with governor.slot(LLMPriority.EVALUATION):
+        # one interview fans out four evaluators before another asks
+        tasks = [
+            asyncio.create_task(
+                hold(
+                    governor,
+                    order,
+                    f"a{index}",
+                    LLMPriority.EVALUATION,
+                    "a",
+                )
+            )
+            for index in range(4)
+        ]
+        tasks += [
+            asyncio.create_task(
+                hold(
+                    governor,
+                    order,
+                    f"b{index}",
+                    LLMPriority.EVALUATION,
+                    "b",
+                )
+            )
+            for index in range(2)
+        ]
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order[:4] == ["a0", "b0", "a1", "b1"]
+
+
+@pytest.mark.asyncio
+async def test_weight_gives_a_larger_share() -> None:
+    governor = LLMGovernor(max_concurrency=1)
+    governor.set_weight("b", 2)
+    order: list[str] = []
+
+    async with governor.slot(LLMPriority.EVALUATION):
+        tasks = [
+            asyncio.create_task(
+                hold(
+                    governor,
+                    order,
+                    f"{session}{index}",
+                    LLMPriority.EVALUATION,
+                    session,
+                )
+            )
+            for session in "ab"
+            for index in range(4)
+        ]
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order[:3] == ["b0", "a0", "b1"]
+
+
+@pytest.mark.asyncio
+async def test_request_budget_delays_and_wait_is_recorded() -> None:
+    # 60 requests per minute is one per second, the bucket starts full
+    governor = LLMGovernor(requests_per_minute=60, max_concurrency=10)
+    governor._requests.level = 1
+
+    async with governor.slot(LLMPriority.QUESTION):
+        pass
+    governor._requests.rate = 100  # refill within 10ms for the test
+    async with governor.slot(LLMPriority.QUESTION):
+        pass
+
+    wait = governor.stats()["priorities"]["question"]["wait"]
+    assert wait["count"] == 2
+    assert wait["max_ms"] > 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place() -> None:
+    governor = LLMGovernor(max_concurrency=1)
+    order: list[str] = []
+
+    async with governor.slot(LLMPriority.SETUP):
+        cancelled = asyncio.create_task(
+            hold(governor, order, "cancelled", LLMPriority.QUESTION)
+        )
+        waiting = asyncio.create_task(
+            hold(governor, order, "waiting", LLMPriority.PERSPECTIVE)
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+    await waiting
+    assert order == ["waiting"]
+    assert governor.stats()["active"] == 0
+
+
+def test_token_bucket_settles_debt() -> None:
+    bucket = TokenBucket(per_minute=600)
+    bucket.take(700)
+
+    assert bucket.delay_for(100) == pytest.approx(20, abs=0.1)
+    assert bucket.delay_for(10_000) == pytest.approx(70, abs=0.1)
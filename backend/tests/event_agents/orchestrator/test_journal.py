@@ -0,0 +1,179 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.conversations.tree import Tree
+from app.event_agents.conversations.types import ProbeDirection
+from app.event_agents.interview.replay import replay_interview
+from app.event_agents.orchestrator.broker import Broker
+from app.event_agents.orchestrator.events import (
+    AddToMemoryEvent,
+    AskQuestionEvent,
+    ErrorEvent,
+)
+from app.event_agents.orchestrator.journal import (
+    EventCodec,
+    SegmentFileJournal,
+)
+from app.types.interview_concept_types import QuestionAndAnswer
+from app.types.websocket_types import WebsocketFrame
+
+
+def make_frame(content: str) -> WebsocketFrame:
+    return Dispatcher.package_and_transform_to_webframe(
+        content,  # type: ignore
+        "content",
+        frame_id=str(uuid4()),
+    )
+
+
+def make_question(text: str) -> QuestionAndAnswer:
+    return QuestionAndAnswer(
+        question=text, sample_answer="", options=""
+    )
+
+
+@pytest.mark.asyncio
+async def test_records_round_trip_in_order(tmp_path: Path) -> None:
+    journal = SegmentFileJournal(tmp_path, segment_max_bytes=512)
+    session_id = uuid4()
+    events = [
+        ErrorEvent(error=str(i), interview_id=session_id)
+        for i in range(50)
+    ]
+    for event in events:
+        journal.append(session_id, event)
+
+    records = [record async for record in journal.read(session_id)]
+
+    assert [record.event for record in records] == events
+    assert [record.seq for record in records] == list(range(50))
+    assert len(journal.segments(session_id)) > 1
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_types_do_not_break_reads(
+    tmp_path: Path,
+) -> None:
+    session_id = uuid4()
+    first = ErrorEvent(error="first", interview_id=session_id)
+    second = ErrorEvent(error="second", interview_id=session_id)
+    # written by a process that journaled AskQuestionEvent
+    writer = SegmentFileJournal(tmp_path)
+    writer.append(session_id, first)
+    writer.append(
+        session_id,
+        AskQuestionEvent(
+            question=make_question("Why?"), interview_id=session_id
+        ),
+    )
+    writer.append(session_id, second)
+    await writer.close()
+
+    reader = SegmentFileJournal(
+        tmp_path, codec=EventCodec([ErrorEvent])
+    )
+    records = [record async for record in reader.read(session_id)]
+    assert [record.event for record in records] == [first, second]
+    assert [record.seq for record in records] == [0, 2]
+
+    # and unregistered events are not journaled in the first place
+    reader.append(
+        session_id,
+        AskQuestionEvent(
+            question=make_question("How?"), interview_id=session_id
+        ),
+    )
+    await reader.close()
+    assert (
+        len([record async for record in writer.read(session_id)]) == 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_replay_events(tmp_path: Path) -> None:
+    journal = SegmentFileJournal(tmp_path, segment_max_bytes=512)
+    session_id = uuid4()
+    question = AskQuestionEvent(
+        question=make_question("Why this role?"),
+        interview_id=session_id,
+    )
+    answer = AddToMemoryEvent(
+        frame=make_frame("Because"), interview_id=session_id
+    )
+    journal.append(session_id, question)
+    for _ in range(20):
+        journal.append(session_id, make_frame("notification"))
+    journal.append(session_id, answer)
+
+    assert await journal.compact(session_id) == 2
+    assert len(journal.segments(session_id)) == 1
+
+    records = [record async for record in journal.read(session_id)]
+    assert [record.event for record in records] == [question, answer]
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_journal_replays_interview_state(
+    tmp_path: Path,
+) -> None:
+    journal = SegmentFileJournal(tmp_path)
+    session_id = uuid4()
+    broker = Broker(session_id=session_id, journal=journal)
+    await broker.start()
+
+    first = make_question("Tell me about yourself")
+    second = make_question("What did you build last?")
+    # one turn at a time, as the interview loop publishes them
+    for event in (
+        AskQuestionEvent(
+            question=first,
+            interview_id=session_id,
+            direction=ProbeDirection.BROADER,
+        ),
+        AddToMemoryEvent(
+            frame=make_frame("I am an engineer"),
+            interview_id=session_id,
+        ),
+        AskQuestionEvent(
+            question=second,
+            interview_id=session_id,
+            direction=ProbeDirection.DEEPER,
+        ),
+    ):
+        await broker.publish(event)
+        await broker.join()
+    await broker.stop()
+
+    replayed = await replay_interview(journal, session_id)
+
+    assert replayed.asked_questions == [first, second]
+    assert replayed.current_question == second
+    assert replayed.awaiting_answer
+    assert [frame.frame.content for frame in replayed.memory] == [
+        first.question,
+        "I am an engineer",
+        second.question,
+    ]
+    assert [turn[0] for turn in replayed.turns] == [first]
+    assert replayed.turns[0][2] == ProbeDirection.BROADER
+    assert replayed.current_direction == ProbeDirection.DEEPER
+
+    tree = Tree(max_depth=4, max_breadth=6)
+    replayed.restore_tree(tree)
+    assert tree.root is not None
+    assert tree.root.question == first
+    assert tree.current_position is tree.root
+
+    # a restarted process reads the same state back from disk
+    reloaded = await replay_interview(
+        SegmentFileJournal(tmp_path), session_id
+    )
+    assert [frame.frame_id for frame in reloaded.memory] == [
+        frame.frame_id for frame in replayed.memory
+    ]
+    await journal.close()
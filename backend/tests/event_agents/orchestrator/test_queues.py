@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from app.event_agents.orchestrator.queues import (
+    EventQueue,
+    Lane,
+    LaneConfig,
+    OverflowPolicy,
+)
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_lanes_are_served_first() -> None:
+    queue: EventQueue[str] = EventQueue()
+    await queue.put("evaluation", lane=Lane.BACKGROUND)
+    await queue.put("question", lane=Lane.QUESTIONS)
+    await queue.put("frame", lane=Lane.CONTROL)
+
+    assert [await queue.get() for _ in range(3)] == [
+        "frame",
+        "question",
+        "evaluation",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_lane_bounded() -> None:
+    queue: EventQueue[int] = EventQueue(
+        {
+            Lane.BACKGROUND: LaneConfig(
+                maxsize=2, overflow=OverflowPolicy.DROP_OLDEST
+            )
+        }
+    )
+    for i in range(5):
+        await queue.put(i, lane=Lane.BACKGROUND, lossy=True)
+
+    assert queue.qsize() == 2
+    assert [queue.get_nowait(), queue.get_nowait()] == [3, 4]
+
+    metrics = queue.metrics()["background"]
+    assert metrics.dropped == 3
+    assert metrics.high_water == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_queued_item_with_same_key() -> None:
+    queue: EventQueue[str] = EventQueue(
+        {
+            Lane.BACKGROUND: LaneConfig(
+                maxsize=2, overflow=OverflowPolicy.COALESCE
+            )
+        }
+    )
+    await queue.put(
+        "a1", lane=Lane.BACKGROUND, coalesce_key="a", lossy=True
+    )
+    await queue.put(
+        "b1", lane=Lane.BACKGROUND, coalesce_key="b", lossy=True
+    )
+    await queue.put(
+        "a2", lane=Lane.BACKGROUND, coalesce_key="a", lossy=True
+    )
+
+    assert [queue.get_nowait(), queue.get_nowait()] == ["a2", "b1"]
+    assert queue.metrics()["background"].coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_only_lossy_items_are_dropped() -> None:
+    queue: EventQueue[str] = EventQueue(
+        {
+            Lane.BACKGROUND: LaneConfig(
+                maxsize=2, overflow=OverflowPolicy.DROP_OLDEST
+            )
+        }
+    )
+    await queue.put("command", lane=Lane.BACKGROUND)
+    await queue.put("progress 1", lane=Lane.BACKGROUND, lossy=True)
+    await queue.put("progress 2", lane=Lane.BACKGROUND, lossy=True)
+    # nothing lossy is left to drop, the command waits for space
+    blocked = asyncio.create_task(
+        queue.put("result", lane=Lane.BACKGROUND)
+    )
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    assert await queue.get() == "command"
+    await asyncio.wait_for(blocked, timeout=1)
+    assert [queue.get_nowait(), queue.get_nowait()] == [
+        "progress 2",
+        "result",
+    ]
+    assert queue.metrics()["background"].dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_space() -> None:
+    queue: EventQueue[int] = EventQueue(
+        {Lane.QUESTIONS: LaneConfig(maxsize=1)}
+    )
+    await queue.put(1)
+    blocked = asyncio.create_task(queue.put(2))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(blocked, timeout=1)
+    assert await queue.get() == 2
+    assert queue.metrics()["questions"].blocked == 1
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_put_overcommits() -> None:
+    queue: EventQueue[int] = EventQueue(
+        {Lane.QUESTIONS: LaneConfig(maxsize=1)}
+    )
+    await queue.put(1)
+    await queue.put(2, block=False)
+
+    assert queue.qsize() == 2
+    assert queue.metrics()["questions"].overcommitted == 1
+
+
+@pytest.mark.asyncio
+async def test_join_waits_for_task_done() -> None:
+    queue: EventQueue[int] = EventQueue()
+    await queue.put(1)
+    joined = asyncio.create_task(queue.join())
+    await asyncio.sleep(0)
+    assert not joined.done()
+
+    await queue.get()
+    queue.task_done()
+    await asyncio.wait_for(joined, timeout=1)
@@ -0,0 +1,86 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.event_agents.orchestrator.broker import Broker
+from app.event_agents.orchestrator.events import MessageReceivedEvent
+from app.event_agents.orchestrator.policies import DispatchPolicy
+from app.event_agents.orchestrator.runtime import BrokerRuntime
+
+# plain concurrent delivery, so the consumption order is observable
+UNORDERED: dict[type, DispatchPolicy] = {
+    MessageReceivedEvent: DispatchPolicy()
+}
+
+
+def message(text: str) -> MessageReceivedEvent:
+    return MessageReceivedEvent(message=text, interview_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_a_fixed_worker_pool() -> None:
+    runtime = BrokerRuntime(workers=2)
+    received: dict[int, list[str]] = {i: [] for i in range(10)}
+    brokers = []
+
+    for i in range(10):
+        broker = Broker(runtime=runtime, session_id=uuid4())
+
+        async def record(
+            event: MessageReceivedEvent, session: int = i
+        ) -> None:
+            received[session].append(event.message)
+
+        await broker.subscribe(MessageReceivedEvent, record)
+        await broker.start()
+        brokers.append(broker)
+
+    for broker in brokers:
+        for n in range(3):
+            await broker.publish(message(str(n)))
+    await asyncio.gather(*(broker.join() for broker in brokers))
+
+    assert all(
+        messages == ["0", "1", "2"] for messages in received.values()
+    )
+    assert len(runtime._tasks) == 2
+    assert sum(shard["sessions"] for shard in runtime.stats()) == 10
+
+    for broker in brokers:
+        await broker.stop()
+    assert sum(shard["sessions"] for shard in runtime.stats()) == 0
+    await runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_busy_session_does_not_starve_quiet_one() -> None:
+    runtime = BrokerRuntime(workers=1)
+    consumed: list[str] = []
+
+    async def record(event: MessageReceivedEvent) -> None:
+        consumed.append(event.message)
+
+    busy = Broker(
+        dispatch_policies=UNORDERED, runtime=runtime, session_id=uuid4()
+    )
+    quiet = Broker(
+        dispatch_policies=UNORDERED, runtime=runtime, session_id=uuid4()
+    )
+    for broker in (busy, quiet):
+        await broker.subscribe(MessageReceivedEvent, record)
+
+    for n in range(20):
+        await busy.publish(message(f"busy-{n}"))
+    await quiet.publish(message("quiet"))
+
+    await busy.start()
+    await quiet.start()
+    await asyncio.gather(busy.join(), quiet.join())
+
+    # round robin: the quiet session is served after one busy event
+    assert consumed.index("quiet") <= 2
+
+    await busy.stop()
+    await quiet.stop()
+    await runtime.shutdown()
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+from app.event_agents.orchestrator.cache import ResponseCache
+from app.event_agents.orchestrator.single_flight import SingleFlight
+from app.event_agents.orchestrator.thinker import Thinker
+
+from tests.event_agents.orchestrator.conftest import StubCompletions
+
+
+class QuestionBank(BaseModel):
+    questions: list[str]
+
+
+def messages() -> list[dict[str, str]]:
+    return [{"role": "user", "content": "Analyze this job description"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_call(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.delay = 0.05
+    single_flight = SingleFlight()
+    thinker = Thinker(
+        client=stub_client,
+        cache=ResponseCache(),
+        single_flight=single_flight,
+    )
+
+    responses = await asyncio.gather(
+        *(
+            thinker.generate(messages(), use_cache=True)
+            for _ in range(5)
+        )
+    )
+
+    assert stub_completions.calls == 1
+    assert all(response == responses[0] for response in responses)
+    assert single_flight.stats().to_dict() == {"calls": 1, "joined": 4}
+    assert single_flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_structured_calls_share_one_upstream_call(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.delay = 0.05
+    stub_completions.tool_arguments = {"questions": ["why?"]}
+    thinker = Thinker(
+        client=stub_client,
+        cache=ResponseCache(),
+        single_flight=SingleFlight(),
+    )
+
+    banks = await asyncio.gather(
+        *(
+            thinker.extract_structured_response(
+                QuestionBank, messages(), use_cache=True
+            )
+            for _ in range(3)
+        )
+    )
+
+    assert stub_completions.calls == 1
+    assert [bank.questions for bank in banks] == [["why?"]] * 3
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter_and_releases_the_key() -> (
+    None
+):
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def failing() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        single_flight.run("k", failing),
+        single_flight.run("k", failing),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await single_flight.run("k", failing)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_others() -> None:
+    single_flight = SingleFlight()
+
+    async def slow() -> str:
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(single_flight.run("k", slow))
+    second = asyncio.create_task(single_flight.run("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_once_every_caller_left() -> None:
+    single_flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    callers = [
+        asyncio.create_task(single_flight.run("k", slow))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    callers[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert single_flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_its_own_result() -> None:
+    single_flight = SingleFlight()
+
+    async def bank() -> QuestionBank:
+        await asyncio.sleep(0.01)
+        return QuestionBank(questions=["why?"])
+
+    first, second = await asyncio.gather(
+        single_flight.run("k", bank), single_flight.run("k", bank)
+    )
+    first.questions.append("how?")
+
+    assert second.questions == ["why?"]
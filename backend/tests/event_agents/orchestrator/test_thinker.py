@@ -0,0 +1,245 @@
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncIterator, cast
+
+import instructor
+import pytest
+from openai import AsyncOpenAI
+from pydantic import BaseModel, Field, ValidationError
+
+from app.agents.dispatcher import Dispatcher
+from app.event_agents.orchestrator.cache import ResponseCache
+from app.event_agents.orchestrator.governor import LLMGovernor
+from app.event_agents.orchestrator import thinker as thinker_module
+from app.event_agents.orchestrator.thinker import (
+    Thinker,
+    get_thinker,
+    structured_client,
+    structured_model,
+)
+
+from app.types.interview_concept_types import QuestionAndAnswer
+
+from tests.event_agents.orchestrator.conftest import StubCompletions
+
+
+class Criterion(BaseModel):
+    name: str = Field(description="What is assessed")
+    scale: list[str] = Field(description="The 1-5 rating scale")
+
+
+class Rubric(BaseModel):
+    """Rating rubric extracted from a job description."""
+
+    ratings: list[Criterion]
+
+
+RUBRIC = {"ratings": [{"name": "depth", "scale": ["1", "2", "3"]}]}
+
+
+def messages() -> list[dict[str, str]]:
+    return [{"role": "user", "content": "Extract the rubric"}]
+
+
+def unlimited() -> LLMGovernor:
+    return LLMGovernor(
+        requests_per_minute=10**9,
+        tokens_per_minute=10**12,
+        max_concurrency=10**6,
+    )
+
+
+def test_structured_model_and_client_are_built_once(
+    stub_client: AsyncOpenAI,
+) -> None:
+    assert structured_model(Rubric) is structured_model(Rubric)
+    assert structured_client(stub_client) is structured_client(
+        stub_client
+    )
+    assert get_thinker() is get_thinker()
+    assert (
+        structured_model(Rubric).openai_schema
+        == instructor.openai_schema(Rubric).openai_schema
+    )
+
+
+@pytest.mark.asyncio
+async def test_prepared_model_extracts_the_same_result(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.tool_arguments = RUBRIC
+    thinker = Thinker(client=stub_client, governor=unlimited())
+
+    rubric = await thinker.extract_structured_response(
+        Rubric, messages(), use_cache=False
+    )
+
+    assert isinstance(rubric, Rubric)
+    assert rubric.model_dump() == RUBRIC
+
+
+@pytest.mark.asyncio
+async def test_instructor_sends_the_precomputed_definition(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    class Note(BaseModel):
+        """A note."""
+
+        text: str
+
+    sent: list[dict[str, object]] = []
+
+    async def create(**kwargs: object) -> object:
+        sent.append(kwargs["tools"][0]["function"])  # type: ignore
+        return await stub_completions.create(**kwargs)
+
+    stub_client.chat.completions.create = create  # type: ignore
+    stub_completions.tool_arguments = {"text": "hi"}
+    # fails if instructor stops using the prepared model's definition
+    # and rebuilds it from the model, eg after an upgrade
+    structured_model(Note).openai_schema["description"] = "prepared"
+    thinker = Thinker(client=stub_client, governor=unlimited())
+
+    await thinker.extract_structured_response(Note, messages())
+
+    assert sent[0]["description"] == "prepared"
+
+
+@pytest.mark.asyncio
+async def test_client_and_schema_are_prepared_once_across_calls(
+    stub_client: AsyncOpenAI,
+    stub_completions: StubCompletions,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Scorecard(BaseModel):
+        """A fresh model, so no earlier test has prepared it."""
+
+        ratings: list[Criterion]
+
+    patched: list[AsyncOpenAI] = []
+    prepared: list[type[BaseModel]] = []
+
+    def from_openai(client: AsyncOpenAI) -> instructor.AsyncInstructor:
+        patched.append(client)
+        return real_from_openai(client)
+
+    def prepare(model: type[BaseModel]) -> type[BaseModel]:
+        prepared.append(model)
+        return real_openai_schema(model)  # type: ignore[no-any-return]
+
+    real_from_openai = instructor.from_openai
+    real_openai_schema = instructor.openai_schema
+    monkeypatch.setattr(instructor, "from_openai", from_openai)
+    monkeypatch.setattr(thinker_module, "openai_schema", prepare)
+    stub_completions.tool_arguments = RUBRIC
+    thinker = Thinker(client=stub_client, governor=unlimited())
+
+    for _ in range(3):
+        await thinker.extract_structured_response(
+            Scorecard, messages(), use_cache=False
+        )
+
+    assert patched == [stub_client]
+    assert prepared == [Scorecard]
+    assert stub_completions.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_partials_then_the_full_structure(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.tool_arguments = {
+        "question": "Tell me about a system you designed.",
+        "sample_answer": "",
+        "options": "",
+    }
+    cache = ResponseCache()
+    thinker = Thinker(
+        client=stub_client, cache=cache, governor=unlimited()
+    )
+
+    stream = thinker.stream_structured_response(
+        QuestionAndAnswer, messages(), use_cache=True
+    )
+    async with aclosing(stream):
+        questions = [partial.question async for partial in stream]
+
+    assert len(questions) > 2
+    assert questions[-1] == "Tell me about a system you designed."
+    growing = [text for text in questions if text]
+    assert all(
+        later.startswith(earlier)
+        for earlier, later in zip(growing, growing[1:])
+    )
+
+    # the final structure is cached for the non-streaming path too
+    cached = await thinker.extract_structured_response(
+        QuestionAndAnswer, messages(), use_cache=True
+    )
+    assert cached.question == questions[-1]
+    assert stub_completions.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_early_releases_its_slot(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.tool_arguments = RUBRIC
+    governor = LLMGovernor(
+        requests_per_minute=10**9,
+        tokens_per_minute=10**12,
+        max_concurrency=1,
+    )
+    thinker = Thinker(client=stub_client, governor=governor)
+
+    stream = thinker.stream_structured_response(Rubric, messages())
+    async with aclosing(stream):
+        async for _ in stream:
+            break
+
+    rubric = await asyncio.wait_for(
+        thinker.extract_structured_response(Rubric, messages()),
+        timeout=1,
+    )
+    assert rubric.model_dump() == RUBRIC
+
+
+@pytest.mark.asyncio
+async def test_cut_off_stream_is_not_taken_as_the_full_structure(
+    stub_client: AsyncOpenAI, stub_completions: StubCompletions
+) -> None:
+    stub_completions.tool_arguments = RUBRIC
+
+    async def cut_off(**kwargs: Any) -> AsyncIterator[Any]:
+        stream = cast(
+            AsyncIterator[Any], await stub_completions.create(**kwargs)
+        )
+        chunks = [chunk async for chunk in stream]
+
+        async def replay() -> AsyncIterator[Any]:
+            for chunk in chunks[:-1]:
+                yield chunk
+
+        return replay()
+
+    stub_client.chat.completions.create = cut_off  # type: ignore
+    thinker = Thinker(client=stub_client, governor=unlimited())
+
+    with pytest.raises(ValidationError):
+        async for _ in thinker.stream_structured_response(
+            Rubric, messages()
+        ):
+            pass
+
+
+def test_delta_frame_is_a_streaming_chunk() -> None:
+    frame = Dispatcher.package_delta_to_webframe(
+        "system", "Tell me about a system", "content", frame_id="f1"
+    )
+
+    assert frame.type == "streaming"
+    assert frame.frame_id == "f1"
+    assert frame.frame.delta == "system"
+    assert frame.frame.content == "Tell me about a system"
+    assert frame.frame.finish_reason is None
+    assert '"finishReason":null' in frame.model_dump_json(by_alias=True)
@@ -26,6 +26,12 @@ const createHumanInputFrame = (content: string): WebsocketFrame => {
   };
 };
 
+// an answer still being typed, so the interviewer can prepare early
+const createAnswerProgressFrame = (content: string): WebsocketFrame => {
+  const frame = createHumanInputFrame(content);
+  return { ...frame, frame: { ...frame.frame, finishReason: null } };
+};
+
 const tryParseJSON = (content: string | null) => {
   if (content === null) {
     return null;
@@ -37,4 +43,9 @@ const tryParseJSON = (content: string | null) => {
   }
 };
 
-export { tryParseJSON, createTimestamp, createHumanInputFrame };
+export {
+  tryParseJSON,
+  createTimestamp,
+  createHumanInputFrame,
+  createAnswerProgressFrame,
+};
@@ -13,8 +13,7 @@ export const CandidateSchema = z.object({
   updated_at: z.coerce.date(),
   name: z.string(),
   email: z.string().email(),
-  phone_number: z.string(),
-  memory: z.array(WebsocketFrameSchema)
+  phone_number: z.string()
 });
 
 export type Candidate = z.infer<typeof CandidateSchema>;
@@ -40,8 +39,7 @@ export const InterviewSessionSchema = z.object({
     InterviewSessionStatusEnum.CANCELLED
   ]),
   start_time: z.date().nullable(),
-  end_time: z.date().nullable(),
-  memory: z.array(WebsocketFrameSchema)
+  end_time: z.date().nullable()
 });
 
 export type InterviewSession = z.infer<typeof InterviewSessionSchema>;
@@ -1,14 +1,20 @@
-import { createHumanInputFrame } from "@/app/lib/helperFunctions";
+import {
+  createAnswerProgressFrame,
+  createHumanInputFrame,
+} from "@/app/lib/helperFunctions";
 import { useInput } from "../context/InputContext";
 import { useWebsocketContext } from "../context/WebsocketContext";
 import AudioRecorder from "./AudioRecorder";
 import TextareaResizable from "./TextAreaResizable";
 import { Button } from "@/components/ui/button";
 import { Send } from "lucide-react";
-import { FormEvent, useRef } from "react";
+import { FormEvent, useEffect, useRef } from "react";
 import clientLogger from "@/app/lib/clientLogger";
 import { TooltipProvider } from "@/components/ui/tooltip";
 
+// how long typing pauses before the answer so far is sent
+const ANSWER_PROGRESS_DELAY_MS = 1000;
+
 type UserInputProps = {
   maxTextareaHeight: number;
 };
@@ -20,6 +26,14 @@ const UserInputArea = ({ maxTextareaHeight }: UserInputProps) => {
     useInput();
   const textareaRef = useRef<HTMLTextAreaElement>(null);
 
+  useEffect(() => {
+    if (!inputValue.trim()) return;
+    const progressTimeout = setTimeout(() => {
+      sendMessage(createAnswerProgressFrame(inputValue));
+    }, ANSWER_PROGRESS_DELAY_MS);
+    return () => clearTimeout(progressTimeout);
+  }, [inputValue, sendMessage]);
+
   const handleSubmit = (e: FormEvent<Element>) => {
     e.preventDefault();
     if (!inputValue.trim()) return;
@@ -59,6 +59,13 @@ export class WebsocketEventHandler {
     }
     try {
       const parsedData = JSON.parse(event.data);
+      // the server coalesces bursts of frames into one batch message
+      if (parsedData?.type === "batch" && Array.isArray(parsedData.frames)) {
+        for (const frame of parsedData.frames) {
+          this.eventEmitter.emit("message", frame);
+        }
+        return;
+      }
       this.eventEmitter.emit("message", parsedData);
     } catch (error) {
       this.eventEmitter.emit(
@@ -54,6 +54,28 @@ class CompletionContentStrategy implements FrameStrategy {
   }
 }
 
+// schema for parsing streaming/content frames
+const StreamingContentSchema = WebsocketFrameSchema.extend({
+  type: z.literal("streaming"),
+  address: z.literal("content"),
+});
+
+class StreamingContentStrategy implements FrameStrategy {
+  canHandle(frame: WebsocketFrame): boolean {
+    try {
+      return StreamingContentSchema.safeParse(frame).success;
+    } catch (error) {
+      return false;
+    }
+  }
+  handleFrame(frame: WebsocketFrame): Action {
+    return {
+      type: "streaming/content",
+      payload: frame,
+    };
+  }
+}
+
 const InputContentSchema = WebsocketFrameSchema.extend({
   type: z.literal("input"),
   address: z.literal("human"),
@@ -89,6 +111,7 @@ export class WebsocketFrameHandler implements FrameHandler {
     this.dispatch = dispatch;
     this.strategies = [
       new CompletionContentStrategy(),
+      new StreamingContentStrategy(),
       new InputContentStrategy(),
     ];
   }
@@ -110,6 +110,15 @@ const useWebSocket = ({
         console.log("message received: ", event.data);
 
         const data = JSON.parse(event.data);
+
+        // the server coalesces bursts of frames into one batch message
+        if (data?.type === "batch" && Array.isArray(data.frames)) {
+          for (const frame of data.frames) {
+            frameHandler(WebsocketFrameSchema.parse(frame));
+          }
+          return;
+        }
+
         const websocketFrame = WebsocketFrameSchema.parse(data);
 
         // let the handler handle the frame
@@ -54,6 +54,48 @@ const messageFrameReducer = (
       return newFrameList;
     }
 
+    case "streaming/content": {
+      // a piece of a content frame that is still being generated, the
+      // completion frame with the same frameId replaces it at the end
+      const frameIndexToUpdate = frameList.findIndex(
+        (existingFrame) => existingFrame.frameId === frameId
+      );
+      const existingContent =
+        frameIndexToUpdate === -1
+          ? ""
+          : frameList[frameIndexToUpdate].contentFrame.content ?? "";
+      // content carries the text streamed so far, fall back to
+      // appending the delta when it is missing
+      const streamedFrame = {
+        ...incomingFrame,
+        content:
+          incomingFrame.content ?? existingContent + (incomingFrame.delta ?? ""),
+      } as CompletionFrameChunk;
+
+      if (frameIndexToUpdate === -1) {
+        return [
+          ...frameList,
+          {
+            frameId,
+            contentFrame: streamedFrame,
+            artifactFrames: [],
+            thoughtFrames: [],
+          } as FrameType,
+        ];
+      }
+
+      const updatedFrame = {
+        ...frameList[frameIndexToUpdate],
+        contentFrame: streamedFrame,
+      } as FrameType;
+
+      return [
+        ...frameList.slice(0, frameIndexToUpdate),
+        updatedFrame,
+        ...frameList.slice(frameIndexToUpdate + 1),
+      ];
+    }
+
     case "completion/thought": {
       //
       console.log("completion/thought action entered");
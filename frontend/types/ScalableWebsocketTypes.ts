@@ -71,7 +71,8 @@ export const CompletionFrameChunkSchema = z.object({
   createdTs: z.number().int().default(createTimestamp()), // unix timestamp
   title: z.string().nullable(),
   index: z.number(),
-  finishReason: z.enum(FinishReasonType),
+  // null while the completion is still streaming
+  finishReason: z.enum(FinishReasonType).nullable(),
   media: z.array(MediaContentSchema).optional(),
   notificationType: NotificationTypeEnum.optional(),
   severity: SeverityEnum.optional(),